@@ -0,0 +1,74 @@
+"""Server-Sent Events connections for clients that can't use WebSockets.
+
+An EventStreamConnection is held by the WebSocket manager like any socket,
+so SSE clients get the same broker fan-out, topics, presence, replay and
+bounded send queue; only the framing differs.
+"""
+
+import asyncio
+from typing import AsyncIterator, Optional, Tuple
+
+from starlette.websockets import WebSocketState
+
+# Client reconnect delay advertised to EventSource
+RETRY_MILLISECONDS = 3000
+
+
+class EventStreamConnection:
+    """One SSE response, implementing the manager's Connection protocol.
+
+    The manager's writer task hands over `sse` frames one at a time, so a
+    client that stops reading backs up into its send queue and is evicted
+    like a slow WebSocket. Event ids are `<stream>:<seq>`, letting the
+    browser's Last-Event-ID resume across reconnects.
+    """
+
+    def __init__(self, stream: str, heartbeat_seconds: float) -> None:
+        """Initialize connection for the organization's current replay stream."""
+        self.stream = stream
+        self.heartbeat_seconds = heartbeat_seconds
+        self.client_state = WebSocketState.CONNECTING
+        self._frames: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=1)
+
+    async def accept(self, subprotocol: Optional[str] = None) -> None:
+        """Mark the connection open (the response starts streaming on its own)."""
+        self.client_state = WebSocketState.CONNECTED
+
+    async def send_text(self, frame: str) -> None:
+        """Hand a frame to the response, waiting while the client reads the previous one."""
+        if frame.startswith("id: "):
+            frame = f"id: {self.stream}:{frame[4:]}"
+        await self._frames.put(frame)
+
+    async def send_bytes(self, data: bytes) -> None:
+        """SSE is text only; the manager never negotiates a binary format for it."""
+        raise TypeError("Event streams carry text frames only")
+
+    async def close(self, code: int = 1000, reason: Optional[str] = None) -> None:
+        """End the response (e.g. slow consumer eviction)."""
+        self.client_state = WebSocketState.DISCONNECTED
+        if self._frames.full():
+            # Closing anyway: the unread frame is dropped for the end marker
+            self._frames.get_nowait()
+        self._frames.put_nowait(None)
+
+    async def frames(self) -> AsyncIterator[str]:
+        """Response body: frames as they arrive, with keepalive comments in between."""
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+        while self.client_state != WebSocketState.DISCONNECTED:
+            try:
+                frame = await asyncio.wait_for(self._frames.get(), self.heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if frame is None:
+                break
+            yield frame
+
+
+def parse_event_id(event_id: Optional[str]) -> Optional[Tuple[str, int]]:
+    """(stream, seq) from a Last-Event-ID, or None when absent or malformed."""
+    stream, _, seq = (event_id or "").rpartition(":")
+    if not stream or not seq.isdigit():
+        return None
+    return stream, int(seq)
@@ -35,6 +35,7 @@ class OrganizationContextMiddleware(BaseHTTPMiddleware):
             "/billing/stripe-webhook",  # Stripe webhook (handles auth internally)
             "/invites/",  # All invite endpoints are public (get token info, accept, reject)
             "/ws/",  # WebSocket endpoints (handle auth internally)
+            "/events/stream",  # Server-Sent Events (handles auth internally, like /ws/)
         ]
 
         # 🔐 AUTH-ONLY ROUTES: Authentication required, no org validation
@@ -0,0 +1,29 @@
+"""Keyset pagination cursors.
+
+Opaque cursors encoding a (timestamp, id) position so pages stay stable
+when several rows share the same timestamp.
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(timestamp: datetime, entity_id: UUID) -> str:
+    """Encode a (timestamp, id) keyset position as an opaque URL-safe cursor."""
+    raw = f"{timestamp.isoformat()}|{entity_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode an opaque cursor back into its (timestamp, id) keyset position."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        timestamp_str, entity_id_str = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp_str), UUID(entity_id_str)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
@@ -0,0 +1,22 @@
+"""Fast JSON responses.
+
+Routers default to ORJSONResponse; hot list endpoints go one step further and
+return pydantic models already serialized to bytes, skipping FastAPI's
+response_model re-validation and jsonable_encoder pass.
+"""
+from fastapi import Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+__all__ = ["ORJSONResponse", "model_json_response"]
+
+
+def model_json_response(
+    model: BaseModel, status_code: int = status.HTTP_200_OK, exclude_unset: bool = False
+) -> Response:
+    """Serialize a response model straight to JSON bytes (pydantic-core)."""
+    return Response(
+        content=model.model_dump_json(exclude_unset=exclude_unset),
+        status_code=status_code,
+        media_type="application/json",
+    )
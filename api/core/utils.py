@@ -2,12 +2,15 @@
 import os
 import re
 import uuid
+from typing import Optional
 
 import bleach
 from fastapi import HTTPException
 from slugify import slugify
 from sqlalchemy.orm import Session
 
+from api.core.config import settings
+
 
 def validate_password_strength(password: str) -> None:
     """Validate password strength."""
@@ -73,3 +76,41 @@ def generate_unique_slug(base: str, db: Session) -> str:
 
     # Fallback to full UUID if all attempts fail
     return f"org-{str(uuid.uuid4())}"
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """Normalize email to its lookup key (trimmed, lowercase)."""
+    if not email or not email.strip():
+        return None
+    return email.strip().lower()
+
+
+# Longest national number (area code + subscriber) written without country code
+NATIONAL_NUMBER_MAX_DIGITS = 11
+
+
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    """Normalize phone to its E.164 lookup key (e.g. "+5511999990000").
+
+    Numbers starting with "+" or "00" already carry a country code; other
+    numbers up to NATIONAL_NUMBER_MAX_DIGITS digits (after dropping trunk
+    zeros) get DEFAULT_PHONE_COUNTRY_CODE. Returns None when the result is
+    not a plausible E.164 number (8-15 digits).
+    """
+    if not phone:
+        return None
+
+    stripped = phone.strip()
+    digits = re.sub(r"\D", "", stripped)
+    if stripped.startswith("+"):
+        pass
+    elif digits.startswith("00"):
+        digits = digits[2:]
+    else:
+        digits = digits.lstrip("0")
+        if len(digits) <= NATIONAL_NUMBER_MAX_DIGITS:
+            digits = settings.DEFAULT_PHONE_COUNTRY_CODE + digits
+
+    if not 8 <= len(digits) <= 15:
+        return None
+    return f"+{digits}"
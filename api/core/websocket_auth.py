@@ -0,0 +1,158 @@
+"""WebSocket Authentication with a membership cache.
+
+Resolves (user, organization) for a WebSocket connection without blocking
+the event loop: cached for a short TTL, loaded in a worker thread on miss.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_
+
+from api.core.config import settings
+from api.core.database import SessionLocal
+from api.models.organization import Organization, OrganizationMember
+from api.models.user import User
+
+logger = logging.getLogger(__name__)
+
+AuthKey = Tuple[UUID, UUID]
+Identity = Tuple[User, Organization]
+
+
+class WebSocketAuthCache:
+    """Thread-safe LRU of (org_id, user_id) -> (user, organization) with a TTL.
+
+    Only successful lookups are cached. Membership changes made in this
+    process invalidate their entries; the TTL bounds staleness from other
+    workers. Concurrent misses for the same key share one load, so a
+    reconnect storm costs one query per user rather than one per socket.
+    Cached instances are detached and shared: read them, never modify them.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        """Initialize an empty cache."""
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[AuthKey, Tuple[Identity, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading: Dict[AuthKey, asyncio.Task] = {}
+
+    def get(self, key: AuthKey) -> Optional[Identity]:
+        """Return the cached identity, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            identity, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return identity
+
+    def set(self, key: AuthKey, identity: Identity) -> None:
+        """Cache an identity, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (identity, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, org_id: UUID, user_id: UUID) -> None:
+        """Drop a user's entry for an organization (membership removed or changed)."""
+        with self._lock:
+            self._entries.pop((org_id, user_id), None)
+
+    def invalidate_organization(self, org_id: UUID) -> None:
+        """Drop every entry of an organization (organization deactivated)."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == org_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    async def resolve(self, org_id: UUID, user_id: UUID) -> Identity:
+        """Cached identity, or load it off the event loop (one load per key at a time)."""
+        key = (org_id, user_id)
+        identity = self.get(key)
+        if identity is not None:
+            return identity
+
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                asyncio.to_thread(load_websocket_identity, org_id, user_id)
+            )
+            task.add_done_callback(lambda done: self._loaded(key, done))
+            self._loading[key] = task
+        # A waiter giving up (client gone) doesn't cancel the shared load
+        return await asyncio.shield(task)
+
+    def _loaded(self, key: AuthKey, task: asyncio.Task) -> None:
+        """Cache a finished load (failures are not cached)."""
+        self._loading.pop(key, None)
+        if not task.cancelled() and task.exception() is None:
+            self.set(key, task.result())
+
+
+def load_websocket_identity(org_id: UUID, user_id: UUID) -> Identity:
+    """Load user and organization and check membership in one query (blocking)."""
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(User, Organization, OrganizationMember.id)
+            .select_from(User)
+            .join(Organization, Organization.id == org_id)
+            .outerjoin(
+                OrganizationMember,
+                and_(
+                    OrganizationMember.user_id == User.id,
+                    OrganizationMember.organization_id == Organization.id,
+                    OrganizationMember.is_active.is_(True),
+                ),
+            )
+            .filter(User.id == user_id)
+            .first()
+        )
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User or organization not found"
+            )
+
+        user, organization, membership_id = row
+        if not user.is_active:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
+        if not organization.is_active:
+            # Deleted organizations stay until purged
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found"
+            )
+
+        # Owner or active member
+        if organization.owner_id != user.id and membership_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="User does not belong to organization",
+            )
+
+        # Detach fully loaded instances so they outlive the session
+        db.expunge(user)
+        db.expunge(organization)
+        return user, organization
+    finally:
+        db.close()
+
+
+websocket_auth_cache = WebSocketAuthCache(
+    settings.WEBSOCKET_AUTH_CACHE_SIZE, settings.WEBSOCKET_AUTH_CACHE_TTL_SECONDS
+)
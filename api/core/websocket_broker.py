@@ -0,0 +1,158 @@
+"""WebSocket Broker for cross-process event fan-out.
+
+Carries organization broadcasts between API processes; each process relays
+them to its own local WebSocket connections.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Optional, Set
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+# (organization_id, data) -> deliver to local connections
+MessageHandler = Callable[[str, str], Awaitable[None]]
+
+
+class WebSocketBroker(ABC):
+    """Publish/subscribe transport keyed by organization.
+
+    A process subscribes only to organizations it has local connections
+    for, so an event reaches exactly the processes that can deliver it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize broker without a local handler."""
+        self._handler: Optional[MessageHandler] = None
+
+    def bind(self, handler: MessageHandler) -> None:
+        """Set the callback that delivers received messages locally."""
+        self._handler = handler
+
+    async def _dispatch(self, organization_id: str, data: str) -> None:
+        """Hand a received message to the local handler."""
+        if self._handler is None:
+            return
+        try:
+            await self._handler(organization_id, data)
+        except Exception as e:
+            logger.error(
+                "Failed to relay broker message",
+                extra={"organization_id": organization_id, "error": str(e)},
+                exc_info=True,
+            )
+
+    @abstractmethod
+    async def publish(self, organization_id: str, data: str) -> None:
+        """Publish a message to every process subscribed to the organization."""
+
+    @abstractmethod
+    async def subscribe(self, organization_id: str) -> None:
+        """Start receiving the organization's messages."""
+
+    @abstractmethod
+    async def unsubscribe(self, organization_id: str) -> None:
+        """Stop receiving the organization's messages."""
+
+    async def close(self) -> None:
+        """Release broker resources."""
+
+
+class InMemoryBroker(WebSocketBroker):
+    """Single-process broker: publishing delivers straight to local connections."""
+
+    def __init__(self) -> None:
+        """Initialize an empty subscription set."""
+        super().__init__()
+        self._subscriptions: Set[str] = set()
+
+    async def publish(self, organization_id: str, data: str) -> None:
+        """Deliver locally when this process has the organization's connections."""
+        if organization_id in self._subscriptions:
+            await self._dispatch(organization_id, data)
+
+    async def subscribe(self, organization_id: str) -> None:
+        """Start receiving the organization's messages."""
+        self._subscriptions.add(organization_id)
+
+    async def unsubscribe(self, organization_id: str) -> None:
+        """Stop receiving the organization's messages."""
+        self._subscriptions.discard(organization_id)
+
+
+class RedisBroker(WebSocketBroker):
+    """Redis pub/sub broker: one channel per organization, one listener per process."""
+
+    CHANNEL_PREFIX = "ws:org:"
+
+    def __init__(self, client: redis.Redis, poll_timeout: float = 1.0) -> None:
+        """Initialize broker on a Redis client (connections are opened lazily)."""
+        super().__init__()
+        self.client = client
+        self.poll_timeout = poll_timeout
+        self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+        self._listener: Optional[asyncio.Task] = None
+
+    def channel(self, organization_id: str) -> str:
+        """Redis channel for an organization."""
+        return f"{self.CHANNEL_PREFIX}{organization_id}"
+
+    async def publish(self, organization_id: str, data: str) -> None:
+        """Publish a message to every process subscribed to the organization."""
+        await self.client.publish(self.channel(organization_id), data)
+
+    async def subscribe(self, organization_id: str) -> None:
+        """Subscribe to the organization's channel and make sure the listener runs."""
+        await self._pubsub.subscribe(self.channel(organization_id))
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def unsubscribe(self, organization_id: str) -> None:
+        """Unsubscribe from the organization's channel."""
+        await self._pubsub.unsubscribe(self.channel(organization_id))
+
+    async def _listen(self) -> None:
+        """Relay channel messages to the local handler until cancelled."""
+        while True:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=self.poll_timeout
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # redis-py re-subscribes on reconnect; back off and keep listening
+                logger.error("Redis broker listener error", extra={"error": str(e)})
+                await asyncio.sleep(self.poll_timeout)
+                continue
+
+            if not message or message.get("type") != "message":
+                continue
+
+            channel, data = message["channel"], message["data"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            if isinstance(data, bytes):
+                data = data.decode()
+            await self._dispatch(channel[len(self.CHANNEL_PREFIX) :], data)
+
+    async def close(self) -> None:
+        """Stop the listener and close Redis connections."""
+        if self._listener:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        await self._pubsub.aclose()
+        await self.client.aclose()
+
+
+def create_broker(backend: str, redis_url: str) -> WebSocketBroker:
+    """Build the configured broker ("memory" or "redis")."""
+    if backend == "redis":
+        return RedisBroker(redis.Redis.from_url(redis_url, decode_responses=True))
+    if backend != "memory":
+        logger.warning(f"Unknown WebSocket broker '{backend}', using in-memory broker")
+    return InMemoryBroker()
@@ -0,0 +1,92 @@
+"""WebSocket Event Coalescer for high-frequency pipeline events.
+
+Throttles drag and activity events per organization and batches them into
+one frame per sender per window.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from uuid import UUID
+
+from api.core.config import settings
+from api.core.websocket_manager import websocket_manager
+
+logger = logging.getLogger(__name__)
+
+# (organization_id, message, exclude_user_id) -> broadcast
+Publisher = Callable[[UUID, Dict[str, Any], Optional[UUID]], Awaitable[None]]
+
+BATCH_EVENT_TYPE = "pipeline_event_batch"
+
+
+class PipelineEventCoalescer:
+    """Latest-wins throttle for ephemeral pipeline events, batched per org window.
+
+    Events submitted under the same key within a window replace each other
+    (e.g. one user's drag start/end of a lead, one user's activity), so a
+    busy board sends at most one frame per sender per organization per
+    window. Events carry their `user_id`, and each sender's frame is
+    excluded for that sender so nobody gets their own events echoed.
+    """
+
+    def __init__(self, publish: Publisher, window_seconds: float) -> None:
+        """Initialize coalescer with the broadcast function and window length."""
+        self.publish = publish
+        self.window_seconds = window_seconds
+        self._pending: Dict[UUID, Dict[Hashable, Dict[str, Any]]] = {}
+        self._flushers: Dict[UUID, asyncio.Task] = {}
+
+    async def submit(self, organization_id: UUID, key: Hashable, event: Dict[str, Any]) -> None:
+        """Queue an event for the organization's next frame (latest wins per key)."""
+        if self.window_seconds <= 0:
+            await self._publish(organization_id, [event])
+            return
+
+        pending = self._pending.setdefault(organization_id, {})
+        # Re-insert so frame order follows the latest update
+        pending.pop(key, None)
+        pending[key] = event
+
+        if organization_id not in self._flushers:
+            self._flushers[organization_id] = asyncio.create_task(
+                self._flush_after_window(organization_id)
+            )
+
+    async def _flush_after_window(self, organization_id: UUID) -> None:
+        """Publish the organization's pending events once the window closes."""
+        try:
+            await asyncio.sleep(self.window_seconds)
+        finally:
+            self._flushers.pop(organization_id, None)
+
+        events = list(self._pending.pop(organization_id, {}).values())
+        if events:
+            await self._publish(organization_id, events)
+
+    async def _publish(self, organization_id: UUID, events: list) -> None:
+        """Broadcast each sender's events: one as-is, or several as a single batch frame."""
+        by_sender: Dict[Optional[str], list] = {}
+        for event in events:
+            by_sender.setdefault(event.get("user_id"), []).append(event)
+
+        for sender, sender_events in by_sender.items():
+            message = (
+                sender_events[0]
+                if len(sender_events) == 1
+                else {"type": BATCH_EVENT_TYPE, "events": sender_events}
+            )
+            try:
+                await self.publish(organization_id, message, UUID(sender) if sender else None)
+            except Exception as e:
+                logger.error(
+                    "Failed to publish coalesced pipeline events",
+                    extra={"organization_id": str(organization_id), "error": str(e)},
+                )
+
+
+# Global coalescer for /ws/pipeline ephemeral events
+pipeline_event_coalescer = PipelineEventCoalescer(
+    websocket_manager.broadcast_to_organization,
+    settings.WEBSOCKET_COALESCE_WINDOW_MS / 1000,
+)
@@ -0,0 +1,97 @@
+"""WebSocket Wire Formats for outbound frames.
+
+JSON text frames by default; clients may negotiate compact binary msgpack
+frames with `?format=msgpack` or the `msgpack` subprotocol. Text frames are
+always JSON and binary frames always msgpack, so clients can decode by
+frame type. Server-Sent Events connections share the same cache through
+the `sse` format, which isn't negotiable on WebSockets.
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# msgpack is optional: without it every connection gets JSON
+try:
+    import msgpack  # type: ignore[import-not-found]
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+JSON_FORMAT = "json"
+MSGPACK_FORMAT = "msgpack"
+SSE_FORMAT = "sse"
+
+Frame = Union[str, bytes]
+
+
+def available_formats() -> List[str]:
+    """Wire formats this process can encode, most compact first."""
+    return [MSGPACK_FORMAT, JSON_FORMAT] if MSGPACK_AVAILABLE else [JSON_FORMAT]
+
+
+def negotiate_wire_format(
+    requested: Optional[str], subprotocols: Iterable[str] = ()
+) -> Tuple[str, Optional[str]]:
+    """Pick a connection's (wire format, subprotocol to accept).
+
+    The `format` query param wins; otherwise the first offered subprotocol
+    naming a supported format. Unsupported requests fall back to JSON.
+    """
+    formats = available_formats()
+    if requested:
+        return (requested if requested in formats else JSON_FORMAT), None
+
+    for subprotocol in subprotocols:
+        if subprotocol in formats:
+            return subprotocol, subprotocol
+    return JSON_FORMAT, None
+
+
+class EncodedMessage:
+    """A message and its frames, each format encoded at most once.
+
+    Built from the JSON the broker already carries, so a broadcast reaching
+    many msgpack connections is decoded and packed once, not per socket.
+    """
+
+    __slots__ = ("message_json", "_frames")
+
+    def __init__(self, message_json: str) -> None:
+        """Wrap a serialized (JSON) message."""
+        self.message_json = message_json
+        self._frames: Dict[str, Frame] = {}
+
+    @classmethod
+    def from_message(cls, message: Dict[str, Any]) -> "EncodedMessage":
+        """Serialize a message once for all its recipients."""
+        return cls(json.dumps(message))
+
+    def frame(self, wire_format: str) -> Frame:
+        """The message's frame in a wire format."""
+        if wire_format == JSON_FORMAT:
+            return self.message_json
+
+        frame = self._frames.get(wire_format)
+        if frame is None:
+            message = json.loads(self.message_json)
+            if wire_format == SSE_FORMAT:
+                frame = _event(message.get("seq"), self.message_json)
+            else:
+                # The connection is scoped to one organization (sent once on connect)
+                message.pop("organization_id", None)
+                frame = _pack(message)
+            self._frames[wire_format] = frame
+        return frame
+
+
+def _event(seq: Optional[int], message_json: str) -> str:
+    """Format a message as an SSE event; replayable ones carry their seq as the id."""
+    # json.dumps output is a single line, so one data field holds it
+    event_id = f"id: {seq}\n" if seq is not None else ""
+    return f"{event_id}data: {message_json}\n\n"
+
+
+def _pack(message: Dict[str, Any]) -> bytes:
+    """Encode a message as msgpack."""
+    return msgpack.packb(message, use_bin_type=True)
@@ -3,35 +3,230 @@
 Organization-isolated event broadcasting for team collaboration.
 """
 
+import asyncio
 import json
 import logging
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Set
 from uuid import UUID
 
-from fastapi import WebSocket
+from starlette.websockets import WebSocketState
+
+from api.core.config import settings
+from api.core.websocket_broker import InMemoryBroker, WebSocketBroker, create_broker
+from api.core.websocket_codec import JSON_FORMAT, EncodedMessage, Frame
+from api.core.websocket_presence import LocalPresence, create_presence
+from api.core.websocket_replay import InMemoryReplayBuffer, ReplayBuffer, create_replay_buffer
 
 logger = logging.getLogger(__name__)
 
+# Close code for evicted slow consumers (RFC 6455 "Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+# Index key for connections that never subscribed (they receive every event)
+ALL_TOPICS = "*"
+PRESENCE_TOPIC = "presence"
+PRESENCE_EVENTS = {
+    "user_joined",
+    "user_left",
+    "user_activity_update",
+    "pipeline_user_activity_update",
+    "user_typing",
+}
+
+
+def event_topics(message: Dict[str, Any]) -> Optional[Set[str]]:
+    """Topics an event belongs to (`stage:<name>`, `lead:<id>`, `presence`).
+
+    None means the event is not topic-scoped and goes to every connection
+    (e.g. bulk operations, whose stages aren't known up front).
+    """
+    message_type = message.get("type")
+    if message_type in PRESENCE_EVENTS:
+        return {PRESENCE_TOPIC}
+
+    if message_type == "pipeline_event_batch":
+        topics: Set[str] = set()
+        for event in message.get("events", []):
+            event_scope = event_topics(event)
+            if event_scope is None:
+                return None
+            topics |= event_scope
+        return topics
+
+    # Lead events carry the card under "lead"; client relays carry "lead_id"
+    lead = message.get("lead")
+    if isinstance(lead, dict):
+        lead_id, fields = lead.get("id"), lead
+    else:
+        lead_id, fields = message.get("lead_id"), message
+    if not lead_id:
+        return None
+
+    topics = {f"lead:{lead_id}"}
+    for field in ("stage", "previous_stage", "old_stage", "new_stage"):
+        if fields.get(field):
+            topics.add(f"stage:{fields[field]}")
+    return topics
+
+
+def _message_json(envelope: Dict[str, Any]) -> str:
+    """A broker envelope's message, with the envelope's `seq` when it was numbered."""
+    seq = envelope.get("seq")
+    if seq is None:
+        return envelope["message"]
+    # Appended as the last field, so the message is never parsed again
+    return f'{envelope["message"][:-1]}, "seq": {seq}}}'
+
+
+class Connection(Protocol):
+    """What the manager needs from a client connection.
+
+    Starlette's WebSocket, or an EventStreamConnection for SSE clients.
+    """
+
+    client_state: WebSocketState
+
+    async def accept(self, subprotocol: Optional[str] = None) -> None:
+        """Open the connection."""
+
+    async def send_text(self, data: str) -> None:
+        """Send a text frame."""
+
+    async def send_bytes(self, data: bytes) -> None:
+        """Send a binary frame (msgpack connections only)."""
+
+    async def close(self, code: int = 1000, reason: Optional[str] = None) -> None:
+        """Close the connection."""
+
+
+class ConnectionSender:
+    """Bounded outbound queue drained by one writer task per connection.
+
+    Broadcasting only enqueues, so a slow client delays nobody but itself;
+    a full queue means the client cannot keep up and gets evicted. Frames
+    are sent as text (JSON) or binary (msgpack) depending on their type.
+    """
+
+    def __init__(
+        self,
+        websocket: Connection,
+        max_queue: int,
+        on_error: Callable[[], None],
+        wire_format: str = JSON_FORMAT,
+    ) -> None:
+        """Initialize sender (call start() from the event loop)."""
+        self.websocket = websocket
+        self.wire_format = wire_format
+        self.queue: "asyncio.Queue[Frame]" = asyncio.Queue(maxsize=max_queue)
+        self.on_error = on_error
+        self.task: Optional[asyncio.Task] = None
+        # Delivery metrics
+        self.messages_sent = 0
+        self.bytes_sent = 0
+        self.send_seconds_total = 0.0
+        self.send_seconds_max = 0.0
+
+    def start(self) -> None:
+        """Start the writer task."""
+        self.task = asyncio.create_task(self._write_loop())
+
+    def enqueue(self, message: EncodedMessage) -> bool:
+        """Queue a message in this connection's wire format in O(1); False when full."""
+        try:
+            self.queue.put_nowait(message.frame(self.wire_format))
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def _write_loop(self) -> None:
+        """Send queued frames in order until cancelled or the socket fails."""
+        while True:
+            frame = await self.queue.get()
+            started = time.perf_counter()
+            try:
+                if isinstance(frame, bytes):
+                    await self.websocket.send_bytes(frame)
+                else:
+                    await self.websocket.send_text(frame)
+            except Exception as e:
+                logger.error(f"Failed to send WebSocket message: {e}")
+                self.task = None  # on_error stops the sender; don't cancel ourselves
+                self.on_error()
+                return
+            elapsed = time.perf_counter() - started
+            self.messages_sent += 1
+            # JSON frames are ASCII (json.dumps escapes), so len() is the byte size
+            self.bytes_sent += len(frame)
+            self.send_seconds_total += elapsed
+            self.send_seconds_max = max(self.send_seconds_max, elapsed)
+
+    def stop(self) -> None:
+        """Stop the writer task (queued messages are dropped)."""
+        if self.task:
+            self.task.cancel()
+            self.task = None
+
 
 class WebSocketConnectionManager:
     """Manages WebSocket connections with organization isolation.
 
     Ensures real-time events are only broadcast within the same organization.
+    Broadcasts go through the broker, so they reach connections held by
+    other processes; this process subscribes to an organization while it
+    has local connections for it. Replayable broadcasts carry a per-org
+    `seq` and are kept in the replay buffer so reconnecting clients can
+    resume instead of refetching.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        broker: Optional[WebSocketBroker] = None,
+        send_queue_size: Optional[int] = None,
+        replay_buffer: Optional[ReplayBuffer] = None,
+        presence: Optional[LocalPresence] = None,
+    ) -> None:
         """Initialize the WebSocket connection manager."""
         # Organization-scoped connections: {org_id: {user_id: [WebSocket1, WebSocket2, ...]}}
-        self.connections: Dict[str, Dict[str, List[WebSocket]]] = {}
-        # Track active users per organization: {org_id: {user_id: {last_seen, user_info}}}
-        self.active_users: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.connections: Dict[str, Dict[str, List[Connection]]] = {}
+        # Online users and connection counters (cluster-wide with the Redis backend)
+        self.presence = presence or LocalPresence()
+        # Outbound queue + writer task per connection
+        self.senders: Dict[Connection, ConnectionSender] = {}
+        # Subscription index: {org_id: {topic: {WebSocket: user_id}}}
+        self.topic_index: Dict[str, Dict[str, Dict[Connection, str]]] = {}
+        # Topics of connections that subscribed: {WebSocket: {topic, ...}}
+        self.connection_topics: Dict[Connection, Set[str]] = {}
+        self.send_queue_size = send_queue_size or settings.WEBSOCKET_SEND_QUEUE_SIZE
+        self.evicted_connections = 0
+        # Broadcasts held back from connections while their replay is loaded
+        self.resuming: Dict[Connection, List[EncodedMessage]] = {}
+        self.replay_buffer = replay_buffer or InMemoryReplayBuffer(
+            settings.WEBSOCKET_REPLAY_BUFFER_SIZE
+        )
+        self.broker = broker or InMemoryBroker()
+        self.broker.bind(self._relay_broker_message)
 
     async def connect(
-        self, websocket: WebSocket, organization_id: UUID, user_id: UUID, user_info: Dict[str, Any]
+        self,
+        websocket: Connection,
+        organization_id: UUID,
+        user_id: UUID,
+        user_info: Dict[str, Any],
+        resuming: bool = False,
+        wire_format: str = JSON_FORMAT,
+        subprotocol: Optional[str] = None,
     ) -> None:
-        """Connect user to organization-specific WebSocket room."""
-        await websocket.accept()
+        """Connect user to organization-specific WebSocket room.
+
+        With `resuming`, broadcasts are held for the connection until
+        resume() has replayed what it missed, so frames stay in seq order.
+        `wire_format` / `subprotocol` come from negotiate_wire_format().
+        """
+        await websocket.accept(subprotocol=subprotocol)
+        if resuming:
+            self.resuming[websocket] = []
 
         org_str = str(organization_id)
         user_str = str(user_id)
@@ -39,7 +234,8 @@ class WebSocketConnectionManager:
         # Initialize organization connections if not exists
         if org_str not in self.connections:
             self.connections[org_str] = {}
-            self.active_users[org_str] = {}
+            self.topic_index[org_str] = {}
+            await self.broker.subscribe(org_str)
 
         # Initialize user connections list if not exists
         if user_str not in self.connections[org_str]:
@@ -47,20 +243,24 @@ class WebSocketConnectionManager:
 
         # Add connection to user's list
         self.connections[org_str][user_str].append(websocket)
+        sender = ConnectionSender(
+            websocket,
+            self.send_queue_size,
+            on_error=lambda: self.disconnect(organization_id, user_id, websocket),
+            wire_format=wire_format,
+        )
+        self.senders[websocket] = sender
+        sender.start()
+        # Unfiltered until the client subscribes to topics
+        self.topic_index[org_str].setdefault(ALL_TOPICS, {})[websocket] = user_str
 
         # Track user activity
-        self.active_users[org_str][user_str] = {
-            "last_seen": datetime.utcnow().isoformat(),
-            "user_info": user_info,
-            "connected_at": datetime.utcnow().isoformat(),
-        }
+        self.presence.join(org_str, user_str, user_info)
 
         logger.info(f"WebSocket connected: org={org_str} user={user_str}")
 
-        # Calculate total connections
-        total_connections = sum(len(ws_list) for ws_list in self.connections[org_str].values())
-
         # Broadcast user joined event to organization
+        counts = self.presence.local_counts(org_str)
         await self.broadcast_to_organization(
             organization_id,
             {
@@ -68,35 +268,132 @@ class WebSocketConnectionManager:
                 "user_id": user_str,
                 "user_info": user_info,
                 "timestamp": datetime.utcnow().isoformat(),
-                "total_online": len(self.connections[org_str]),
-                "total_connections": total_connections,
+                "total_online": counts["online_users"],
+                "total_connections": counts["connections"],
             },
             exclude_user_id=user_id,
         )
 
     def _remove_user_connection(
-        self, org_str: str, user_str: str, websocket: Optional[WebSocket]
+        self, org_str: str, user_str: str, websocket: Optional[Connection]
     ) -> bool:
         """Remove user connection and return whether user should be cleaned up."""
         if websocket and websocket in self.connections[org_str][user_str]:
             self.connections[org_str][user_str].remove(websocket)
-            return not self.connections[org_str][user_str]  # True if no connections left
+            self._stop_sender(websocket)
+            self.presence.leave(org_str, user_str)
+            self._drop_subscriptions(org_str, websocket)
+            if self.connections[org_str][user_str]:
+                return False
+            # No connections left: drop the user so the room can be cleaned up
+            del self.connections[org_str][user_str]
+            return True
         else:
             # Remove all connections for user
-            del self.connections[org_str][user_str]
+            for user_websocket in self.connections[org_str].pop(user_str):
+                self._stop_sender(user_websocket)
+                self._drop_subscriptions(org_str, user_websocket)
+                self.presence.leave(org_str, user_str)
             return True
 
-    def _cleanup_user_data(self, org_str: str, user_str: str) -> None:
-        """Clean up user data from active users."""
-        if org_str in self.active_users and user_str in self.active_users[org_str]:
-            del self.active_users[org_str][user_str]
+    def _stop_sender(self, websocket: Connection) -> None:
+        """Stop and forget the connection's writer task."""
+        sender = self.senders.pop(websocket, None)
+        self.resuming.pop(websocket, None)
+        if sender:
+            sender.stop()
+
+    def _drop_subscriptions(self, org_str: str, websocket: Connection) -> None:
+        """Remove the connection from the organization's subscription index."""
+        index = self.topic_index.get(org_str, {})
+        for topic in self.connection_topics.pop(websocket, {ALL_TOPICS}):
+            subscribers = index.get(topic)
+            if subscribers is not None:
+                subscribers.pop(websocket, None)
+                if not subscribers:
+                    del index[topic]
+
+    def subscribe(
+        self, organization_id: UUID, user_id: UUID, websocket: Connection, topics: Iterable[str]
+    ) -> Set[str]:
+        """Add topics to a connection; it then only receives those (plus unscoped events).
+
+        Returns the connection's topics after the change.
+        """
+        org_str, user_str = str(organization_id), str(user_id)
+        index = self.topic_index.get(org_str)
+        if index is None or websocket not in self.senders:
+            return set()
+
+        if websocket not in self.connection_topics:
+            # First subscription: leave the unfiltered set
+            self._drop_subscriptions(org_str, websocket)
+            self.connection_topics[websocket] = set()
+
+        subscribed = self.connection_topics[websocket]
+        for topic in topics:
+            index.setdefault(topic, {})[websocket] = user_str
+            subscribed.add(topic)
+        return set(subscribed)
+
+    def unsubscribe(
+        self, organization_id: UUID, websocket: Connection, topics: Iterable[str]
+    ) -> Set[str]:
+        """Remove topics from a connection; returns its remaining topics."""
+        index = self.topic_index.get(str(organization_id), {})
+        subscribed = self.connection_topics.get(websocket)
+        if subscribed is None:
+            return set()
+
+        for topic in topics:
+            subscribed.discard(topic)
+            subscribers = index.get(topic)
+            if subscribers is not None:
+                subscribers.pop(websocket, None)
+                if not subscribers:
+                    del index[topic]
+        return set(subscribed)
+
+    def _enqueue(
+        self, org_str: str, user_str: str, websocket: Connection, message: EncodedMessage
+    ) -> bool:
+        """Queue a message for one connection; evict the connection if it can't keep up."""
+        sender = self.senders.get(websocket)
+        if sender and sender.enqueue(message):
+            return True
+
+        self.evicted_connections += 1
+        logger.warning(
+            "Evicting slow WebSocket consumer",
+            extra={
+                "organization_id": org_str,
+                "user_id": user_str,
+                "queue_size": self.send_queue_size,
+            },
+        )
+        try:
+            asyncio.get_event_loop().create_task(
+                websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="Slow consumer")
+            )
+        except Exception as e:
+            logger.error(f"Failed to close slow WebSocket consumer: {e}")
+        return False
 
     def _cleanup_empty_organization(self, org_str: str) -> None:
         """Clean up empty organization rooms."""
         if not self.connections[org_str]:
             del self.connections[org_str]
-            if org_str in self.active_users:
-                del self.active_users[org_str]
+            self.topic_index.pop(org_str, None)
+
+            try:
+                asyncio.get_event_loop().create_task(self._unsubscribe_if_empty(org_str))
+            except Exception as e:
+                logger.error(f"Failed to schedule broker unsubscribe: {e}")
+
+    async def _unsubscribe_if_empty(self, org_str: str) -> None:
+        """Drop the broker subscription unless the organization reconnected meanwhile."""
+        if org_str not in self.connections:
+            await self.broker.unsubscribe(org_str)
 
     def _broadcast_user_left_event(
         self, organization_id: UUID, org_str: str, user_str: str, user_info: Dict[str, Any]
@@ -105,13 +402,9 @@ class WebSocketConnectionManager:
         if org_str not in self.connections:
             return
 
-        remaining_total_connections = sum(
-            len(ws_list) for ws_list in self.connections[org_str].values()
-        )
+        counts = self.presence.local_counts(org_str)
 
         # Use asyncio to run async function
-        import asyncio
-
         try:
             loop = asyncio.get_event_loop()
             loop.create_task(
@@ -122,8 +415,8 @@ class WebSocketConnectionManager:
                         "user_id": user_str,
                         "user_info": user_info,
                         "timestamp": datetime.utcnow().isoformat(),
-                        "total_online": len(self.connections[org_str]),
-                        "total_connections": remaining_total_connections,
+                        "total_online": counts["online_users"],
+                        "total_connections": counts["connections"],
                     },
                 )
             )
@@ -131,7 +424,7 @@ class WebSocketConnectionManager:
             logger.error(f"Failed to broadcast user_left event: {e}")
 
     def disconnect(
-        self, organization_id: UUID, user_id: UUID, websocket: Optional[WebSocket] = None
+        self, organization_id: UUID, user_id: UUID, websocket: Optional[Connection] = None
     ) -> None:
         """Disconnect user from organization WebSocket room."""
         org_str = str(organization_id)
@@ -140,13 +433,10 @@ class WebSocketConnectionManager:
         if org_str not in self.connections or user_str not in self.connections[org_str]:
             return
 
-        user_info = self.active_users.get(org_str, {}).get(user_str, {}).get("user_info", {})
-
-        # Remove connection and check if user should be cleaned up
-        should_cleanup_user = self._remove_user_connection(org_str, user_str, websocket)
+        user_info = self.presence.user_info(org_str, user_str)
 
-        if should_cleanup_user:
-            self._cleanup_user_data(org_str, user_str)
+        # Remove connection (presence is updated per removed connection)
+        self._remove_user_connection(org_str, user_str, websocket)
 
         self._cleanup_empty_organization(org_str)
         logger.info(f"WebSocket disconnected: org={org_str} user={user_str}")
@@ -164,107 +454,300 @@ class WebSocketConnectionManager:
         if org_str in self.connections and user_str in self.connections[org_str]:
             websockets = self.connections[org_str][user_str]  # Now a list
             failed_connections = []
+            encoded = EncodedMessage.from_message(message)
 
             for websocket in websockets:
-                try:
-                    # 🚨 SEGURANÇA: Check connection state before sending
-                    if hasattr(websocket, "client_state") and websocket.client_state.name in [
-                        "DISCONNECTED",
-                        "CLOSED",
-                    ]:
-                        logger.warning(f"WebSocket already closed for user {user_str}, cleaning up")
-                        failed_connections.append(websocket)
-                        continue
-
-                    await websocket.send_text(json.dumps(message))
-                except Exception as e:
-                    logger.error(f"Failed to send personal message: {e}")
+                # 🚨 SEGURANÇA: Check connection state before sending
+                if hasattr(websocket, "client_state") and websocket.client_state.name in [
+                    "DISCONNECTED",
+                    "CLOSED",
+                ]:
+                    logger.warning(f"WebSocket already closed for user {user_str}, cleaning up")
+                    failed_connections.append(websocket)
+                    continue
+
+                if not self._enqueue(org_str, user_str, websocket, encoded):
                     failed_connections.append(websocket)
 
             # Clean up failed connections
             for failed_ws in failed_connections:
                 self.disconnect(organization_id, user_id, failed_ws)
 
+    async def send_to_connection(
+        self,
+        organization_id: UUID,
+        user_id: UUID,
+        websocket: Connection,
+        message: Dict[str, Any],
+    ) -> None:
+        """Send message to one connection of a user (e.g. a subscription ack)."""
+        org_str, user_str = str(organization_id), str(user_id)
+        if websocket not in self.senders:
+            return
+        if not self._enqueue(org_str, user_str, websocket, EncodedMessage.from_message(message)):
+            self.disconnect(organization_id, user_id, websocket)
+
     async def broadcast_to_organization(
-        self, organization_id: UUID, message: Dict[str, Any], exclude_user_id: Optional[UUID] = None
+        self,
+        organization_id: UUID,
+        message: Dict[str, Any],
+        exclude_user_id: Optional[UUID] = None,
+        topics: Optional[Iterable[str]] = None,
+        replayable: bool = False,
     ) -> None:
-        """Broadcast message to all users in organization (except excluded user)."""
+        """Broadcast message to users in organization (except excluded user).
+
+        The message is serialized once and published through the broker;
+        every process with connections for the organization delivers it.
+        Only connections subscribed to one of the event's topics (derived
+        with event_topics() unless given) receive it; connections that never
+        subscribed receive everything. Replayable messages (state changes,
+        not presence or drag noise) get the next `seq` and are buffered.
+        """
         org_str = str(organization_id)
         exclude_str = str(exclude_user_id) if exclude_user_id else None
-
-        if org_str not in self.connections:
-            return
+        scope = event_topics(message) if topics is None else set(topics)
 
         # Add organization context to message
         message["organization_id"] = org_str
-        message_json = json.dumps(message)
+        envelope = json.dumps(
+            {
+                "exclude_user_id": exclude_str,
+                "topics": sorted(scope) if scope is not None else None,
+                "message": json.dumps(message),
+            }
+        )
+
+        if replayable:
+            # The buffer numbers, keeps and publishes it in one step
+            message["seq"] = await self.replay_buffer.publish(org_str, envelope, self.broker)
+        else:
+            await self.broker.publish(org_str, envelope)
+
+    async def stream_position(self, organization_id: UUID) -> Optional[Dict[str, Any]]:
+        """Organization's stream cursor ({"id", "seq"}) for clients to resume from."""
+        try:
+            stream, seq = await self.replay_buffer.position(str(organization_id))
+            return {"id": stream, "seq": seq}
+        except Exception as e:
+            logger.error(
+                "Failed to read WebSocket stream position",
+                extra={"organization_id": str(organization_id), "error": str(e)},
+            )
+            return None
+
+    async def resume(
+        self,
+        organization_id: UUID,
+        user_id: UUID,
+        websocket: Connection,
+        stream: Optional[str],
+        after_seq: int,
+    ) -> Dict[str, Any]:
+        """Replay what a resuming connection missed, then release its held broadcasts.
+
+        Sends (and returns) `replay_complete`, or `resync_required` when the
+        cursor is from another stream or older than the buffer, in which
+        case the client must refetch its state.
+        """
+        org_str, user_str = str(organization_id), str(user_id)
+        try:
+            envelopes = (
+                await self.replay_buffer.since(org_str, stream, after_seq) if stream else None
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to load WebSocket replay",
+                extra={"organization_id": org_str, "user_id": user_str, "error": str(e)},
+            )
+            envelopes = None
+
+        held = self.resuming.pop(websocket, [])
+        sender = self.senders.get(websocket)
+        if sender is None:
+            return {"type": "resync_required"}
+
+        # Same recipients as a live broadcast: not excluded, and within the topics
+        subscribed = self.connection_topics.get(websocket)
+        frames = []
+        for envelope in envelopes or []:
+            data = json.loads(envelope)
+            topics = data.get("topics")
+            if data["exclude_user_id"] == user_str:
+                continue
+            if subscribed is None or topics is None or not subscribed.isdisjoint(topics):
+                frames.append(_message_json(data))
+
+        # Replays that wouldn't fit the send queue are cheaper as a refetch
+        room = sender.queue.maxsize - sender.queue.qsize() - len(held) - 1
+        if envelopes is None or len(frames) > room:
+            summary: Dict[str, Any] = {
+                "type": "resync_required",
+                "stream": await self.stream_position(organization_id),
+            }
+            frames = []
+        else:
+            summary = {"type": "replay_complete", "replayed": len(frames)}
+
+        # Live broadcasts already covered by the replay are dropped
+        replayed = set(frames)
+        messages = [EncodedMessage(message_json) for message_json in frames]
+        messages.append(EncodedMessage.from_message(summary))
+        messages.extend(message for message in held if message.message_json not in replayed)
+        for message in messages:
+            if not self._enqueue(org_str, user_str, websocket, message):
+                self.disconnect(organization_id, user_id, websocket)
+                break
+        return summary
+
+    async def _relay_broker_message(self, org_str: str, envelope: str) -> None:
+        """Deliver a broker message to this process's connections."""
+        data = json.loads(envelope)
+        await self._send_to_local_connections(
+            org_str, _message_json(data), data["exclude_user_id"], data.get("topics")
+        )
 
+    def _local_targets(self, org_str: str, topics: Optional[List[str]]) -> Dict[Connection, str]:
+        """Local connections interested in an event: {WebSocket: user_id}."""
+        if topics is None:
+            return {
+                websocket: user_str
+                for user_str, websockets in self.connections[org_str].items()
+                for websocket in websockets
+            }
+
+        # Index lookups only: cost follows the subscribers, not the organization size
+        index = self.topic_index.get(org_str, {})
+        targets = dict(index.get(ALL_TOPICS, {}))
+        for topic in topics:
+            targets.update(index.get(topic, {}))
+        return targets
+
+    async def _send_to_local_connections(
+        self,
+        org_str: str,
+        message_json: str,
+        exclude_str: Optional[str],
+        topics: Optional[List[str]] = None,
+    ) -> None:
+        """Queue a serialized message for interested local connections of organization."""
+        if org_str not in self.connections:
+            return
+
+        organization_id = UUID(org_str)
         failed_connections = []
-        successful_broadcasts = 0
+        # Each wire format is encoded once for all connections using it
+        encoded = EncodedMessage(message_json)
 
-        for user_str, websockets in self.connections[org_str].items():
+        for websocket, user_str in self._local_targets(org_str, topics).items():
             # Skip excluded user
             if exclude_str and user_str == exclude_str:
                 continue
 
-            # Send to all WebSocket connections for this user
-            for websocket in websockets:
-                try:
-                    # Check connection state before broadcasting
-                    if hasattr(websocket, "client_state") and websocket.client_state.name in [
-                        "DISCONNECTED",
-                        "CLOSED",
-                    ]:
-                        failed_connections.append((user_str, organization_id, websocket))
-                        continue
-
-                    await websocket.send_text(message_json)
-                    successful_broadcasts += 1
-                except Exception as e:
-                    logger.error(f"Failed to broadcast to user {user_str}: {e}")
-                    failed_connections.append((user_str, organization_id, websocket))
+            # Hold until the connection's replay has been queued
+            held = self.resuming.get(websocket)
+            if held is not None:
+                held.append(encoded)
+                continue
+
+            # Check connection state before broadcasting
+            if hasattr(websocket, "client_state") and websocket.client_state.name in [
+                "DISCONNECTED",
+                "CLOSED",
+            ]:
+                failed_connections.append((user_str, organization_id, websocket))
+                continue
+
+            if not self._enqueue(org_str, user_str, websocket, encoded):
+                failed_connections.append((user_str, organization_id, websocket))
 
         # Clean up failed connections
         for user_str, org_id, websocket in failed_connections:
             self.disconnect(org_id, UUID(user_str), websocket)
 
-    def get_active_users(self, organization_id: UUID) -> List[Dict[str, Any]]:
-        """Get list of active users in organization."""
-        org_str = str(organization_id)
+    async def close(self) -> None:
+        """Stop every writer task, then release the broker, replay buffer and presence."""
+        tasks = [sender.task for sender in self.senders.values() if sender.task]
+        for websocket in list(self.senders):
+            self._stop_sender(websocket)
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-        if org_str not in self.active_users:
-            return []
-
-        users = []
-        for user_id, user_data in self.active_users[org_str].items():
-            users.append(
-                {
-                    "user_id": user_id,
-                    "last_seen": user_data["last_seen"],
-                    "connected_at": user_data["connected_at"],
-                    **user_data["user_info"],
-                }
-            )
+        await self.broker.close()
+        await self.replay_buffer.close()
+        await self.presence.close()
+
+    def touch(self, organization_id: UUID, user_id: UUID) -> None:
+        """Refresh the user's last_seen (called for every client message)."""
+        self.presence.touch(str(organization_id), str(user_id))
 
-        return users
+    async def get_active_users(self, organization_id: UUID) -> List[Dict[str, Any]]:
+        """Get list of active users in organization (across all processes)."""
+        return await self.presence.users(str(organization_id))
 
-    def get_organization_stats(self, organization_id: UUID) -> Dict[str, Any]:
+    async def get_organization_stats(self, organization_id: UUID) -> Dict[str, Any]:
         """Get real-time stats for organization."""
         org_str = str(organization_id)
+        connected_users = await self.get_active_users(organization_id)
+        local = self.presence.local_counts(org_str)
 
-        # Count total connections across all users
-        total_connections = 0
-        if org_str in self.connections:
-            for _user_id, websockets in self.connections[org_str].items():
-                total_connections += len(websockets)
-
+        index = self.topic_index.get(org_str, {})
         return {
             "organization_id": org_str,
-            "total_connections": total_connections,
-            "active_users": len(self.active_users.get(org_str, {})),
-            "connected_users": self.get_active_users(organization_id),
+            "total_connections": sum(user["connections"] for user in connected_users),
+            "active_users": len(connected_users),
+            "connected_users": connected_users,
+            "local": local,
+            "delivery": self.get_delivery_metrics(organization_id),
+            "subscriptions": {
+                "filtered_connections": local["connections"] - len(index.get(ALL_TOPICS, {})),
+                "topics": len([topic for topic in index if topic != ALL_TOPICS]),
+            },
+        }
+
+    def get_delivery_metrics(self, organization_id: Optional[UUID] = None) -> Dict[str, Any]:
+        """Get send queue depth and send latency for one organization (or the process)."""
+        if organization_id is None:
+            senders = list(self.senders.values())
+        else:
+            websockets = self.connections.get(str(organization_id), {}).values()
+            senders = [
+                self.senders[websocket]
+                for user_websockets in websockets
+                for websocket in user_websockets
+                if websocket in self.senders
+            ]
+
+        depths = [sender.queue.qsize() for sender in senders]
+        sent = sum(sender.messages_sent for sender in senders)
+        formats: Dict[str, int] = {}
+        for sender in senders:
+            formats[sender.wire_format] = formats.get(sender.wire_format, 0) + 1
+        send_seconds = sum(sender.send_seconds_total for sender in senders)
+        metrics = {
+            "connections": len(senders),
+            "queue_capacity": self.send_queue_size,
+            "queue_depth_total": sum(depths),
+            "queue_depth_max": max(depths, default=0),
+            "messages_sent": sent,
+            "bytes_sent": sum(sender.bytes_sent for sender in senders),
+            "wire_formats": formats,
+            "send_latency_avg_ms": round(send_seconds / sent * 1000, 3) if sent else 0.0,
+            "send_latency_max_ms": round(
+                max((sender.send_seconds_max for sender in senders), default=0.0) * 1000, 3
+            ),
         }
+        if organization_id is None:
+            metrics["evicted_connections"] = self.evicted_connections
+        return metrics
 
 
 # Global WebSocket manager instance
-websocket_manager = WebSocketConnectionManager()
+websocket_manager = WebSocketConnectionManager(
+    create_broker(settings.WEBSOCKET_BROKER, settings.REDIS_URL),
+    replay_buffer=create_replay_buffer(
+        settings.WEBSOCKET_BROKER, settings.REDIS_URL, settings.WEBSOCKET_REPLAY_BUFFER_SIZE
+    ),
+    presence=create_presence(
+        settings.WEBSOCKET_BROKER, settings.REDIS_URL, settings.WEBSOCKET_PRESENCE_TTL_SECONDS
+    ),
+)
@@ -0,0 +1,275 @@
+"""WebSocket Presence for organization-wide online users.
+
+Tracks who is connected with incremental counters; the Redis backend shares
+it across processes with heartbeat-refreshed TTL entries.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Dict, List, Optional, Set, cast
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+
+class LocalPresence:
+    """Presence of this process's connections, updated in O(1) per event.
+
+    Entries: {org_id: {user_id: {user_info, connected_at, last_seen, connections}}}
+    plus a connection counter per organization, so joins and leaves never
+    rescan the room.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty presence."""
+        self.entries: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.connection_counts: Dict[str, int] = {}
+
+    def join(self, organization_id: str, user_id: str, user_info: Dict[str, Any]) -> None:
+        """Record a new connection of the user."""
+        users = self.entries.setdefault(organization_id, {})
+        now = datetime.utcnow().isoformat()
+        entry = users.setdefault(
+            user_id, {"user_info": user_info, "connected_at": now, "connections": 0}
+        )
+        entry["user_info"] = user_info
+        entry["last_seen"] = now
+        entry["connections"] += 1
+        self.connection_counts[organization_id] = self.connection_counts.get(organization_id, 0) + 1
+
+    def leave(self, organization_id: str, user_id: str) -> bool:
+        """Record a closed connection; True when the user has none left here."""
+        users = self.entries.get(organization_id, {})
+        entry = users.get(user_id)
+        if entry is None:
+            return False
+
+        entry["connections"] -= 1
+        self.connection_counts[organization_id] -= 1
+        if entry["connections"] > 0:
+            return False
+
+        del users[user_id]
+        if not users:
+            self.entries.pop(organization_id, None)
+            self.connection_counts.pop(organization_id, None)
+        return True
+
+    def touch(self, organization_id: str, user_id: str) -> None:
+        """Mark the user as seen now (any client message counts)."""
+        entry = self.entries.get(organization_id, {}).get(user_id)
+        if entry is not None:
+            entry["last_seen"] = datetime.utcnow().isoformat()
+
+    def user_info(self, organization_id: str, user_id: str) -> Dict[str, Any]:
+        """User info recorded at join (empty when unknown)."""
+        return self.entries.get(organization_id, {}).get(user_id, {}).get("user_info", {})
+
+    def local_counts(self, organization_id: str) -> Dict[str, int]:
+        """Online users and connections on this process."""
+        return {
+            "online_users": len(self.entries.get(organization_id, {})),
+            "connections": self.connection_counts.get(organization_id, 0),
+        }
+
+    def local_users(self, organization_id: str) -> List[Dict[str, Any]]:
+        """This process's online users."""
+        return [
+            _user_view(user_id, entry)
+            for user_id, entry in self.entries.get(organization_id, {}).items()
+        ]
+
+    async def users(self, organization_id: str) -> List[Dict[str, Any]]:
+        """Online users of the organization (this process is the whole cluster here)."""
+        return self.local_users(organization_id)
+
+    async def close(self) -> None:
+        """Release presence resources."""
+
+
+class RedisPresence(LocalPresence):
+    """Cluster presence: each process mirrors its local entries into Redis.
+
+    Per organization, a sorted set scores "<process>|<user>" members by
+    expiry and a hash holds their entries. Every process re-publishes its
+    entries each heartbeat, so a crashed process's users expire after the
+    TTL instead of lingering.
+    """
+
+    KEY_PREFIX = "ws:presence:"
+
+    def __init__(self, client: redis.Redis, ttl_seconds: int = 60) -> None:
+        """Initialize presence on a Redis client; the heartbeat starts with the first join."""
+        super().__init__()
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.process_id = uuid.uuid4().hex
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Task] = set()
+
+    def _keys(self, organization_id: str) -> tuple[str, str]:
+        """(expiry sorted set, entry hash) keys of an organization."""
+        prefix = f"{self.KEY_PREFIX}{organization_id}"
+        return f"{prefix}:seen", f"{prefix}:users"
+
+    def _member(self, user_id: str) -> str:
+        """This process's member for a user."""
+        return f"{self.process_id}|{user_id}"
+
+    def _schedule(self, coro) -> None:
+        """Run a Redis write in the background (joins and leaves are sync)."""
+        try:
+            task = asyncio.get_event_loop().create_task(coro)
+        except Exception as e:
+            coro.close()
+            logger.error("Failed to schedule presence update", extra={"error": str(e)})
+            return
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def join(self, organization_id: str, user_id: str, user_info: Dict[str, Any]) -> None:
+        """Record a connection and publish the user's entry right away."""
+        super().join(organization_id, user_id, user_info)
+        self._schedule(self._publish(organization_id, [user_id]))
+        if self._heartbeat is None or self._heartbeat.done():
+            self._heartbeat = asyncio.get_event_loop().create_task(self._heartbeat_loop())
+
+    def leave(self, organization_id: str, user_id: str) -> bool:
+        """Record a closed connection; withdraw the entry once the user has none here."""
+        gone = super().leave(organization_id, user_id)
+        if gone:
+            self._schedule(self._withdraw(organization_id, user_id))
+        else:
+            self._schedule(self._publish(organization_id, [user_id]))
+        return gone
+
+    async def _publish(self, organization_id: str, user_ids: List[str]) -> None:
+        """Write this process's entries for users and push their expiry forward."""
+        users = self.entries.get(organization_id, {})
+        entries = {
+            self._member(user_id): users[user_id] for user_id in user_ids if user_id in users
+        }
+        if not entries:
+            return
+
+        seen_key, users_key = self._keys(organization_id)
+        expires_at = time.time() + self.ttl_seconds
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.zadd(seen_key, {member: expires_at for member in entries})
+                pipe.hset(
+                    users_key,
+                    mapping={member: json.dumps(entry) for member, entry in entries.items()},
+                )
+                pipe.expire(seen_key, self.ttl_seconds * 2)
+                pipe.expire(users_key, self.ttl_seconds * 2)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(
+                "Failed to publish presence",
+                extra={"organization_id": organization_id, "error": str(e)},
+            )
+
+    async def _withdraw(self, organization_id: str, user_id: str) -> None:
+        """Remove this process's entry for a user."""
+        # The user may have reconnected here before this ran
+        if user_id in self.entries.get(organization_id, {}):
+            return
+
+        seen_key, users_key = self._keys(organization_id)
+        member = self._member(user_id)
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.zrem(seen_key, member)
+                # redis-py's stubs type hdel's keys as lists
+                pipe.hdel(users_key, cast(Any, member))
+                await pipe.execute()
+        except Exception as e:
+            logger.error(
+                "Failed to withdraw presence",
+                extra={"organization_id": organization_id, "error": str(e)},
+            )
+
+    async def _heartbeat_loop(self) -> None:
+        """Refresh every local entry a few times per TTL until no one is connected."""
+        while self.entries:
+            await asyncio.sleep(self.ttl_seconds / 3)
+            for organization_id, users in list(self.entries.items()):
+                await self._publish(organization_id, list(users))
+
+    async def users(self, organization_id: str) -> List[Dict[str, Any]]:
+        """Online users across all processes (falls back to the local mirror)."""
+        seen_key, users_key = self._keys(organization_id)
+        now = time.time()
+        try:
+            members = await self.client.zrangebyscore(seen_key, now, "+inf")
+            stale = await self.client.zrangebyscore(seen_key, "-inf", f"({now}")
+            if stale:
+                async with self.client.pipeline(transaction=False) as pipe:
+                    pipe.zrem(seen_key, *stale)
+                    pipe.hdel(users_key, *stale)
+                    await pipe.execute()
+            raw_entries: List[Any] = []
+            if members:
+                # The asyncio client's hmget is typed for the sync and async clients alike
+                raw_entries = await cast(
+                    Awaitable[List[Any]], self.client.hmget(users_key, members)
+                )
+        except Exception as e:
+            logger.error(
+                "Failed to read cluster presence",
+                extra={"organization_id": organization_id, "error": str(e)},
+            )
+            return self.local_users(organization_id)
+
+        # Merge one user's entries from several processes
+        merged: Dict[str, Dict[str, Any]] = {}
+        for member, raw in zip(members, raw_entries):
+            if raw is None:
+                continue
+            user_id = _text(member).split("|", 1)[1]
+            entry = json.loads(_text(raw))
+            current = merged.get(user_id)
+            if current is None:
+                merged[user_id] = entry
+                continue
+            current["connections"] += entry["connections"]
+            current["connected_at"] = min(current["connected_at"], entry["connected_at"])
+            current["last_seen"] = max(current["last_seen"], entry["last_seen"])
+
+        return [_user_view(user_id, entry) for user_id, entry in merged.items()]
+
+    async def close(self) -> None:
+        """Stop the heartbeat and close the Redis connection pool."""
+        if self._heartbeat:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+        await self.client.aclose()
+
+
+def _user_view(user_id: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Public shape of an online user."""
+    return {
+        "user_id": user_id,
+        "last_seen": entry["last_seen"],
+        "connected_at": entry["connected_at"],
+        "connections": entry["connections"],
+        **entry["user_info"],
+    }
+
+
+def _text(value) -> str:
+    """Decode a Redis reply that may be bytes."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def create_presence(backend: str, redis_url: str, ttl_seconds: int) -> LocalPresence:
+    """Build the presence store matching the broker backend ("memory" or "redis")."""
+    if backend == "redis":
+        return RedisPresence(redis.Redis.from_url(redis_url, decode_responses=True), ttl_seconds)
+    return LocalPresence()
@@ -0,0 +1,192 @@
+"""WebSocket Replay Buffer for resumable event streams.
+
+Numbers organization events and keeps the most recent ones so a client that
+reconnects can be sent exactly what it missed. Numbering, buffering and
+publishing an event are a single step, so sequences arrive in order.
+"""
+
+import asyncio
+import json
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+
+from api.core.websocket_broker import RedisBroker, WebSocketBroker
+
+# KEYS: seq, events; ARGV: envelope, buffer size, ttl, channel ("" to skip publishing)
+APPEND_SCRIPT = """
+local seq = redis.call('INCR', KEYS[1])
+local envelope = string.sub(ARGV[1], 1, -2) .. ', "seq": ' .. seq .. '}'
+redis.call('ZADD', KEYS[2], seq, envelope)
+redis.call('ZREMRANGEBYRANK', KEYS[2], 0, -(tonumber(ARGV[2]) + 1))
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+if ARGV[4] ~= '' then
+    redis.call('PUBLISH', ARGV[4], envelope)
+end
+return seq
+"""
+
+
+class ReplayBuffer(ABC):
+    """Per-organization event sequence plus a bounded window of recent events.
+
+    Sequence numbers are monotonic within a stream; the stream id changes
+    whenever the sequence is reset (e.g. an in-memory buffer restarts), so a
+    client's cursor from an older stream is never mistaken for a current one.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize buffer keeping the last `size` events per organization."""
+        self.size = size
+
+    @abstractmethod
+    async def publish(self, organization_id: str, envelope: str, broker: WebSocketBroker) -> int:
+        """Number a broker envelope with the next sequence, keep it and publish it.
+
+        The three happen as one step per organization, so every process
+        receives the organization's events in sequence order. The envelope
+        (a JSON object) gets the sequence as its last `seq` field; returns it.
+        """
+
+    @abstractmethod
+    async def position(self, organization_id: str) -> Tuple[str, int]:
+        """Current (stream id, latest sequence) of the organization."""
+
+    @abstractmethod
+    async def since(self, organization_id: str, stream: str, after_seq: int) -> Optional[List[str]]:
+        """Events after `after_seq`, oldest first.
+
+        None when the cursor can't be resumed: another stream, or events
+        after it have already left the buffer (full resync needed).
+        """
+
+    async def close(self) -> None:
+        """Release buffer resources."""
+
+
+class InMemoryReplayBuffer(ReplayBuffer):
+    """Single-process buffer; a restart starts a new stream."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize empty buffers under a fresh stream id."""
+        super().__init__(size)
+        self.stream = uuid.uuid4().hex
+        self._sequences: Dict[str, int] = {}
+        self._events: Dict[str, Deque[Tuple[int, str]]] = {}
+
+    async def publish(self, organization_id: str, envelope: str, broker: WebSocketBroker) -> int:
+        """Number, keep and publish an envelope (no other event runs in between)."""
+        seq = self._sequences.get(organization_id, 0) + 1
+        self._sequences[organization_id] = seq
+        data = _numbered(envelope, seq)
+        events = self._events.setdefault(organization_id, deque(maxlen=self.size))
+        events.append((seq, data))
+        await broker.publish(organization_id, data)
+        return seq
+
+    async def position(self, organization_id: str) -> Tuple[str, int]:
+        """Current (stream id, latest sequence) of the organization."""
+        return self.stream, self._sequences.get(organization_id, 0)
+
+    async def since(self, organization_id: str, stream: str, after_seq: int) -> Optional[List[str]]:
+        """Events after `after_seq`, or None when a full resync is needed."""
+        latest = self._sequences.get(organization_id, 0)
+        if stream != self.stream or after_seq > latest:
+            return None
+        if after_seq == latest:
+            return []
+
+        events = [
+            (seq, data) for seq, data in self._events.get(organization_id, ()) if seq > after_seq
+        ]
+        return _contiguous(events, after_seq)
+
+
+class RedisReplayBuffer(ReplayBuffer):
+    """Shared buffer: INCR sequence plus a sorted set of events scored by sequence."""
+
+    KEY_PREFIX = "ws:replay:"
+
+    def __init__(self, client: redis.Redis, size: int, ttl_seconds: int = 86400) -> None:
+        """Initialize buffer on a Redis client; idle organizations expire after `ttl_seconds`."""
+        super().__init__(size)
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self._append = client.register_script(APPEND_SCRIPT)
+
+    def _key(self, organization_id: str, name: str) -> str:
+        """Redis key for one of the organization's replay structures."""
+        return f"{self.KEY_PREFIX}{organization_id}:{name}"
+
+    async def publish(self, organization_id: str, envelope: str, broker: WebSocketBroker) -> int:
+        """Number, keep and publish an envelope in one Lua script.
+
+        With the Redis broker the script publishes on its channel as well,
+        so processes can't publish an organization's events out of order.
+        """
+        channel = broker.channel(organization_id) if isinstance(broker, RedisBroker) else ""
+        seq = int(
+            await self._append(
+                keys=[self._key(organization_id, "seq"), self._key(organization_id, "events")],
+                args=[envelope, self.size, self.ttl_seconds, channel],
+            )
+        )
+        if not channel:
+            await broker.publish(organization_id, _numbered(envelope, seq))
+        return seq
+
+    async def position(self, organization_id: str) -> Tuple[str, int]:
+        """Current (stream id, latest sequence) of the organization."""
+        stream_key = self._key(organization_id, "stream")
+        # The stream id is created once; losing it (and the sequence) starts a new stream
+        await self.client.set(stream_key, uuid.uuid4().hex, nx=True)
+        stream, latest = await asyncio.gather(
+            self.client.get(stream_key), self.client.get(self._key(organization_id, "seq"))
+        )
+        return _text(stream), int(latest or 0)
+
+    async def since(self, organization_id: str, stream: str, after_seq: int) -> Optional[List[str]]:
+        """Events after `after_seq`, or None when a full resync is needed."""
+        current_stream, latest = await self.position(organization_id)
+        if stream != current_stream or after_seq > latest:
+            return None
+        if after_seq == latest:
+            return []
+
+        members = await self.client.zrangebyscore(
+            self._key(organization_id, "events"), f"({after_seq}", "+inf"
+        )
+        events = [(json.loads(_text(member))["seq"], _text(member)) for member in members]
+        return _contiguous(events, after_seq)
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self.client.aclose()
+
+
+def _numbered(envelope: str, seq: int) -> str:
+    """Envelope JSON with `seq` added as its last field (as APPEND_SCRIPT does)."""
+    return f'{envelope[:-1]}, "seq": {seq}}}'
+
+
+def _contiguous(events: List[Tuple[int, str]], after_seq: int) -> Optional[List[str]]:
+    """Event data if sequences run unbroken from `after_seq + 1`, else None."""
+    for expected, (seq, _) in enumerate(events, start=after_seq + 1):
+        if seq != expected:
+            return None
+    return [data for _, data in events] if events else None
+
+
+def _text(value) -> str:
+    """Decode a Redis reply that may be bytes."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def create_replay_buffer(backend: str, redis_url: str, size: int) -> ReplayBuffer:
+    """Build the replay buffer matching the broker backend ("memory" or "redis")."""
+    if backend == "redis":
+        return RedisReplayBuffer(redis.Redis.from_url(redis_url, decode_responses=True), size)
+    return InMemoryReplayBuffer(size)
@@ -1,5 +1,6 @@
 """FastAPI application main module with middleware and route configuration."""
-from typing import Any, Dict
+import asyncio
+from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
@@ -54,12 +55,15 @@ except ImportError:
 from api.routers.auth import router as auth_router
 from api.routers.billing import router as billing_router
 from api.routers.crm_leads import router as crm_leads_router
+from api.routers.events import router as events_router
 from api.routers.invites import router as invites_router
 from api.routers.organizations import router as organizations_router
 from api.routers.roles import router as roles_router
 from api.routers.user_preferences import router as user_preferences_router
 from api.routers.users import router as users_router
 from api.routers.websocket import router as websocket_router
+from api.services.crm_lead_archive_service import lead_maintenance_loop
+from api.services.crm_lead_event_relay import lead_event_relay
 
 # Setup logging and monitoring before creating the app
 setup_logging()
@@ -374,6 +378,14 @@ async def database_info() -> Dict[str, Any]:
         }
 
 
+@app.get("/websocket/info")
+async def websocket_info() -> Dict[str, Any]:
+    """Get WebSocket delivery metrics of this process for monitoring."""
+    from api.core.websocket_manager import websocket_manager
+
+    return websocket_manager.get_delivery_metrics()
+
+
 @app.get("/")
 async def root() -> Dict[str, str]:
     """Root endpoint returning API information."""
@@ -383,9 +395,14 @@ async def root() -> Dict[str, str]:
         "docs": "/docs",
         "health": "/health",
         "database": "/database/info",
+        "websocket": "/websocket/info",
     }
 
 
+lead_maintenance_task: Optional[asyncio.Task] = None
+lead_event_relay_task: Optional[asyncio.Task] = None
+
+
 @app.on_event("startup")
 async def startup_event() -> None:
     """Initialize services on startup with FAIL-FAST validation."""
@@ -420,6 +437,15 @@ async def startup_event() -> None:
     # Note: Database migrations are handled via ./migrate script
     # Run './migrate check' to see pending migrations
 
+    # Background lead maintenance (archival + tombstone purge)
+    global lead_maintenance_task
+    if settings.LEAD_MAINTENANCE_INTERVAL_SECONDS > 0:
+        lead_maintenance_task = asyncio.create_task(lead_maintenance_loop())
+
+    # Lead outbox relay (publishes committed lead changes)
+    global lead_event_relay_task
+    lead_event_relay_task = asyncio.create_task(lead_event_relay.run())
+
     logger.info("Application startup complete")
 
 
@@ -428,7 +454,14 @@ async def shutdown_event() -> None:
     """Cleanup services on shutdown."""
     logger.info("Shutting down application services")
 
-    pass  # Services initialization placeholder
+    if lead_maintenance_task:
+        lead_maintenance_task.cancel()
+    if lead_event_relay_task:
+        lead_event_relay_task.cancel()
+
+    from api.core.websocket_manager import websocket_manager
+
+    await websocket_manager.close()
 
     logger.info("Application shutdown complete")
 
@@ -455,5 +488,6 @@ app.include_router(roles_router)  # Advanced role management
 app.include_router(invites_router)  # Public invite endpoints
 app.include_router(crm_leads_router)  # CRM Leads management
 app.include_router(websocket_router)  # Real-time collaboration
+app.include_router(events_router)  # Server-Sent Events fallback for real-time events
 
 # Note: Removed app mounting to avoid route conflicts
@@ -8,6 +8,13 @@ from .crm_file_attachment import FileAttachment, StorageType
 
 # CRM business models (YOUR EXTENSION)
 from .crm_lead import Lead, PipelineStage
+from .crm_lead_archive import ArchivedCommunication, ArchivedLead
+from .crm_lead_custom_fields import LeadCustomFields
+from .crm_lead_duplicate import LeadDuplicateCluster
+from .crm_lead_event import LeadOutboxEvent
+from .crm_lead_note import LeadNote, LeadNoteKind
+from .crm_lead_tag import LeadTag
+from .crm_lead_tombstone import LeadTombstone
 from .crm_organization_integration import (
     IntegrationProvider,
     IntegrationStatus,
@@ -36,6 +43,15 @@ __all__ = [
     # CRM business models
     "Lead",
     "PipelineStage",
+    "LeadTag",
+    "LeadTombstone",
+    "LeadDuplicateCluster",
+    "LeadNote",
+    "LeadNoteKind",
+    "LeadCustomFields",
+    "ArchivedLead",
+    "ArchivedCommunication",
+    "LeadOutboxEvent",
     "Communication",
     "CommunicationChannel",
     "CommunicationDirection",
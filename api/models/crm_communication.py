@@ -94,7 +94,10 @@ class Communication(Base):
     organization = relationship("Organization", back_populates="communications")
     lead = relationship("Lead", back_populates="communications")
     file_attachments = relationship(
-        "FileAttachment", back_populates="communication", cascade="all, delete-orphan"
+        "FileAttachment",
+        back_populates="communication",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self):
@@ -10,21 +10,27 @@ from typing import List, Optional
 from uuid import UUID, uuid4
 
 from sqlalchemy import (
-    ARRAY,
     DECIMAL,
     UUID as SA_UUID,
     CheckConstraint,
     Column,
     DateTime,
     ForeignKey,
+    Index,
     String,
     Text,
+    literal,
+    select,
 )
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.orm import column_property, relationship, validates
 from sqlalchemy.sql import func
 
 from api.core.database import Base
+from api.core.utils import normalize_email, normalize_phone
+from api.models.crm_lead_note import LeadNote, LeadNoteKind
+
+_latest_note = LeadNote.__table__.alias("latest_note")
 
 
 class PipelineStage(str, Enum):
@@ -62,6 +68,10 @@ class Lead(Base):
     email: Optional[str] = Column(String(255), nullable=True, index=True)
     phone: Optional[str] = Column(String(50), nullable=True, index=True)
 
+    # Normalized contact keys (lowercase email, E.164 phone) for exact lookups
+    email_key: Optional[str] = Column(String(255), nullable=True)
+    phone_key: Optional[str] = Column(String(20), nullable=True)
+
     # Pipeline stage (core CRM functionality)
     stage: PipelineStage = Column(
         String(50), nullable=False, default=PipelineStage.LEAD, index=True
@@ -83,10 +93,6 @@ class Lead(Base):
     last_contact_at: Optional[datetime] = Column(DateTime(timezone=True), nullable=True)
     last_contact_channel: Optional[str] = Column(String(20), nullable=True)
 
-    # Additional information
-    notes: Optional[str] = Column(Text, nullable=True)
-    lead_metadata: dict = Column("lead_metadata", JSONB, nullable=False, default=dict)
-
     # Favorite functionality
     is_favorite: bool = Column("is_favorite", nullable=False, default=False, index=True)
 
@@ -113,16 +119,82 @@ class Lead(Base):
             name="leads_stage_check",
         ),
         # Composite indexes for performance
+        Index("idx_leads_tags_gin", "tags", postgresql_using="gin"),
+        Index("idx_leads_org_updated_id", "organization_id", "updated_at", "id"),
+        # Archival scan: closed leads by last update
+        Index(
+            "idx_leads_closed_updated",
+            "updated_at",
+            postgresql_where=stage == PipelineStage.FECHADO.value,
+        ),
+        Index(
+            "idx_leads_org_email_key",
+            "organization_id",
+            "email_key",
+            unique=True,
+            postgresql_where=email_key.isnot(None),
+        ),
+        Index(
+            "idx_leads_org_phone_key",
+            "organization_id",
+            "phone_key",
+            unique=True,
+            postgresql_where=phone_key.isnot(None),
+        ),
         {"extend_existing": True},
     )
 
+    # Current notes: entries since the latest NOTE (history lives in lead_notes)
+    notes = column_property(
+        select(
+            func.string_agg(
+                LeadNote.body, aggregate_order_by(literal("\n"), LeadNote.created_at, LeadNote.id)
+            )
+        )
+        .where(
+            LeadNote.lead_id == id,
+            LeadNote.body != "",
+            LeadNote.created_at
+            >= func.coalesce(
+                select(func.max(_latest_note.c.created_at))
+                .where(
+                    _latest_note.c.lead_id == LeadNote.lead_id,
+                    _latest_note.c.kind == LeadNoteKind.NOTE.value,
+                )
+                .scalar_subquery(),
+                literal("-infinity", DateTime(timezone=True)),
+            ),
+        )
+        .scalar_subquery(),
+        deferred=True,
+    )
+
     # Relationships
     organization = relationship("Organization", back_populates="leads")
     assigned_user = relationship("User", backref="assigned_leads")
     communications = relationship(
-        "Communication", back_populates="lead", cascade="all, delete-orphan"
+        "Communication", back_populates="lead", cascade="all, delete-orphan", passive_deletes=True
+    )
+    ai_summaries = relationship(
+        "AISummary", back_populates="lead", cascade="all, delete-orphan", passive_deletes=True
+    )
+    note_entries = relationship(LeadNote, lazy="write_only", passive_deletes=True)
+    custom_fields = relationship(
+        "LeadCustomFields",
+        back_populates="lead",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
-    ai_summaries = relationship("AISummary", back_populates="lead", cascade="all, delete-orphan")
+
+    @validates("email", "phone")
+    def _sync_contact_key(self, field: str, value: Optional[str]) -> Optional[str]:
+        """Keep email_key / phone_key in step with email / phone."""
+        if field == "email":
+            self.email_key = normalize_email(value)
+        else:
+            self.phone_key = normalize_phone(value)
+        return value
 
     def __repr__(self):
         """Return string representation of Lead."""
@@ -151,6 +223,22 @@ class Lead(Base):
         # TODO: Add business rules if needed
         return True
 
+    def add_note(
+        self,
+        body: str,
+        kind: LeadNoteKind = LeadNoteKind.NOTE,
+        created_by: Optional[UUID] = None,
+    ) -> LeadNote:
+        """Append a note entry (flushed with the lead, history is not loaded)."""
+        note = LeadNote(
+            organization_id=self.organization_id,
+            kind=kind.value,
+            body=body,
+            created_by=created_by,
+        )
+        self.note_entries.add(note)
+        return note
+
     def move_to_stage(self, new_stage: PipelineStage, notes: Optional[str] = None):
         """Move lead to new stage with optional notes."""
         if self.can_move_to_stage(new_stage):
@@ -159,9 +247,9 @@ class Lead(Base):
             self.updated_at = func.now()
 
             if notes:
-                if self.notes:
-                    self.notes += f"\n[{datetime.now()}] Stage {old_stage} → {new_stage}: {notes}"
-                else:
-                    self.notes = f"[{datetime.now()}] Stage {old_stage} → {new_stage}: {notes}"
+                self.add_note(
+                    f"[{datetime.now()}] Stage {old_stage} → {new_stage}: {notes}",
+                    LeadNoteKind.STAGE_CHANGE,
+                )
         else:
             raise ValueError(f"Cannot move lead from {self.stage} to {new_stage}")
@@ -0,0 +1,109 @@
+"""CRM Lead Archive Models.
+
+Arquivo de leads fechados antigos e suas comunicações, fora das tabelas ativas.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    DECIMAL,
+    UUID as SA_UUID,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.sql import func
+
+from api.core.database import Base
+
+
+class ArchivedLead(Base):
+    """Lead moved out of `leads` by the archival job.
+
+    Mirrors the columns served by LeadResponse so archived rows can be
+    listed alongside active ones (`include_archived=true`). Custom fields,
+    note history and AI summaries are kept as JSON in `archived_data`.
+    """
+
+    __tablename__ = "archived_leads"
+
+    # Original lead ID
+    id: UUID = Column(SA_UUID(as_uuid=True), primary_key=True)
+
+    # Organizational isolation (CRITICAL)
+    organization_id: UUID = Column(
+        SA_UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    name: str = Column(String(255), nullable=False)
+    email: Optional[str] = Column(String(255), nullable=True)
+    phone: Optional[str] = Column(String(50), nullable=True)
+    email_key: Optional[str] = Column(String(255), nullable=True)
+    phone_key: Optional[str] = Column(String(20), nullable=True)
+    stage: str = Column(String(50), nullable=False)
+    source: Optional[str] = Column(String(100), nullable=True)
+    estimated_value: Optional[Decimal] = Column(DECIMAL(12, 2), nullable=True)
+    tags: Optional[List[str]] = Column(ARRAY(Text), nullable=True)
+    notes: Optional[str] = Column(Text, nullable=True)
+    assigned_user_id: Optional[UUID] = Column(SA_UUID(as_uuid=True), nullable=True)
+    last_contact_at: Optional[datetime] = Column(DateTime(timezone=True), nullable=True)
+    last_contact_channel: Optional[str] = Column(String(20), nullable=True)
+    is_favorite: bool = Column(Boolean, nullable=False, default=False)
+    created_at: datetime = Column(DateTime(timezone=True), nullable=False)
+    updated_at: datetime = Column(DateTime(timezone=True), nullable=False)
+
+    archived_data: Dict[str, Any] = Column(JSONB, nullable=False, default=dict)
+    archived_at: datetime = Column(DateTime(timezone=True), nullable=False, default=func.now())
+
+    __table_args__ = (
+        Index("idx_archived_leads_org_created", "organization_id", "created_at"),
+        {"extend_existing": True},
+    )
+
+    def __repr__(self):
+        """Return string representation of ArchivedLead."""
+        return f"<ArchivedLead(id={self.id}, name='{self.name}', org_id={self.organization_id})>"
+
+
+class ArchivedCommunication(Base):
+    """Communication of an archived lead, stored as its original row (JSON).
+
+    File attachment rows are embedded in `payload`; the stored files are
+    left untouched.
+    """
+
+    __tablename__ = "archived_communications"
+
+    # Original communication ID
+    id: UUID = Column(SA_UUID(as_uuid=True), primary_key=True)
+
+    # Organizational isolation (CRITICAL)
+    organization_id: UUID = Column(
+        SA_UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    lead_id: UUID = Column(SA_UUID(as_uuid=True), nullable=False)
+    payload: Dict[str, Any] = Column(JSONB, nullable=False)
+    created_at: datetime = Column(DateTime(timezone=True), nullable=False)
+    archived_at: datetime = Column(DateTime(timezone=True), nullable=False, default=func.now())
+
+    __table_args__ = (
+        Index("idx_archived_communications_lead", "lead_id", "created_at"),
+        {"extend_existing": True},
+    )
+
+    def __repr__(self):
+        """Return string representation of ArchivedCommunication."""
+        return f"<ArchivedCommunication(id={self.id}, lead_id={self.lead_id})>"
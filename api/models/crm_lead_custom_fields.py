@@ -0,0 +1,52 @@
+"""CRM Lead Custom Fields Model.
+
+Campos personalizados do lead, fora da tabela principal.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import UUID as SA_UUID, Column, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from api.core.database import Base
+
+
+class LeadCustomFields(Base):
+    """Custom fields of a lead (one row per lead that has any).
+
+    Kept out of `leads` so pipeline scans read narrow rows.
+    """
+
+    __tablename__ = "lead_custom_fields"
+
+    lead_id: UUID = Column(
+        SA_UUID(as_uuid=True), ForeignKey("leads.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Organizational isolation (CRITICAL)
+    organization_id: UUID = Column(
+        SA_UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    fields: dict = Column(JSONB, nullable=False, default=dict)
+
+    updated_at: datetime = Column(
+        DateTime(timezone=True), nullable=False, default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        Index("idx_lead_custom_fields_org", "organization_id"),
+        {"extend_existing": True},
+    )
+
+    # Relationships
+    lead = relationship("Lead", back_populates="custom_fields")
+
+    def __repr__(self):
+        """Return string representation of LeadCustomFields."""
+        return f"<LeadCustomFields(lead_id={self.lead_id}, org_id={self.organization_id})>"
@@ -0,0 +1,53 @@
+"""CRM Lead Duplicate Cluster Model.
+
+Grupos de leads candidatos a duplicidade por organização.
+"""
+
+from datetime import datetime
+from typing import List
+from uuid import UUID, uuid4
+
+from sqlalchemy import UUID as SA_UUID, Column, DateTime, ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql import func
+
+from api.core.database import Base
+
+
+class LeadDuplicateCluster(Base):
+    """Candidate duplicate cluster found by the dedup scan.
+
+    Clusters are recomputed per organization by each scan and removed
+    once any of their leads is merged.
+    """
+
+    __tablename__ = "lead_duplicate_clusters"
+
+    # Primary key
+    id: UUID = Column(SA_UUID(as_uuid=True), primary_key=True, default=uuid4)
+
+    # Organizational isolation (CRITICAL)
+    organization_id: UUID = Column(
+        SA_UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # Leads in the cluster (oldest first) and the keys that linked them
+    lead_ids: List[UUID] = Column(ARRAY(SA_UUID(as_uuid=True)), nullable=False)
+    reasons: List[str] = Column(ARRAY(Text), nullable=False)
+
+    created_at: datetime = Column(DateTime(timezone=True), nullable=False, default=func.now())
+
+    __table_args__ = (
+        Index("idx_lead_duplicate_clusters_org", "organization_id"),
+        Index("idx_lead_duplicate_clusters_lead_ids", "lead_ids", postgresql_using="gin"),
+        {"extend_existing": True},
+    )
+
+    def __repr__(self):
+        """Return string representation of LeadDuplicateCluster."""
+        return (
+            f"<LeadDuplicateCluster(id={self.id}, size={len(self.lead_ids or [])}, "
+            f"org_id={self.organization_id})>"
+        )
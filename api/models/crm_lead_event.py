@@ -0,0 +1,48 @@
+"""CRM Lead Outbox Event Model.
+
+Eventos de alteração de leads gravados na mesma transação (transactional outbox).
+"""
+
+from datetime import datetime
+from typing import Any, Dict
+from uuid import UUID
+
+from sqlalchemy import UUID as SA_UUID, BigInteger, Column, DateTime, ForeignKey, Identity, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from api.core.database import Base
+
+
+class LeadOutboxEvent(Base):
+    """Lead change event waiting to be published.
+
+    Written in the same transaction as the lead change, so an event exists
+    if and only if the change committed. The relay publishes events in `id`
+    order and deletes them once delivered.
+    """
+
+    __tablename__ = "lead_outbox_events"
+
+    id: int = Column(BigInteger, Identity(), primary_key=True)
+
+    # Organizational isolation (CRITICAL)
+    organization_id: UUID = Column(
+        SA_UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    event_type: str = Column(String(50), nullable=False)
+    # Full message as delivered to subscribers
+    payload: Dict[str, Any] = Column(JSONB, nullable=False)
+
+    created_at: datetime = Column(
+        DateTime(timezone=True), nullable=False, default=func.clock_timestamp()
+    )
+
+    __table_args__ = ({"extend_existing": True},)
+
+    def __repr__(self):
+        """Return string representation of LeadOutboxEvent."""
+        return f"<LeadOutboxEvent(id={self.id}, type='{self.event_type}', org_id={self.organization_id})>"
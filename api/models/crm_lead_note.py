@@ -0,0 +1,79 @@
+"""CRM Lead Note Model.
+
+Histórico append-only de notas do lead, fora da tabela principal.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    UUID as SA_UUID,
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+)
+from sqlalchemy.sql import func
+
+from api.core.database import Base
+
+
+class LeadNoteKind(str, Enum):
+    """Kinds of lead note entries."""
+
+    NOTE = "note"  # Free-text notes; the latest one starts the lead's current notes
+    STAGE_CHANGE = "stage_change"  # Appended to the current notes on stage moves
+
+
+class LeadNote(Base):
+    """Append-only note entry of a lead.
+
+    Notes are never updated in place: editing a lead's notes appends a new
+    NOTE entry, and stage changes append STAGE_CHANGE entries. The lead's
+    `notes` field is derived from the entries since its latest NOTE.
+    """
+
+    __tablename__ = "lead_notes"
+
+    # Primary key
+    id: UUID = Column(SA_UUID(as_uuid=True), primary_key=True, default=uuid4)
+
+    # Organizational isolation (CRITICAL)
+    organization_id: UUID = Column(
+        SA_UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    lead_id: UUID = Column(
+        SA_UUID(as_uuid=True), ForeignKey("leads.id", ondelete="CASCADE"), nullable=False
+    )
+    kind: LeadNoteKind = Column(String(20), nullable=False, default=LeadNoteKind.NOTE.value)
+    body: str = Column(Text, nullable=False)
+    created_by: Optional[UUID] = Column(
+        SA_UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+    )
+
+    # clock_timestamp() keeps entries of one transaction in append order
+    created_at: datetime = Column(
+        DateTime(timezone=True), nullable=False, default=func.clock_timestamp()
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            kind.in_([LeadNoteKind.NOTE.value, LeadNoteKind.STAGE_CHANGE.value]),
+            name="lead_notes_kind_check",
+        ),
+        # Keyset pagination per lead: WHERE lead_id = ? ORDER BY created_at DESC, id DESC
+        Index("idx_lead_notes_lead_created_id", "lead_id", "created_at", "id"),
+        {"extend_existing": True},
+    )
+
+    def __repr__(self):
+        """Return string representation of LeadNote."""
+        return f"<LeadNote(id={self.id}, lead_id={self.lead_id}, kind='{self.kind}')>"
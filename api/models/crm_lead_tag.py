@@ -0,0 +1,57 @@
+"""CRM Lead Tag Dictionary Model.
+
+Dicionário de tags por organização com contagem de uso.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import UUID as SA_UUID, Column, DateTime, ForeignKey, Index, Integer, Text
+from sqlalchemy.sql import func
+
+from api.core.database import Base
+
+
+class LeadTag(Base):
+    """Per-organization tag dictionary.
+
+    Maintained on write by database triggers on the leads table
+    (see migrations/002_lead_tags_dictionary.sql), so filter dropdowns
+    and tag autocomplete never have to scan lead rows.
+    """
+
+    __tablename__ = "lead_tags"
+
+    # Organizational isolation (CRITICAL)
+    organization_id: UUID = Column(
+        SA_UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    tag: str = Column(Text, primary_key=True)
+
+    # Number of leads currently carrying this tag
+    usage_count: int = Column(Integer, nullable=False, default=0)
+
+    # Timestamps
+    updated_at: datetime = Column(
+        DateTime(timezone=True), nullable=False, default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_lead_tags_org_tag_prefix",
+            "organization_id",
+            "tag",
+            postgresql_ops={"tag": "text_pattern_ops"},
+            postgresql_include=["usage_count"],
+        ),
+        {"extend_existing": True},
+    )
+
+    def __repr__(self):
+        """Return string representation of LeadTag."""
+        return (
+            f"<LeadTag(org_id={self.organization_id}, tag='{self.tag}', "
+            f"usage_count={self.usage_count})>"
+        )
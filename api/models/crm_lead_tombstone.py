@@ -0,0 +1,43 @@
+"""CRM Lead Tombstone Model.
+
+Registro de leads removidos para sincronização incremental.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import UUID as SA_UUID, Column, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+
+from api.core.database import Base
+
+
+class LeadTombstone(Base):
+    """Tombstone left behind by a deleted lead.
+
+    Lets delta-sync clients learn about deletions since their cursor.
+    Tombstones are purged after LEAD_TOMBSTONE_RETENTION_DAYS.
+    """
+
+    __tablename__ = "lead_tombstones"
+
+    # Deleted lead ID (no FK: the lead row is gone)
+    lead_id: UUID = Column(SA_UUID(as_uuid=True), primary_key=True)
+
+    # Organizational isolation (CRITICAL)
+    organization_id: UUID = Column(
+        SA_UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    deleted_at: datetime = Column(DateTime(timezone=True), nullable=False, default=func.now())
+
+    __table_args__ = (
+        Index("idx_lead_tombstones_org_deleted", "organization_id", "deleted_at", "lead_id"),
+        {"extend_existing": True},
+    )
+
+    def __repr__(self):
+        """Return string representation of LeadTombstone."""
+        return f"<LeadTombstone(lead_id={self.lead_id}, org_id={self.organization_id})>"
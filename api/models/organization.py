@@ -26,31 +26,56 @@ class Organization(Base):
 
     # Settings
     is_active = Column(Boolean, default=True)
+    # Set only when the organization is deleted; the chunked purge removes the row last
+    purge_requested_at = Column(DateTime(timezone=True), nullable=True)
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    members = relationship("OrganizationMember", back_populates="organization")
-    invites = relationship("OrganizationInvite", back_populates="organization")
+    # passive_deletes: children are removed by ON DELETE CASCADE in the database
+    # (or by the chunked purge job), never loaded into the session on delete.
+    members = relationship(
+        "OrganizationMember", back_populates="organization", passive_deletes=True
+    )
+    invites = relationship(
+        "OrganizationInvite", back_populates="organization", passive_deletes=True
+    )
 
     # CRM Relationships
-    leads = relationship("Lead", back_populates="organization", cascade="all, delete-orphan")
+    leads = relationship(
+        "Lead", back_populates="organization", cascade="all, delete-orphan", passive_deletes=True
+    )
     communications = relationship(
-        "Communication", back_populates="organization", cascade="all, delete-orphan"
+        "Communication",
+        back_populates="organization",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     ai_summaries = relationship(
-        "AISummary", back_populates="organization", cascade="all, delete-orphan"
+        "AISummary",
+        back_populates="organization",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     integrations = relationship(
-        "OrganizationIntegration", back_populates="organization", cascade="all, delete-orphan"
+        "OrganizationIntegration",
+        back_populates="organization",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     file_attachments = relationship(
-        "FileAttachment", back_populates="organization", cascade="all, delete-orphan"
+        "FileAttachment",
+        back_populates="organization",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     audit_logs = relationship(
-        "AuditLog", back_populates="organization", cascade="all, delete-orphan"
+        "AuditLog",
+        back_populates="organization",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     # Performance indexes
@@ -76,7 +101,9 @@ class OrganizationMember(Base):
     __tablename__ = "organization_members"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
+    organization_id = Column(
+        UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
+    )
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
     # Role field for compatibility with services
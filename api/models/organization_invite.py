@@ -39,7 +39,10 @@ class OrganizationInvite(Base):
     # Primary fields
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     organization_id = Column(
-        UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False, index=True
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     invited_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
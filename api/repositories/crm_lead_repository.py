@@ -3,15 +3,78 @@
 Repository pattern for Lead entity with organizational isolation.
 """
 
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    DECIMAL,
+    Column,
+    Integer,
+    MetaData,
+    Row,
+    String,
+    Table,
+    Text,
+    and_,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    JSONB,
+    UUID as PG_UUID,
+    aggregate_order_by,
+    insert as pg_insert,
+)
+from sqlalchemy.orm import Session, aliased, undefer
 
+from api.models.crm_ai_summary import AISummary
+from api.models.crm_audit_log import AuditAction, AuditLog
+from api.models.crm_communication import Communication
+from api.models.crm_file_attachment import FileAttachment
 from api.models.crm_lead import Lead, PipelineStage
+from api.models.crm_lead_archive import ArchivedCommunication, ArchivedLead
+from api.models.crm_lead_custom_fields import LeadCustomFields
+from api.models.crm_lead_duplicate import LeadDuplicateCluster
+from api.models.crm_lead_event import LeadOutboxEvent
+from api.models.crm_lead_note import LeadNote, LeadNoteKind
+from api.models.crm_lead_tag import LeadTag
+from api.models.crm_lead_tombstone import LeadTombstone
 from api.repositories.base import SQLRepository
 
+# Per-transaction staging table for bulk imports (dropped on commit)
+lead_import_staging = Table(
+    "lead_import_staging",
+    MetaData(),
+    Column("row_number", Integer, nullable=False),
+    Column("lead_id", PG_UUID(as_uuid=True), nullable=False),
+    Column("name", String(255), nullable=False),
+    Column("email", String(255)),
+    Column("phone", String(50)),
+    Column("email_key", String(255)),
+    Column("phone_key", String(50)),
+    Column("stage", String(50), nullable=False),
+    Column("source", String(100)),
+    Column("estimated_value", DECIMAL(12, 2)),
+    Column("tags", ARRAY(Text)),
+    Column("notes", Text),
+    Column("assigned_user_id", PG_UUID(as_uuid=True)),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
 
 class CRMLeadRepository(SQLRepository[Lead]):
     """Repository for Lead operations with organizational scope."""
@@ -20,6 +83,111 @@ class CRMLeadRepository(SQLRepository[Lead]):
         """Initialize repository with database session."""
         super().__init__(db, Lead)
 
+    def _row_column(self, field: str):
+        """Column expression for a lead row field; derived fields are computed in SQL."""
+        if field == "is_closed":
+            return Lead.stage == PipelineStage.FECHADO.value
+        if field == "days_in_current_stage":
+            return cast(func.date_part("day", func.now() - Lead.updated_at), Integer)
+        return getattr(Lead, field)
+
+    def _row_query(self, fields: Sequence[str]):
+        """Query selecting only the given fields as plain rows (no ORM instances)."""
+        return self.session.query(*[self._row_column(field).label(field) for field in fields])
+
+    def get_rows_query(self, org_id: UUID, fields: Sequence[str]):
+        """Org-scoped row query for callers that add their own filters and streaming."""
+        return self._row_query(fields).filter(Lead.organization_id == org_id)
+
+    def _archived_row_column(self, field: str):
+        """Archived-lead counterpart of `_row_column` (same labels and derivations)."""
+        if field == "is_closed":
+            return ArchivedLead.stage == PipelineStage.FECHADO.value
+        if field == "days_in_current_stage":
+            return cast(func.date_part("day", func.now() - ArchivedLead.updated_at), Integer)
+        return getattr(ArchivedLead, field)
+
+    def get_rows_with_archive(
+        self,
+        org_id: UUID,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100,
+        stage: Optional[PipelineStage] = None,
+    ) -> List[Row]:
+        """Get active and archived lead rows as one list (newest first).
+
+        Both sides are read through their own (organization_id, created_at)
+        indexes and merged with UNION ALL.
+        """
+        active = select(
+            *[self._row_column(field).label(field) for field in fields],
+            Lead.created_at.label("sort_key"),
+        ).where(Lead.organization_id == org_id)
+        archived = select(
+            *[self._archived_row_column(field).label(field) for field in fields],
+            ArchivedLead.created_at.label("sort_key"),
+        ).where(ArchivedLead.organization_id == org_id)
+        if stage:
+            active = active.where(Lead.stage == stage)
+            archived = archived.where(ArchivedLead.stage == stage)
+
+        rows = union_all(active, archived).subquery()
+        return self.session.execute(
+            select(*[rows.c[field] for field in fields])
+            .order_by(rows.c.sort_key.desc())
+            .offset(skip)
+            .limit(limit)
+        ).all()
+
+    def count_archived(self, org_id: UUID, stage: Optional[PipelineStage] = None) -> int:
+        """Count archived leads for organization, optionally in one stage."""
+        query = self.session.query(func.count(ArchivedLead.id)).filter(
+            ArchivedLead.organization_id == org_id
+        )
+        if stage:
+            query = query.filter(ArchivedLead.stage == stage)
+        return query.scalar()
+
+    def get_rows_by_organization(
+        self,
+        org_id: UUID,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100,
+        stage: Optional[PipelineStage] = None,
+    ) -> List[Row]:
+        """Get lead rows for organization restricted to the given fields."""
+        query = self.get_rows_query(org_id, fields)
+        if stage:
+            query = query.filter(Lead.stage == stage)
+
+        return query.order_by(Lead.created_at.desc()).offset(skip).limit(limit).all()
+
+    def search_rows_by_organization(
+        self, org_id: UUID, query: str, fields: Sequence[str], skip: int = 0, limit: int = 20
+    ) -> List[Row]:
+        """Search lead rows by name, email or phone restricted to the given fields."""
+        search_filter = f"%{query.lower()}%"
+
+        return (
+            self._row_query(fields)
+            .filter(
+                and_(
+                    Lead.organization_id == org_id,
+                    or_(
+                        func.lower(Lead.name).like(search_filter),
+                        func.lower(Lead.email).like(search_filter),
+                        func.lower(Lead.phone).like(search_filter),
+                    ),
+                )
+            )
+            .order_by(Lead.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
     def get_by_organization(self, org_id: UUID, skip: int = 0, limit: int = 100) -> List[Lead]:
         """Get all leads for organization with pagination."""
         return (
@@ -31,15 +199,74 @@ class CRMLeadRepository(SQLRepository[Lead]):
             .all()
         )
 
-    def get_by_organization_and_stage(self, org_id: UUID, stage: PipelineStage) -> List[Lead]:
+    def get_by_organization_and_stage(
+        self, org_id: UUID, stage: PipelineStage, skip: int = 0, limit: Optional[int] = None
+    ) -> List[Lead]:
         """Get leads by organization and pipeline stage."""
-        return (
+        query = (
             self.session.query(Lead)
             .filter(and_(Lead.organization_id == org_id, Lead.stage == stage))
             .order_by(Lead.created_at.desc())
+            .offset(skip)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def count_by_organization_and_stage(self, org_id: UUID, stage: PipelineStage) -> int:
+        """Count leads by organization and pipeline stage."""
+        return (
+            self.session.query(func.count(Lead.id))
+            .filter(and_(Lead.organization_id == org_id, Lead.stage == stage))
+            .scalar()
+        )
+
+    def get_board(self, org_id: UUID, per_stage: int = 20) -> List[Tuple[Lead, int, object]]:
+        """Get the first leads of every stage with per-stage count and value sum.
+
+        Single round trip: window functions rank leads inside each stage and
+        compute the stage totals; only the top ``per_stage`` rows come back.
+        Rows are (lead, stage_count, stage_value) ordered by stage, then rank.
+        """
+        ranked = (
+            self.session.query(
+                Lead,
+                func.row_number()
+                .over(partition_by=Lead.stage, order_by=(Lead.updated_at.desc(), Lead.id.desc()))
+                .label("stage_rank"),
+                func.count(Lead.id).over(partition_by=Lead.stage).label("stage_count"),
+                func.coalesce(
+                    func.sum(Lead.estimated_value).over(partition_by=Lead.stage), 0
+                ).label("stage_value"),
+            )
+            .filter(Lead.organization_id == org_id)
+            .subquery()
+        )
+        ranked_lead = aliased(Lead, ranked)
+
+        return (
+            self.session.query(ranked_lead, ranked.c.stage_count, ranked.c.stage_value)
+            .filter(ranked.c.stage_rank <= per_stage)
+            .order_by(ranked.c.stage, ranked.c.stage_rank)
             .all()
         )
 
+    def get_stage_page(
+        self,
+        org_id: UUID,
+        stage: PipelineStage,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Lead]:
+        """Get next page of a stage column using keyset pagination on (updated_at, id)."""
+        query = self.session.query(Lead).filter(
+            and_(Lead.organization_id == org_id, Lead.stage == stage)
+        )
+        if after:
+            query = query.filter(tuple_(Lead.updated_at, Lead.id) < tuple_(*after))
+
+        return query.order_by(Lead.updated_at.desc(), Lead.id.desc()).limit(limit).all()
+
     def get_pipeline_stages_count(self, org_id: UUID) -> dict:
         """Get count of leads per pipeline stage for organization."""
         result = (
@@ -103,22 +330,160 @@ class CRMLeadRepository(SQLRepository[Lead]):
             .first()
         )
 
-    def update_stage(self, lead_id: UUID, org_id: UUID, new_stage: PipelineStage) -> Optional[Lead]:
-        """Update lead stage with organization validation."""
-        lead = (
+    def delete_with_tombstone(self, lead: Lead) -> None:
+        """Delete lead and record a tombstone for delta-sync in the same transaction."""
+        self.session.add(LeadTombstone(lead_id=lead.id, organization_id=lead.organization_id))
+        self.session.delete(lead)
+        self.session.commit()
+
+    @staticmethod
+    def _ids_param(lead_ids: Sequence[UUID]):
+        """Bind lead IDs as a single array parameter (`id = ANY(:lead_ids)`)."""
+        return any_(bindparam("lead_ids", list(lead_ids), type_=ARRAY(PG_UUID(as_uuid=True))))
+
+    def bulk_update(
+        self,
+        org_id: UUID,
+        lead_ids: Sequence[UUID],
+        values: Dict,
+        previous_columns: Sequence[str] = (),
+    ) -> List[Row]:
+        """Apply one UPDATE to many leads of an organization.
+
+        Returns one row per updated lead with its id and the previous values
+        of `previous_columns` (read under FOR UPDATE in the same statement).
+        """
+        previous = (
+            select(Lead.id, *[getattr(Lead, column) for column in previous_columns])
+            .where(Lead.organization_id == org_id, Lead.id == self._ids_param(lead_ids))
+            .with_for_update()
+            .subquery()
+        )
+        statement = (
+            update(Lead)
+            .where(Lead.id == previous.c.id)
+            .values(**values, updated_at=func.now())
+            .returning(previous.c.id, *[previous.c[column] for column in previous_columns])
+            .execution_options(synchronize_session=False)
+        )
+        return self.session.execute(statement).all()
+
+    @staticmethod
+    def tags_update_expression(add_tags: Sequence[str], remove_tags: Sequence[str]):
+        """SQL expression adding/removing tags in place, keeping first-seen order."""
+        expression = "coalesce(leads.tags, '{}')"
+        params = []
+        if add_tags:
+            expression = (
+                f"ARRAY(SELECT t FROM unnest({expression} || CAST(:add_tags AS TEXT[])) "
+                "WITH ORDINALITY AS u(t, i) GROUP BY t ORDER BY min(i))"
+            )
+            params.append(bindparam("add_tags", list(add_tags), type_=ARRAY(Text)))
+        if remove_tags:
+            expression = (
+                f"ARRAY(SELECT t FROM unnest({expression}) WITH ORDINALITY AS u(t, i) "
+                "WHERE t <> ALL(CAST(:remove_tags AS TEXT[])) ORDER BY i)"
+            )
+            params.append(bindparam("remove_tags", list(remove_tags), type_=ARRAY(Text)))
+        return text(expression).bindparams(*params)
+
+    def bulk_delete_with_tombstones(self, org_id: UUID, lead_ids: Sequence[UUID]) -> List[Row]:
+        """Delete many leads in one statement and tombstone them for delta-sync."""
+        statement = (
+            delete(Lead)
+            .where(Lead.organization_id == org_id, Lead.id == self._ids_param(lead_ids))
+            .returning(Lead.id, Lead.name, Lead.stage)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = self.session.execute(statement).all()
+
+        if deleted:
+            tombstones = pg_insert(LeadTombstone).values(
+                [{"lead_id": row.id, "organization_id": org_id} for row in deleted]
+            )
+            self.session.execute(
+                tombstones.on_conflict_do_update(
+                    index_elements=[LeadTombstone.lead_id], set_={"deleted_at": func.now()}
+                )
+            )
+        return deleted
+
+    def write_audit_batch(
+        self,
+        org_id: UUID,
+        user_id: Optional[UUID],
+        action: AuditAction,
+        changes: List[Tuple[UUID, Optional[Dict], Optional[Dict]]],
+    ) -> None:
+        """Write audit rows for many leads in a single batched INSERT.
+
+        `changes` holds one (lead_id, old_values, new_values) entry per lead.
+        """
+        if not changes:
+            return
+        self.session.execute(
+            insert(AuditLog),
+            [
+                {
+                    "organization_id": org_id,
+                    "table_name": Lead.__tablename__,
+                    "record_id": lead_id,
+                    "action": action.value,
+                    "old_values": old_values,
+                    "new_values": new_values,
+                    "user_id": user_id,
+                }
+                for lead_id, old_values, new_values in changes
+            ],
+        )
+
+    def get_changed_since(
+        self,
+        org_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        until: Optional[datetime] = None,
+    ) -> List[Lead]:
+        """Get leads created or updated after a (updated_at, id) keyset position, up to `until`."""
+        query = (
             self.session.query(Lead)
-            .filter(and_(Lead.id == lead_id, Lead.organization_id == org_id))
-            .first()
+            .options(undefer(Lead.notes))
+            .filter(Lead.organization_id == org_id)
         )
+        if until:
+            query = query.filter(Lead.updated_at <= until)
+        if after:
+            query = query.filter(tuple_(Lead.updated_at, Lead.id) > tuple_(*after))
 
-        if not lead:
-            return None
+        return query.order_by(Lead.updated_at, Lead.id).limit(limit).all()
 
-        lead.move_to_stage(new_stage)
-        self.session.commit()
-        self.session.refresh(lead)
+    def get_tombstones_since(
+        self,
+        org_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        until: Optional[datetime] = None,
+    ) -> List[LeadTombstone]:
+        """Get lead tombstones after a (deleted_at, lead_id) keyset position, up to `until`."""
+        query = self.session.query(LeadTombstone).filter(LeadTombstone.organization_id == org_id)
+        if until:
+            query = query.filter(LeadTombstone.deleted_at <= until)
+        if after:
+            query = query.filter(
+                tuple_(LeadTombstone.deleted_at, LeadTombstone.lead_id) > tuple_(*after)
+            )
 
-        return lead
+        return query.order_by(LeadTombstone.deleted_at, LeadTombstone.lead_id).limit(limit).all()
+
+    def purge_tombstones(self, older_than: datetime) -> int:
+        """Delete tombstones older than the retention horizon."""
+        deleted = (
+            self.session.query(LeadTombstone)
+            .filter(LeadTombstone.deleted_at < older_than)
+            .delete(synchronize_session=False)
+        )
+        self.session.commit()
+        return deleted
 
     def get_unique_sources(self, org_id: UUID) -> List[str]:
         """Get unique lead sources for organization."""
@@ -161,17 +526,348 @@ class CRMLeadRepository(SQLRepository[Lead]):
         }
 
     def get_unique_tags(self, org_id: UUID) -> List[str]:
-        """Get unique tags used in organization."""
-        leads = (
-            self.session.query(Lead.tags)
-            .filter(Lead.organization_id == org_id)
-            .filter(Lead.tags.isnot(None))
+        """Get unique tags used in organization.
+
+        Reads the per-organization tag dictionary instead of scanning lead rows.
+        """
+        result = (
+            self.session.query(LeadTag.tag)
+            .filter(LeadTag.organization_id == org_id)
+            .filter(LeadTag.usage_count > 0)
+            .order_by(LeadTag.tag)
+            .all()
+        )
+        return [row.tag for row in result]
+
+    def search_tags(self, org_id: UUID, prefix: str = "", limit: int = 20) -> List[LeadTag]:
+        """Get tag suggestions for autocomplete, most used first."""
+        query = (
+            self.session.query(LeadTag)
+            .filter(LeadTag.organization_id == org_id)
+            .filter(LeadTag.usage_count > 0)
+        )
+        if prefix:
+            query = query.filter(LeadTag.tag.startswith(prefix, autoescape=True))
+
+        return query.order_by(LeadTag.usage_count.desc(), LeadTag.tag).limit(limit).all()
+
+    def create_import_staging(self) -> None:
+        """Create the temporary import staging table for the current transaction."""
+        lead_import_staging.create(self.session.connection())
+
+    def stage_import_rows(self, rows: List[Dict]) -> None:
+        """Insert validated import rows into staging (batched executemany)."""
+        if rows:
+            self.session.execute(insert(lead_import_staging), rows)
+
+    def merge_import_staging(self, org_id: UUID) -> int:
+        """Insert staged rows as leads, skipping duplicates; return leads created.
+
+        Rows are deduplicated on normalized email (falling back to phone)
+        within the file, and against existing leads of the organization via
+        the unique email_key / phone_key indexes (ON CONFLICT DO NOTHING).
+        Notes of the inserted rows become their first lead_notes entry.
+        """
+        staging = lead_import_staging.c
+        dedupe_key = func.coalesce(
+            staging.email_key, staging.phone_key, cast(staging.row_number, Text)
+        )
+        unique_rows = (
+            select(lead_import_staging)
+            .distinct(dedupe_key)
+            .order_by(dedupe_key, staging.row_number)
+            .subquery()
+        )
+
+        columns = [
+            "id",
+            "organization_id",
+            "name",
+            "email",
+            "phone",
+            "email_key",
+            "phone_key",
+            "stage",
+            "source",
+            "estimated_value",
+            "tags",
+            "notes",
+            "assigned_user_id",
+            "is_favorite",
+            "created_at",
+            "updated_at",
+        ]
+        rows = select(
+            unique_rows.c.lead_id,
+            literal(org_id, PG_UUID(as_uuid=True)),
+            unique_rows.c.name,
+            unique_rows.c.email,
+            unique_rows.c.phone,
+            unique_rows.c.email_key,
+            unique_rows.c.phone_key,
+            unique_rows.c.stage,
+            unique_rows.c.source,
+            unique_rows.c.estimated_value,
+            unique_rows.c.tags,
+            unique_rows.c.assigned_user_id,
+            literal(False),
+            func.now(),
+            func.now(),
+        ).order_by(unique_rows.c.row_number)
+
+        result = self.session.execute(
+            pg_insert(Lead).from_select(columns, rows).on_conflict_do_nothing()
+        )
+
+        # Staged lead IDs of skipped rows match no lead, so the join drops them
+        notes = (
+            select(
+                func.uuid_generate_v4(),
+                literal(org_id, PG_UUID(as_uuid=True)),
+                staging.lead_id,
+                literal(LeadNoteKind.NOTE.value),
+                staging.notes,
+                func.now(),
+            )
+            .join(Lead, Lead.id == staging.lead_id)
+            .where(staging.notes.isnot(None))
+        )
+        self.session.execute(
+            insert(LeadNote).from_select(
+                ["id", "organization_id", "lead_id", "kind", "body", "created_at"], notes
+            )
+        )
+        return result.rowcount
+
+    def get_id_by_contact_key(self, org_id: UUID, kind: str, key: str) -> Optional[UUID]:
+        """Get lead ID by normalized contact key ("email" or "phone")."""
+        column = Lead.email_key if kind == "email" else Lead.phone_key
+        return self.session.execute(
+            select(Lead.id).where(Lead.organization_id == org_id, column == key)
+        ).scalar_one_or_none()
+
+    def get_by_ids(
+        self, org_id: UUID, lead_ids: Sequence[UUID], for_update: bool = False
+    ) -> List[Lead]:
+        """Get leads of organization by IDs (oldest first), optionally locking them."""
+        query = (
+            self.session.query(Lead)
+            .options(undefer(Lead.notes))
+            .filter(Lead.organization_id == org_id, Lead.id == self._ids_param(lead_ids))
+            .order_by(Lead.created_at, Lead.id)
+        )
+        if for_update:
+            query = query.with_for_update()
+        return query.all()
+
+    def repoint_lead_children(
+        self, org_id: UUID, from_ids: Sequence[UUID], to_id: UUID
+    ) -> Tuple[int, int]:
+        """Move communications, AI summaries and note history to another lead.
+
+        File attachments hang off communications and move with them.
+        Returns (communications moved, summaries moved).
+        """
+        moved = []
+        for model in (Communication, AISummary, LeadNote):
+            result = self.session.execute(
+                update(model)
+                .where(model.organization_id == org_id, model.lead_id == self._ids_param(from_ids))
+                .values(lead_id=to_id)
+                .execution_options(synchronize_session=False)
+            )
+            moved.append(result.rowcount)
+        return moved[0], moved[1]
+
+    def get_archivable_leads(self, closed_before: datetime, limit: int) -> List[Row]:
+        """Lock a batch of closed leads not updated since `closed_before`.
+
+        Locked rows are skipped so concurrent archival runs split the work.
+        """
+        return self.session.execute(
+            select(Lead.id, Lead.organization_id)
+            .where(Lead.stage == PipelineStage.FECHADO.value, Lead.updated_at < closed_before)
+            .order_by(Lead.updated_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all()
+
+    def copy_leads_to_archive(self, lead_ids: Sequence[UUID]) -> Tuple[int, int]:
+        """Copy leads and their communications into the archive tables.
+
+        Custom fields, note history and AI summaries go into the archived
+        lead's `archived_data`; file attachment rows are embedded in each
+        archived communication. Returns (leads copied, communications copied).
+        """
+        notes = LeadNote.__table__
+        summaries = AISummary.__table__
+        communications = Communication.__table__
+        attachments = FileAttachment.__table__
+        empty_array = literal("[]", JSONB)
+
+        archived_data = func.jsonb_build_object(
+            "custom_fields",
+            func.coalesce(
+                select(LeadCustomFields.fields)
+                .where(LeadCustomFields.lead_id == Lead.id)
+                .scalar_subquery(),
+                literal("{}", JSONB),
+            ),
+            "note_history",
+            func.coalesce(
+                select(
+                    func.jsonb_agg(
+                        aggregate_order_by(
+                            func.to_jsonb(notes.table_valued()), notes.c.created_at, notes.c.id
+                        )
+                    )
+                )
+                .where(notes.c.lead_id == Lead.id)
+                .scalar_subquery(),
+                empty_array,
+            ),
+            "ai_summaries",
+            func.coalesce(
+                select(func.jsonb_agg(func.to_jsonb(summaries.table_valued())))
+                .where(summaries.c.lead_id == Lead.id)
+                .scalar_subquery(),
+                empty_array,
+            ),
+        )
+        lead_columns = [
+            "id",
+            "organization_id",
+            "name",
+            "email",
+            "phone",
+            "email_key",
+            "phone_key",
+            "stage",
+            "source",
+            "estimated_value",
+            "tags",
+            "notes",
+            "assigned_user_id",
+            "last_contact_at",
+            "last_contact_channel",
+            "is_favorite",
+            "created_at",
+            "updated_at",
+        ]
+        leads = self.session.execute(
+            pg_insert(ArchivedLead)
+            .from_select(
+                [*lead_columns, "archived_data"],
+                select(*[getattr(Lead, column) for column in lead_columns], archived_data).where(
+                    Lead.id == self._ids_param(lead_ids)
+                ),
+            )
+            .on_conflict_do_nothing()
+        )
+
+        payload = func.to_jsonb(communications.table_valued()).op("||")(
+            func.jsonb_build_object(
+                "file_attachments",
+                func.coalesce(
+                    select(func.jsonb_agg(func.to_jsonb(attachments.table_valued())))
+                    .where(attachments.c.communication_id == communications.c.id)
+                    .scalar_subquery(),
+                    empty_array,
+                ),
+            )
+        )
+        copied_communications = self.session.execute(
+            pg_insert(ArchivedCommunication)
+            .from_select(
+                ["id", "organization_id", "lead_id", "payload", "created_at"],
+                select(
+                    communications.c.id,
+                    communications.c.organization_id,
+                    communications.c.lead_id,
+                    payload,
+                    communications.c.created_at,
+                ).where(communications.c.lead_id == self._ids_param(lead_ids)),
+            )
+            .on_conflict_do_nothing()
+        )
+        return leads.rowcount, copied_communications.rowcount
+
+    def get_notes_page(
+        self,
+        org_id: UUID,
+        lead_id: UUID,
+        before: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 50,
+    ) -> List[LeadNote]:
+        """Get a lead's note entries newest first, before a (created_at, id) position."""
+        query = self.session.query(LeadNote).filter(
+            LeadNote.organization_id == org_id, LeadNote.lead_id == lead_id
+        )
+        if before:
+            query = query.filter(tuple_(LeadNote.created_at, LeadNote.id) < tuple_(*before))
+
+        return query.order_by(LeadNote.created_at.desc(), LeadNote.id.desc()).limit(limit).all()
+
+    def replace_duplicate_clusters(
+        self, org_id: UUID, clusters: List[Tuple[List[UUID], List[str]]]
+    ) -> None:
+        """Replace the organization's duplicate clusters with a fresh scan result."""
+        self.session.query(LeadDuplicateCluster).filter(
+            LeadDuplicateCluster.organization_id == org_id
+        ).delete(synchronize_session=False)
+        if clusters:
+            self.session.execute(
+                insert(LeadDuplicateCluster),
+                [
+                    {"organization_id": org_id, "lead_ids": lead_ids, "reasons": reasons}
+                    for lead_ids, reasons in clusters
+                ],
+            )
+        self.session.commit()
+
+    def get_duplicate_clusters(
+        self, org_id: UUID, skip: int = 0, limit: int = 50
+    ) -> List[LeadDuplicateCluster]:
+        """Get candidate duplicate clusters for organization (largest first)."""
+        return (
+            self.session.query(LeadDuplicateCluster)
+            .filter(LeadDuplicateCluster.organization_id == org_id)
+            .order_by(
+                func.cardinality(LeadDuplicateCluster.lead_ids).desc(), LeadDuplicateCluster.id
+            )
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
-        all_tags = set()
-        for lead in leads:
-            if lead.tags:
-                all_tags.update(lead.tags)
+    def delete_duplicate_clusters_with(self, org_id: UUID, lead_ids: Sequence[UUID]) -> None:
+        """Drop clusters that contain any of the given leads (stale after a merge)."""
+        self.session.query(LeadDuplicateCluster).filter(
+            LeadDuplicateCluster.organization_id == org_id,
+            LeadDuplicateCluster.lead_ids.overlap(
+                cast(list(lead_ids), ARRAY(PG_UUID(as_uuid=True)))
+            ),
+        ).delete(synchronize_session=False)
+
+    def add_outbox_event(self, org_id: UUID, event_type: str, payload: Dict) -> None:
+        """Stage a lead change event in the caller's transaction (committed with it)."""
+        self.session.add(
+            LeadOutboxEvent(organization_id=org_id, event_type=event_type, payload=payload)
+        )
+
+    def claim_outbox_events(self, limit: int) -> List[LeadOutboxEvent]:
+        """Lock the oldest pending outbox events.
+
+        Locked rows are skipped so concurrent relays split the work.
+        """
+        return (
+            self.session.query(LeadOutboxEvent)
+            .order_by(LeadOutboxEvent.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
 
-        return list(all_tags)
+    def delete_outbox_events(self, event_ids: Sequence[int]) -> None:
+        """Delete delivered outbox events."""
+        self.session.execute(delete(LeadOutboxEvent).where(LeadOutboxEvent.id.in_(event_ids)))
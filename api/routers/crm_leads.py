@@ -4,33 +4,81 @@ FastAPI router for Lead management endpoints with organizational isolation.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from api.core.deps import get_current_active_user, get_current_organization, get_db
+from api.core.responses import ORJSONResponse, model_json_response
 from api.models.crm_lead import PipelineStage
 from api.models.organization import Organization
 from api.models.user import User
 from api.schemas.crm_lead import (
     AdvancedFiltersSchema,
     AdvancedMetricsResponse,
+    BoardColumnPage,
     ConversionMetricsResponse,
     FilterOptionsResponse,
+    LeadBulkRequest,
+    LeadBulkResponse,
+    LeadChangesResponse,
     LeadCreate,
+    LeadDuplicateClustersResponse,
+    LeadDuplicateScanResponse,
     LeadFavoriteToggle,
+    LeadImportResponse,
     LeadListResponse,
+    LeadMergeRequest,
+    LeadMergeResponse,
+    LeadNoteCreate,
+    LeadNoteResponse,
+    LeadNotesResponse,
+    LeadResolveResponse,
     LeadResponse,
     LeadSearchRequest,
+    LeadSparseListResponse,
     LeadStageUpdate,
+    LeadTagSuggestionsResponse,
     LeadUpdate,
+    PipelineBoardResponse,
     PipelineStatsResponse,
 )
+from api.services.crm_lead_dedup_service import CRMLeadDedupService, run_duplicate_scan
+from api.services.crm_lead_import_service import CRMLeadImportService
+from api.services.crm_lead_resolver_service import CRMLeadResolverService
 from api.services.crm_lead_service import CRMLeadService
 
-router = APIRouter(prefix="/crm/leads", tags=["CRM - Leads"])
+router = APIRouter(prefix="/crm/leads", tags=["CRM - Leads"], default_response_class=ORJSONResponse)
+
+
+def get_advanced_filters(
+    start_date: Optional[str] = Query(None, description="Start date filter (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="End date filter (YYYY-MM-DD)"),
+    stages: List[str] = Query(default=[], description="Pipeline stages to include"),
+    sources: List[str] = Query(default=[], description="Lead sources to include"),
+    assigned_users: List[str] = Query(default=[], description="Assigned user IDs to include"),
+    tags: List[str] = Query(default=[], description="Tags to include"),
+    tag_match: str = Query(
+        "all", pattern="^(any|all)$", description="Match any or all of the given tags"
+    ),
+    value_min: Optional[float] = Query(None, ge=0, description="Minimum estimated value"),
+    value_max: Optional[float] = Query(None, ge=0, description="Maximum estimated value"),
+) -> AdvancedFiltersSchema:
+    """Build advanced filters schema from query parameters."""
+    return AdvancedFiltersSchema(
+        start_date=start_date,
+        end_date=end_date,
+        stages=stages,
+        sources=sources,
+        assigned_users=assigned_users,
+        tags=tags,
+        tag_match=tag_match,
+        value_min=value_min,
+        value_max=value_max,
+    )
 
 
 @router.post("", response_model=LeadResponse, status_code=status.HTTP_201_CREATED)
@@ -55,20 +103,88 @@ async def create_lead(
     return response
 
 
-@router.get("", response_model=LeadListResponse)
+@router.get(
+    "",
+    response_model=Union[LeadListResponse, LeadSparseListResponse],
+)
 async def get_leads(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     stage: Optional[PipelineStage] = Query(None, description="Filter by pipeline stage"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated lead fields to return, or 'card' for the Kanban preset"
+    ),
+    include_archived: bool = Query(False, description="Also list archived (old closed) leads"),
     organization: Organization = Depends(get_current_organization),
     db: Session = Depends(get_db),
 ):
     """Get leads for organization with pagination and optional stage filter.
 
+    Pass `fields` (e.g. `fields=id,name,stage` or `fields=card`) to load and
+    return only those fields instead of the full lead. Closed leads moved to
+    the archive are only listed with `include_archived=true`.
+
+    **Required**: X-Org-Id header with valid organization ID.
+    """
+    service = CRMLeadService(db)
+    result = service.get_organization_leads(
+        organization, page, page_size, stage, fields, include_archived
+    )
+    return model_json_response(result, exclude_unset=True)
+
+
+@router.get("/board", response_model=PipelineBoardResponse)
+async def get_pipeline_board(
+    per_stage: int = Query(20, ge=1, le=100, description="Leads returned per stage column"),
+    organization: Organization = Depends(get_current_organization),
+    db: Session = Depends(get_db),
+):
+    """Get the whole Kanban board in a single request.
+
+    Returns, for every pipeline stage, the lead count, the estimated value sum
+    and the first ``per_stage`` leads, plus a cursor to load more per column.
+
+    **Required**: X-Org-Id header with valid organization ID.
+    """
+    service = CRMLeadService(db)
+    return service.get_pipeline_board(organization, per_stage)
+
+
+@router.get("/board/{stage}", response_model=BoardColumnPage)
+async def get_pipeline_board_column(
+    stage: PipelineStage,
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+    limit: int = Query(20, ge=1, le=100, description="Leads to load"),
+    organization: Organization = Depends(get_current_organization),
+    db: Session = Depends(get_db),
+):
+    """Load more leads for a single Kanban column.
+
+    **Required**: X-Org-Id header with valid organization ID.
+    """
+    service = CRMLeadService(db)
+    return service.get_board_column_page(organization, stage, cursor, limit)
+
+
+@router.get("/changes", response_model=LeadChangesResponse)
+async def get_lead_changes(
+    since: Optional[str] = Query(None, description="Cursor from the previous sync (omit for full)"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum changes to return"),
+    organization: Organization = Depends(get_current_organization),
+    db: Session = Depends(get_db),
+):
+    """Get leads created, updated or deleted since a cursor (delta-sync).
+
+    Changes from the last few seconds (LEAD_CHANGES_SETTLE_SECONDS) arrive on
+    the next sync. Returns **410** when the cursor is older than the
+    tombstone retention window; the client must then drop its cache and
+    resync from scratch. Keep syncing with each `next_cursor`, even when
+    nothing changed, so the cursor stays fresh.
+
     **Required**: X-Org-Id header with valid organization ID.
     """
     service = CRMLeadService(db)
-    return service.get_organization_leads(organization, page, page_size, stage)
+    return service.get_lead_changes(organization, since, limit)
 
 
 @router.get("/statistics", response_model=PipelineStatsResponse)
@@ -85,7 +201,10 @@ async def get_pipeline_statistics(
     return service.get_pipeline_statistics(organization)
 
 
-@router.post("/search", response_model=LeadListResponse)
+@router.post(
+    "/search",
+    response_model=Union[LeadListResponse, LeadSparseListResponse],
+)
 async def search_leads(
     search_request: LeadSearchRequest,
     organization: Organization = Depends(get_current_organization),
@@ -96,14 +215,176 @@ async def search_leads(
     **Required**: X-Org-Id header with valid organization ID.
     """
     service = CRMLeadService(db)
-    return service.search_leads(
+    result = service.search_leads(
         organization=organization,
         query=search_request.query,
         page=search_request.page,
         page_size=search_request.page_size,
+        fields=search_request.fields,
+    )
+    return model_json_response(result, exclude_unset=True)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_leads(
+    export_format: str = Query(
+        "csv", alias="format", pattern="^(csv|ndjson)$", description="Export format"
+    ),
+    gzip: bool = Query(False, description="Gzip the response body (Content-Encoding: gzip)"),
+    filters: AdvancedFiltersSchema = Depends(get_advanced_filters),
+    organization: Organization = Depends(get_current_organization),
+    db: Session = Depends(get_db),
+):
+    """Stream all leads matching the advanced filters as CSV or NDJSON.
+
+    Rows are streamed from a server-side cursor, so exports of any size use
+    constant memory.
+
+    **Required**: X-Org-Id header with valid organization ID.
+    """
+    service = CRMLeadService(db)
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    headers = {"Content-Disposition": f'attachment; filename="leads.{export_format}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        service.export_leads(organization, filters, export_format, compress=gzip),
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+@router.post("/bulk", response_model=LeadBulkResponse)
+async def bulk_update_leads(
+    bulk_request: LeadBulkRequest,
+    organization: Organization = Depends(get_current_organization),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """Move, reassign, retag or delete many leads in one request.
+
+    Actions: `stage` (requires `stage`), `assign` (requires `assigned_user_id`,
+    null to unassign), `tags` (`add_tags` / `remove_tags`) and `delete`.
+    IDs that do not belong to the organization are reported in `not_found`.
+
+    **Required**: X-Org-Id header with valid organization ID.
+    """
+    service = CRMLeadService(db)
+    return await service.bulk_update_leads(organization, bulk_request, UUID(str(current_user.id)))
+
+
+@router.post(
+    "/duplicates/scan",
+    response_model=LeadDuplicateScanResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def scan_lead_duplicates(
+    background_tasks: BackgroundTasks,
+    organization: Organization = Depends(get_current_organization),
+):
+    """Schedule a background scan for duplicate leads.
+
+    Leads are grouped by normalized email, phone and name key; results
+    replace the organization's previous clusters.
+
+    **Required**: X-Org-Id header with valid organization ID.
+    """
+    background_tasks.add_task(run_duplicate_scan, UUID(str(organization.id)))
+    return LeadDuplicateScanResponse()
+
+
+@router.get("/duplicates", response_model=LeadDuplicateClustersResponse)
+async def get_lead_duplicates(
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Clusters per page"),
+    organization: Organization = Depends(get_current_organization),
+    db: Session = Depends(get_db),
+):
+    """Get candidate duplicate clusters from the last scan.
+
+    **Required**: X-Org-Id header with valid organization ID.
+    """
+    service = CRMLeadDedupService(db)
+    return service.get_clusters(organization, page, page_size)
+
+
+@router.post("/duplicates/merge", response_model=LeadMergeResponse)
+async def merge_lead_duplicates(
+    merge_request: LeadMergeRequest,
+    organization: Organization = Depends(get_current_organization),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """Merge duplicate leads into a primary lead.
+
+    Communications, attachments and AI summaries move to the primary lead;
+    the duplicates are deleted.
+
+    **Required**: X-Org-Id header with valid organization ID.
+    """
+    service = CRMLeadDedupService(db)
+    return await service.merge_leads(organization, merge_request, UUID(str(current_user.id)))
+
+
+@router.post("/import", response_model=LeadImportResponse)
+async def import_leads(
+    file: UploadFile = File(..., description="CSV (header row) or NDJSON file of leads"),
+    import_format: str = Query(
+        "csv", alias="format", pattern="^(csv|ndjson)$", description="File format"
+    ),
+    organization: Organization = Depends(get_current_organization),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """Bulk import leads from a CSV or NDJSON file.
+
+    Rows are validated in chunks and merged in one statement; rows whose
+    normalized email (or phone) matches an existing lead or an earlier row
+    are skipped. Progress is sent over the WebSocket as
+    `lead_import_progress` events, followed by one `leads_imported` broadcast.
+
+    **Required**: X-Org-Id header with valid organization ID.
+    """
+    service = CRMLeadImportService(db)
+    return await service.import_leads(
+        organization, file.file, import_format, UUID(str(current_user.id))
     )
 
 
+@router.get("/resolve", response_model=LeadResolveResponse)
+async def resolve_lead(
+    phone: Optional[str] = Query(None, max_length=50, description="Phone in any common format"),
+    email: Optional[str] = Query(None, max_length=255, description="Email address"),
+    organization: Organization = Depends(get_current_organization),
+    db: Session = Depends(get_db),
+):
+    """Resolve an inbound phone or email to its lead.
+
+    Phone takes precedence when both are given; `lead_id` is null when no
+    lead matches.
+
+    **Required**: X-Org-Id header with valid organization ID.
+    """
+    service = CRMLeadResolverService(db)
+    return LeadResolveResponse(lead_id=service.resolve(UUID(str(organization.id)), phone, email))
+
+
+@router.get("/tags", response_model=LeadTagSuggestionsResponse)
+async def get_tag_suggestions(
+    q: str = Query("", max_length=100, description="Tag prefix to autocomplete"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of suggestions"),
+    organization: Organization = Depends(get_current_organization),
+    db: Session = Depends(get_db),
+):
+    """Get tag autocomplete suggestions for organization.
+
+    **Required**: X-Org-Id header with valid organization ID.
+    """
+    service = CRMLeadService(db)
+    return service.get_tag_suggestions(organization, q, limit)
+
+
 @router.get("/{lead_id}", response_model=LeadResponse)
 async def get_lead(
     lead_id: UUID,
@@ -197,6 +478,40 @@ async def toggle_lead_favorite(
     return response
 
 
+@router.get("/{lead_id}/notes", response_model=LeadNotesResponse)
+async def get_lead_notes(
+    lead_id: UUID,
+    cursor: Optional[str] = Query(None, description="`next_cursor` from the previous page"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum notes per page"),
+    organization: Organization = Depends(get_current_organization),
+    db: Session = Depends(get_db),
+):
+    """Get lead note history, newest first.
+
+    **Required**: X-Org-Id header with valid organization ID.
+    """
+    service = CRMLeadService(db)
+    return service.get_lead_notes(organization, lead_id, cursor, limit)
+
+
+@router.post(
+    "/{lead_id}/notes", response_model=LeadNoteResponse, status_code=status.HTTP_201_CREATED
+)
+async def add_lead_note(
+    lead_id: UUID,
+    note_data: LeadNoteCreate,
+    organization: Organization = Depends(get_current_organization),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """Append a note to a lead; it becomes the lead's current `notes`.
+
+    **Required**: X-Org-Id header with valid organization ID.
+    """
+    service = CRMLeadService(db)
+    return service.add_lead_note(organization, lead_id, note_data, UUID(str(current_user.id)))
+
+
 @router.delete("/{lead_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_lead(
     lead_id: UUID,
@@ -243,14 +558,7 @@ async def get_pipeline_filters(
 
 @router.get("/metrics/advanced", response_model=AdvancedMetricsResponse)
 async def get_advanced_pipeline_metrics(
-    start_date: Optional[str] = Query(None, description="Start date filter (YYYY-MM-DD)"),
-    end_date: Optional[str] = Query(None, description="End date filter (YYYY-MM-DD)"),
-    stages: List[str] = Query(default=[], description="Pipeline stages to include"),
-    sources: List[str] = Query(default=[], description="Lead sources to include"),
-    assigned_users: List[str] = Query(default=[], description="Assigned user IDs to include"),
-    tags: List[str] = Query(default=[], description="Tags to include"),
-    value_min: Optional[float] = Query(None, ge=0, description="Minimum estimated value"),
-    value_max: Optional[float] = Query(None, ge=0, description="Maximum estimated value"),
+    filters: AdvancedFiltersSchema = Depends(get_advanced_filters),
     organization: Organization = Depends(get_current_organization),
     db: Session = Depends(get_db),
 ):
@@ -266,17 +574,4 @@ async def get_advanced_pipeline_metrics(
     **Required**: X-Org-Id header with valid organization ID.
     """
     service = CRMLeadService(db)
-
-    # Build advanced filters schema
-    filters = AdvancedFiltersSchema(
-        start_date=start_date,
-        end_date=end_date,
-        stages=stages,
-        sources=sources,
-        assigned_users=assigned_users,
-        tags=tags,
-        value_min=value_min,
-        value_max=value_max,
-    )
-
     return await service.get_advanced_metrics(UUID(str(organization.id)), filters)
@@ -0,0 +1,121 @@
+"""Server-Sent Events Router for clients behind WebSocket-hostile proxies.
+
+Same organization events as the WebSocket endpoints, delivered over a plain
+HTTP response.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from api.core.config import settings
+from api.core.event_stream import EventStreamConnection, parse_event_id
+from api.core.websocket_codec import SSE_FORMAT
+from api.core.websocket_manager import websocket_manager
+from api.models.organization import Organization
+from api.models.user import User
+from api.routers.websocket import (
+    MAX_TOPICS_PER_CONNECTION,
+    _is_valid_topic,
+    _prepare_user_info,
+    _send_connection_established_message,
+    authenticate_websocket,
+)
+
+router = APIRouter(prefix="/events", tags=["Events - Server-Sent Events"])
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_topics(topics: Optional[str]) -> List[str]:
+    """Validate a comma-separated topic list (same topics as WebSocket subscriptions)."""
+    if not topics:
+        return []
+
+    parsed = [topic for topic in topics.split(",") if topic]
+    if len(parsed) > MAX_TOPICS_PER_CONNECTION or not all(map(_is_valid_topic, parsed)):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid topics")
+    return parsed
+
+
+async def _event_frames(
+    connection: EventStreamConnection,
+    organization: Organization,
+    user: User,
+    topics: List[str],
+    cursor: Optional[Tuple[str, int]],
+) -> AsyncIterator[str]:
+    """Register the connection with the manager and stream its frames until it ends."""
+    org_id, user_id = UUID(str(organization.id)), UUID(str(user.id))
+    user_info = await _prepare_user_info(user)
+
+    # Connected on first read, so a client gone before streaming leaves nothing behind
+    await websocket_manager.connect(
+        connection, org_id, user_id, user_info, resuming=cursor is not None, wire_format=SSE_FORMAT
+    )
+    try:
+        if topics:
+            websocket_manager.subscribe(org_id, user_id, connection, topics)
+        connection_message = await _send_connection_established_message(organization, user_info)
+        await websocket_manager.send_to_connection(org_id, user_id, connection, connection_message)
+        if cursor is not None:
+            await websocket_manager.resume(org_id, user_id, connection, *cursor)
+
+        async for frame in connection.frames():
+            yield frame
+    finally:
+        websocket_manager.disconnect(org_id, user_id, connection)
+        logger.info(
+            "Event stream closed",
+            extra={"organization_id": str(org_id), "user_id": str(user_id)},
+        )
+
+
+@router.get("/stream")
+async def event_stream(
+    request: Request,
+    token: str = Query(..., description="JWT access token"),
+    org_id: str = Query(..., description="Organization ID"),
+    topics: Optional[str] = Query(None, description="Comma-separated topics to subscribe to"),
+    last_event_id: Optional[str] = Query(
+        None, description="Resume cursor when the Last-Event-ID header can't be set"
+    ),
+) -> StreamingResponse:
+    """Stream organization events as Server-Sent Events (WebSocket fallback).
+
+    **Required Query Parameters:**
+    - token: JWT access token (EventSource can't send headers)
+    - org_id: Organization UUID
+
+    **Optional Query Parameters:**
+    - topics: `stage:<name>`, `lead:<id>` or `presence`, comma-separated;
+      same filtering as WebSocket subscriptions
+    - last_event_id: Resume cursor, for clients that can't set the header
+
+    Each event's `data` is the same JSON message WebSocket clients receive
+    (connection_established first). Lead events carry an id
+    `<stream>:<seq>`; browsers send it back as Last-Event-ID on reconnect
+    and missed events are replayed, or `resync_required` is sent when the
+    cursor is too old.
+    """
+    user, organization = await authenticate_websocket(token, org_id)
+    selected_topics = _parse_topics(topics)
+    cursor = parse_event_id(request.headers.get("last-event-id") or last_event_id)
+
+    position: Dict[str, Any] = await websocket_manager.stream_position(
+        UUID(str(organization.id))
+    ) or {"id": ""}
+    connection = EventStreamConnection(position["id"], settings.EVENT_STREAM_HEARTBEAT_SECONDS)
+
+    return StreamingResponse(
+        _event_frames(connection, organization, user, selected_topics, cursor),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Stop nginx-style proxies from buffering the stream
+            "X-Accel-Buffering": "no",
+        },
+    )
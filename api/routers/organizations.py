@@ -3,7 +3,7 @@
 from typing import Annotated, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
 from ..core.database import get_db
@@ -31,7 +31,7 @@ from ..schemas.organization_invite import (
     OrganizationInviteStats,
 )
 from ..services.organization_invite_service import OrganizationInviteService
-from ..services.organization_service import OrganizationService
+from ..services.organization_service import OrganizationService, run_organization_purge
 
 router = APIRouter(prefix="/organizations", tags=["Organizations"])
 
@@ -161,16 +161,24 @@ async def update_current_organization(
 @router.delete("/current")
 async def delete_current_organization(
     request: Request,
+    background_tasks: BackgroundTasks,
     membership: Annotated[OrganizationMember, Depends(require_owner)],
     db: Annotated[Session, Depends(get_db)],
 ) -> Dict[str, str]:
-    """Delete current organization (owner only)."""
+    """Delete current organization (owner only).
+
+    The organization is deactivated immediately; its data is purged in
+    chunks by a background job.
+    """
     org_service = OrganizationService(db)
+    org_id = UUID(str(membership.organization_id))
 
-    success = org_service.delete_organization(UUID(str(membership.organization_id)))
+    success = org_service.delete_organization(org_id)
     if not success:
         raise HTTPException(status_code=404, detail="Organization not found")
 
+    background_tasks.add_task(run_organization_purge, org_id)
+
     return {"message": "Organization deleted successfully"}
 
 
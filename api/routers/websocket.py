@@ -21,9 +21,17 @@ from fastapi import (
 )
 from fastapi.responses import JSONResponse
 
-from api.core.deps import get_current_active_user, get_current_organization, get_org_id_from_header
-from api.core.security import verify_token
-from api.core.websocket_manager import websocket_manager
+from api.core.deps import (
+    _validate_token_and_get_user_data,
+    get_current_active_user,
+    get_current_organization,
+    get_org_id_from_header,
+)
+from api.core.websocket_auth import websocket_auth_cache
+from api.core.websocket_coalescer import pipeline_event_coalescer
+from api.core.websocket_codec import negotiate_wire_format
+from api.core.websocket_manager import PRESENCE_TOPIC, websocket_manager
+from api.models.crm_lead import PipelineStage
 from api.models.organization import Organization
 from api.models.user import User
 
@@ -31,73 +39,28 @@ router = APIRouter(prefix="/ws", tags=["WebSocket - Real-time Collaboration"])
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on topics one connection may hold
+MAX_TOPICS_PER_CONNECTION = 200
+
 
 async def authenticate_websocket(token: str, org_id: str) -> tuple[User, Organization]:
-    """Authenticate WebSocket connection with organization validation."""
-    try:
-        # Verify JWT token
-        payload = verify_token(token, "access")
-        user_id = payload.get("sub")
-        jwt_org_id = payload.get("org_id")
+    """Authenticate WebSocket connection with organization validation.
 
-        if not user_id or not jwt_org_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token: missing user or organization context",
-            )
+    Uses the same token checks as HTTP requests (signature, expiry,
+    blacklist); membership comes from websocket_auth_cache, so reconnects
+    don't hit the database and misses never block the event loop.
+    """
+    try:
+        token_data = await _validate_token_and_get_user_data(token, require_org=True)
 
         # Validate organization ID matches
-        if str(jwt_org_id) != str(org_id):
+        if token_data["org_id"] != str(org_id):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Organization access denied: token organization mismatch",
             )
 
-        # Get database session
-        from api.core.database import SessionLocal
-
-        db = SessionLocal()
-
-        try:
-            # Get user and organization from database
-            user = db.query(User).filter(User.id == UUID(user_id)).first()
-            if not user:
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-
-            organization = db.query(Organization).filter(Organization.id == UUID(org_id)).first()
-            if not organization:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found"
-                )
-
-            # Verify user belongs to organization through membership or ownership
-            from api.models.organization import OrganizationMember
-
-            # Check if user is the owner of the organization
-            is_owner = organization.owner_id == user.id
-
-            # Check if user is a member of the organization
-            is_member = (
-                db.query(OrganizationMember)
-                .filter(
-                    OrganizationMember.user_id == user.id,
-                    OrganizationMember.organization_id == organization.id,
-                    OrganizationMember.is_active == True,
-                )
-                .first()
-                is not None
-            )
-
-            if not (is_owner or is_member):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="User does not belong to organization",
-                )
-
-            return user, organization
-
-        finally:
-            db.close()
+        return await websocket_auth_cache.resolve(UUID(org_id), UUID(token_data["user_id"]))
 
     except HTTPException:
         raise
@@ -130,7 +93,9 @@ async def _send_connection_established_message(
         "message": f"Connected to {organization.name} {room_type}",
         "organization": {"id": str(organization.id), "name": organization.name},
         "user": user_info,
-        "active_users": websocket_manager.get_active_users(UUID(str(organization.id))),
+        "active_users": await websocket_manager.get_active_users(UUID(str(organization.id))),
+        # Cursor to pass back as stream / resume_from when reconnecting
+        "stream": await websocket_manager.stream_position(UUID(str(organization.id))),
     }
 
 
@@ -242,7 +207,12 @@ async def _handle_json_decode_error(
 
 
 async def _process_websocket_message(
-    data: str, user: User, organization: Organization, handler_func, max_size: int
+    websocket: WebSocket,
+    data: str,
+    user: User,
+    organization: Organization,
+    handler_func,
+    max_size: int,
 ) -> bool:
     """Process a single WebSocket message and return success status."""
     # Validate message size
@@ -252,7 +222,7 @@ async def _process_websocket_message(
     # Parse and handle message
     try:
         message = json.loads(data)
-        await handler_func(None, user, organization, message)  # websocket not used in handler_func
+        await handler_func(websocket, user, organization, message)
         return True  # Success
     except json.JSONDecodeError:
         return False  # JSON error, handled by caller
@@ -297,10 +267,11 @@ async def _websocket_message_loop(
             data = await _receive_websocket_data(websocket, user)
             if data is None:
                 continue
+            websocket_manager.touch(UUID(str(organization.id)), UUID(str(user.id)))
 
             # Process message
             success = await _process_websocket_message(
-                data, user, organization, handler_func, max_message_size
+                websocket, data, user, organization, handler_func, max_message_size
             )
 
             if success:
@@ -336,6 +307,11 @@ async def websocket_collaboration_endpoint(
     websocket: WebSocket,
     token: str = Query(..., description="JWT access token"),
     org_id: str = Query(..., description="Organization ID"),
+    resume_from: Optional[int] = Query(None, description="Last event seq received"),
+    stream: Optional[str] = Query(None, description="Stream id the seq belongs to"),
+    wire_format: Optional[str] = Query(
+        None, alias="format", description="Frame format: json (default) or msgpack"
+    ),
 ):
     """Provide WebSocket endpoint for real-time collaboration within organization.
 
@@ -343,12 +319,30 @@ async def websocket_collaboration_endpoint(
     - token: JWT access token
     - org_id: Organization UUID
 
+    **Optional Query Parameters:**
+    - resume_from / stream: Cursor from a previous connection (last `seq` seen
+      and `stream.id` from connection_established); missed lead events are
+      replayed, or `resync_required` is sent when the cursor is too old
+    - format: `msgpack` for binary msgpack frames without the redundant
+      `organization_id` (also negotiable as the `msgpack` subprotocol);
+      text frames are always JSON. Client messages stay JSON text
+
     **Events Sent:**
     - lead_created: When a lead is created by team member
     - lead_updated: When a lead is updated by team member
     - lead_stage_changed: When a lead stage is moved by team member
     - user_joined: When team member joins collaboration session
     - user_left: When team member leaves collaboration session
+    - subscriptions: The connection's topics after a subscribe / unsubscribe
+    - replay_complete / resync_required: Outcome of a resume
+
+    Lead events carry a per-organization `seq`.
+
+    **Topic Subscriptions:**
+    Send `{"type": "subscribe", "topics": [...]}` (or "unsubscribe") with
+    `stage:<name>`, `lead:<id>` or `presence`. Once subscribed, the connection
+    only receives events for its topics plus events that aren't topic-scoped;
+    connections that never subscribe receive everything.
     """
     try:
         # Authenticate WebSocket connection
@@ -358,18 +352,29 @@ async def websocket_collaboration_endpoint(
         user_info = await _prepare_user_info(user)
 
         # Connect user to organization room
+        negotiated_format, subprotocol = negotiate_wire_format(
+            wire_format, websocket.scope.get("subprotocols", [])
+        )
         await websocket_manager.connect(
-            websocket, UUID(str(organization.id)), UUID(str(user.id)), user_info
+            websocket,
+            UUID(str(organization.id)),
+            UUID(str(user.id)),
+            user_info,
+            resuming=resume_from is not None,
+            wire_format=negotiated_format,
+            subprotocol=subprotocol,
         )
 
         try:
             # Send initial connection success message
             connection_message = await _send_connection_established_message(organization, user_info)
-            await websocket_manager.send_personal_message(
-                connection_message,
-                UUID(str(organization.id)),
-                UUID(str(user.id)),
+            await websocket_manager.send_to_connection(
+                UUID(str(organization.id)), UUID(str(user.id)), websocket, connection_message
             )
+            if resume_from is not None:
+                await websocket_manager.resume(
+                    UUID(str(organization.id)), UUID(str(user.id)), websocket, stream, resume_from
+                )
 
             # Handle WebSocket message loop
             await _websocket_message_loop(websocket, user, organization, handle_client_message)
@@ -390,6 +395,54 @@ async def websocket_collaboration_endpoint(
         await websocket.close(code=1011, reason="Internal server error")
 
 
+def _is_valid_topic(topic: Any) -> bool:
+    """Check a topic is `presence`, `stage:<pipeline stage>` or `lead:<uuid>`."""
+    if not isinstance(topic, str):
+        return False
+    if topic == PRESENCE_TOPIC:
+        return True
+
+    kind, _, value = topic.partition(":")
+    if kind == "stage":
+        return value in {stage.value for stage in PipelineStage}
+    if kind == "lead":
+        try:
+            UUID(value)
+            return True
+        except ValueError:
+            return False
+    return False
+
+
+async def _handle_subscription_message(
+    websocket: WebSocket, user: User, organization: Organization, message: Dict[str, Any]
+) -> None:
+    """Apply a subscribe / unsubscribe request and ack the connection's topics."""
+    org_id, user_id = UUID(str(organization.id)), UUID(str(user.id))
+    topics = message.get("topics")
+
+    if not isinstance(topics, list) or not all(_is_valid_topic(topic) for topic in topics):
+        await websocket_manager.send_to_connection(
+            org_id, user_id, websocket, {"type": "error", "message": "Invalid topics"}
+        )
+        return
+
+    if message.get("type") == "subscribe":
+        current = websocket_manager.connection_topics.get(websocket, set())
+        if len(current | set(topics)) > MAX_TOPICS_PER_CONNECTION:
+            await websocket_manager.send_to_connection(
+                org_id, user_id, websocket, {"type": "error", "message": "Too many topics"}
+            )
+            return
+        subscribed = websocket_manager.subscribe(org_id, user_id, websocket, topics)
+    else:
+        subscribed = websocket_manager.unsubscribe(org_id, websocket, topics)
+
+    await websocket_manager.send_to_connection(
+        org_id, user_id, websocket, {"type": "subscriptions", "topics": sorted(subscribed)}
+    )
+
+
 async def handle_client_message(
     websocket: WebSocket, user: User, organization: Organization, message: Dict[str, Any]
 ):
@@ -404,6 +457,9 @@ async def handle_client_message(
             UUID(str(user.id)),
         )
 
+    elif message_type in ("subscribe", "unsubscribe"):
+        await _handle_subscription_message(websocket, user, organization, message)
+
     elif message_type == "user_activity":
         # Update user activity status
         activity_type = message.get("activity", "active")
@@ -457,7 +513,7 @@ async def get_active_users(
             )
 
         org_uuid = UUID(organization_id)
-        active_users = websocket_manager.get_active_users(org_uuid)
+        active_users = await websocket_manager.get_active_users(org_uuid)
 
         return JSONResponse(
             {
@@ -485,6 +541,11 @@ async def websocket_pipeline_endpoint(
     websocket: WebSocket,
     token: str = Query(..., description="JWT access token"),
     org_id: str = Query(..., description="Organization ID"),
+    resume_from: Optional[int] = Query(None, description="Last event seq received"),
+    stream: Optional[str] = Query(None, description="Stream id the seq belongs to"),
+    wire_format: Optional[str] = Query(
+        None, alias="format", description="Frame format: json (default) or msgpack"
+    ),
 ):
     """Provide WebSocket endpoint specific for Pipeline Kanban real-time updates.
 
@@ -492,6 +553,10 @@ async def websocket_pipeline_endpoint(
     - token: JWT access token
     - org_id: Organization UUID
 
+    **Optional Query Parameters:**
+    - resume_from / stream: Resume cursor (same as /ws/collaborate)
+    - format: Frame format (same as /ws/collaborate)
+
     **Events Sent:**
     - lead_stage_changed: When a lead stage is moved by team member
     - lead_created: When a new lead is created by team member
@@ -499,6 +564,11 @@ async def websocket_pipeline_endpoint(
     - lead_deleted: When a lead is deleted by team member
     - pipeline_user_activity: When team member activity is detected
     - pipeline_connection_established: When connection is successfully established
+    - pipeline_event_batch: Drag / activity events coalesced within one window
+      (`events` holds the individual messages)
+    - subscriptions: The connection's topics after a subscribe / unsubscribe
+      (same topic protocol as /ws/collaborate)
+    - replay_complete / resync_required: Outcome of a resume
     """
     try:
         # Authenticate WebSocket connection
@@ -508,8 +578,17 @@ async def websocket_pipeline_endpoint(
         user_info = await _prepare_user_info(user)
 
         # Connect user to organization room
+        negotiated_format, subprotocol = negotiate_wire_format(
+            wire_format, websocket.scope.get("subprotocols", [])
+        )
         await websocket_manager.connect(
-            websocket, UUID(str(organization.id)), UUID(str(user.id)), user_info
+            websocket,
+            UUID(str(organization.id)),
+            UUID(str(user.id)),
+            user_info,
+            resuming=resume_from is not None,
+            wire_format=negotiated_format,
+            subprotocol=subprotocol,
         )
 
         try:
@@ -517,11 +596,13 @@ async def websocket_pipeline_endpoint(
             connection_message = await _send_connection_established_message(
                 organization, user_info, "pipeline_connection_established"
             )
-            await websocket_manager.send_personal_message(
-                connection_message,
-                UUID(str(organization.id)),
-                UUID(str(user.id)),
+            await websocket_manager.send_to_connection(
+                UUID(str(organization.id)), UUID(str(user.id)), websocket, connection_message
             )
+            if resume_from is not None:
+                await websocket_manager.resume(
+                    UUID(str(organization.id)), UUID(str(user.id)), websocket, stream, resume_from
+                )
 
             # Handle WebSocket message loop for pipeline
             await _websocket_message_loop(websocket, user, organization, handle_pipeline_message)
@@ -558,32 +639,21 @@ async def handle_pipeline_message(
             UUID(str(user.id)),
         )
 
-    elif message_type == "lead_drag_start":
-        # Broadcast drag start to other organization members
-        await websocket_manager.broadcast_to_organization(
-            UUID(str(organization.id)),
-            {
-                "type": "lead_drag_start",
-                "lead_id": message.get("lead_id"),
-                "user_id": str(user.id),
-                "user_name": user.full_name,
-                "timestamp": message.get("timestamp"),
-            },
-            exclude_user_id=UUID(str(user.id)),
-        )
+    elif message_type in ("subscribe", "unsubscribe"):
+        await _handle_subscription_message(websocket, user, organization, message)
 
-    elif message_type == "lead_drag_end":
-        # Broadcast drag end to other organization members
-        await websocket_manager.broadcast_to_organization(
+    elif message_type in ("lead_drag_start", "lead_drag_end"):
+        # Coalesced per lead and user: only each user's latest drag state in a window is sent
+        await pipeline_event_coalescer.submit(
             UUID(str(organization.id)),
+            ("lead_drag", message.get("lead_id"), str(user.id)),
             {
-                "type": "lead_drag_end",
+                "type": message_type,
                 "lead_id": message.get("lead_id"),
                 "user_id": str(user.id),
                 "user_name": user.full_name,
                 "timestamp": message.get("timestamp"),
             },
-            exclude_user_id=UUID(str(user.id)),
         )
 
     elif message_type == "stage_change":
@@ -607,9 +677,10 @@ async def handle_pipeline_message(
         # Update user activity status
         activity_type = message.get("activity", "active")
 
-        # Broadcast user activity to organization
-        await websocket_manager.broadcast_to_organization(
+        # Coalesced per user: only the latest activity in a window is sent
+        await pipeline_event_coalescer.submit(
             UUID(str(organization.id)),
+            ("user_activity", str(user.id)),
             {
                 "type": "pipeline_user_activity_update",
                 "user_id": str(user.id),
@@ -617,7 +688,6 @@ async def handle_pipeline_message(
                 "activity": activity_type,
                 "timestamp": message.get("timestamp"),
             },
-            exclude_user_id=UUID(str(user.id)),
         )
 
     else:
@@ -643,7 +713,7 @@ async def get_organization_collaboration_stats(
             )
 
         org_uuid = UUID(organization_id)
-        stats = websocket_manager.get_organization_stats(org_uuid)
+        stats = await websocket_manager.get_organization_stats(org_uuid)
 
         return JSONResponse(stats)
 
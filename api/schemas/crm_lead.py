@@ -8,9 +8,10 @@ from decimal import Decimal
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter
 
 from api.models.crm_lead import PipelineStage
+from api.models.crm_lead_note import LeadNoteKind
 
 
 class LeadBase(BaseModel):
@@ -94,6 +95,230 @@ class LeadListResponse(BaseModel):
     has_more: bool
 
 
+# Fields that can be requested through `fields=` (sparse fieldsets)
+LEAD_SPARSE_FIELDS = frozenset(LeadResponse.model_fields) - {"organization_id"}
+
+# Preset for Kanban cards: everything except bulky free text
+LEAD_CARD_FIELDS = (
+    "id",
+    "name",
+    "email",
+    "phone",
+    "stage",
+    "source",
+    "estimated_value",
+    "tags",
+    "assigned_user_id",
+    "is_favorite",
+    "last_contact_at",
+    "updated_at",
+    "is_closed",
+    "days_in_current_stage",
+)
+
+
+class LeadSparseResponse(BaseModel):
+    """Schema for lead responses restricted to the requested `fields`.
+
+    Only the requested fields are emitted (routes use exclude_unset).
+    """
+
+    id: UUID
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    source: Optional[str] = None
+    estimated_value: Optional[Decimal] = None
+    tags: Optional[List[str]] = None
+    notes: Optional[str] = None
+    stage: Optional[PipelineStage] = None
+    assigned_user_id: Optional[UUID] = None
+    last_contact_at: Optional[datetime] = None
+    last_contact_channel: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    is_favorite: Optional[bool] = None
+    is_closed: Optional[bool] = None
+    days_in_current_stage: Optional[int] = None
+
+
+class LeadSparseListResponse(BaseModel):
+    """Schema for paginated lead lists with sparse fieldsets."""
+
+    leads: List[LeadSparseResponse]
+    total_count: int
+    page: int
+    page_size: int
+    has_more: bool
+
+
+# Full lead response fields, in declaration order (used for row projections)
+LEAD_RESPONSE_FIELDS = tuple(LeadResponse.model_fields)
+
+# Columns written by the CSV / NDJSON export
+LEAD_EXPORT_FIELDS = tuple(field for field in LEAD_RESPONSE_FIELDS if field != "organization_id")
+
+# Pre-built validators turning whole result pages (rows) into response models
+# in a single call instead of one model_validate per lead.
+LEAD_ROWS_ADAPTER = TypeAdapter(List[LeadResponse])
+LEAD_SPARSE_ROWS_ADAPTER = TypeAdapter(List[LeadSparseResponse])
+
+
+class BoardColumn(BaseModel):
+    """Kanban column with stage totals and its first page of leads."""
+
+    stage: PipelineStage
+    count: int = Field(..., description="Total leads in stage")
+    total_value: Decimal = Field(..., description="Sum of estimated value in stage")
+    leads: List[LeadResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor to load more leads in this column (null when exhausted)"
+    )
+
+
+class PipelineBoardResponse(BaseModel):
+    """Schema for the single-request Kanban board."""
+
+    columns: List[BoardColumn]
+    total_leads: int
+
+
+class BoardColumnPage(BaseModel):
+    """Schema for loading more leads in a single Kanban column."""
+
+    stage: PipelineStage
+    leads: List[LeadResponse]
+    next_cursor: Optional[str] = None
+
+
+class LeadChangesResponse(BaseModel):
+    """Schema for incremental lead sync responses."""
+
+    updated: List[LeadResponse] = Field(..., description="Leads created or updated since cursor")
+    deleted: List[UUID] = Field(..., description="IDs of leads deleted since cursor")
+    next_cursor: Optional[str] = Field(None, description="Cursor to pass as `since` next time")
+    has_more: bool = Field(..., description="Whether more changes are immediately available")
+
+
+class LeadNoteCreate(BaseModel):
+    """Schema for appending a note to a lead."""
+
+    body: str = Field(..., min_length=1, description="Note text")
+
+
+class LeadNoteResponse(BaseModel):
+    """Schema for a lead note history entry."""
+
+    id: UUID
+    kind: LeadNoteKind
+    body: str
+    created_by: Optional[UUID] = None
+    created_at: datetime
+
+    class Config:
+        """Pydantic configuration."""
+
+        from_attributes = True
+
+
+class LeadNotesResponse(BaseModel):
+    """Schema for keyset-paged lead note history (newest first)."""
+
+    notes: List[LeadNoteResponse]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next (older) page")
+    has_more: bool
+
+
+class LeadBulkRequest(BaseModel):
+    """Schema for set-based bulk lead operations."""
+
+    lead_ids: List[UUID] = Field(..., min_length=1, max_length=1000, description="Leads to change")
+    action: str = Field(
+        ..., pattern=r"^(stage|assign|tags|delete)$", description="Bulk operation to apply"
+    )
+    stage: Optional[PipelineStage] = Field(None, description="Target stage (action=stage)")
+    assigned_user_id: Optional[UUID] = Field(
+        None, description="New assignee, null to unassign (action=assign)"
+    )
+    add_tags: List[str] = Field(default_factory=list, description="Tags to add (action=tags)")
+    remove_tags: List[str] = Field(default_factory=list, description="Tags to remove (action=tags)")
+
+
+class LeadBulkResponse(BaseModel):
+    """Result of a bulk lead operation."""
+
+    action: str
+    affected: int = Field(..., description="Leads changed")
+    lead_ids: List[UUID] = Field(..., description="IDs of the leads changed")
+    not_found: List[UUID] = Field(
+        default_factory=list, description="Requested IDs not found in organization"
+    )
+
+
+class LeadDuplicateClusterResponse(BaseModel):
+    """Candidate duplicate cluster with its leads (oldest first)."""
+
+    id: UUID
+    reasons: List[str] = Field(..., description="Matching keys: email, phone and/or name")
+    leads: List[LeadResponse]
+
+
+class LeadDuplicateClustersResponse(BaseModel):
+    """Schema for duplicate cluster listings."""
+
+    clusters: List[LeadDuplicateClusterResponse]
+
+
+class LeadDuplicateScanResponse(BaseModel):
+    """Acknowledgement for a scheduled duplicate scan."""
+
+    status: str = Field(default="scheduled")
+
+
+class LeadMergeRequest(BaseModel):
+    """Schema for merging duplicate leads into a primary lead."""
+
+    primary_id: UUID = Field(..., description="Lead that survives the merge")
+    duplicate_ids: List[UUID] = Field(
+        ..., min_length=1, max_length=50, description="Leads merged into the primary"
+    )
+
+
+class LeadMergeResponse(BaseModel):
+    """Result of a lead merge."""
+
+    lead: LeadResponse
+    merged_ids: List[UUID]
+    communications_moved: int
+    summaries_moved: int
+
+
+class LeadResolveResponse(BaseModel):
+    """Lead matching an inbound contact (None when no lead matches)."""
+
+    lead_id: Optional[UUID] = None
+
+
+class LeadImportError(BaseModel):
+    """Validation error for a single import row."""
+
+    row: int = Field(..., description="1-based data row number in the uploaded file")
+    message: str = Field(..., description="Validation error details")
+
+
+class LeadImportResponse(BaseModel):
+    """Summary of a bulk lead import."""
+
+    import_id: UUID
+    total_rows: int = Field(..., description="Data rows read from the file")
+    created: int = Field(..., description="Leads created")
+    duplicates: int = Field(..., description="Valid rows skipped as duplicates")
+    invalid: int = Field(..., description="Rows rejected by validation")
+    errors: List[LeadImportError] = Field(
+        default_factory=list, description="First row errors (capped)"
+    )
+
+
 class PipelineStatsResponse(BaseModel):
     """Schema for pipeline statistics."""
 
@@ -114,6 +339,9 @@ class LeadSearchRequest(BaseModel):
     query: str = Field(..., min_length=1, description="Search query")
     page: int = Field(default=1, ge=1, description="Page number")
     page_size: int = Field(default=20, ge=1, le=100, description="Items per page")
+    fields: Optional[str] = Field(
+        None, description="Comma-separated lead fields to return, or 'card' for the Kanban preset"
+    )
 
 
 class LeadBulkUpdateRequest(BaseModel):
@@ -181,6 +409,24 @@ class FilterOptionsResponse(BaseModel):
     stages: List[str] = Field(..., description="Available pipeline stages")
 
 
+class LeadTagSuggestion(BaseModel):
+    """Tag autocomplete entry."""
+
+    tag: str = Field(..., description="Tag name")
+    usage_count: int = Field(..., description="Number of leads carrying this tag")
+
+    class Config:
+        """Pydantic configuration."""
+
+        from_attributes = True
+
+
+class LeadTagSuggestionsResponse(BaseModel):
+    """Tag autocomplete response."""
+
+    tags: List[LeadTagSuggestion] = Field(..., description="Matching tags, most used first")
+
+
 class PipelineFilters(BaseModel):
     """Pipeline filter parameters."""
 
@@ -205,6 +451,11 @@ class AdvancedFiltersSchema(BaseModel):
         default_factory=list, description="Assigned user IDs to include"
     )
     tags: List[str] = Field(default_factory=list, description="Tags to include")
+    tag_match: str = Field(
+        default="all",
+        pattern=r"^(any|all)$",
+        description="Tag match mode: 'all' requires every tag, 'any' requires at least one",
+    )
     value_min: Optional[float] = Field(None, ge=0, description="Minimum estimated value")
     value_max: Optional[float] = Field(None, ge=0, description="Maximum estimated value")
 
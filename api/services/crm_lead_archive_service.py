@@ -0,0 +1,109 @@
+"""CRM Lead Archive Service.
+
+Moves long-closed leads (with their communications) out of the active tables.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from api.core.config import settings
+from api.core.database import SessionLocal
+from api.repositories.crm_lead_repository import CRMLeadRepository
+from api.services.crm_lead_resolver_service import lead_contact_cache
+from api.services.organization_service import run_pending_organization_purges
+
+logger = logging.getLogger(__name__)
+
+
+class CRMLeadArchiveService:
+    """Service for the lead archival tier.
+
+    FECHADO leads not updated for LEAD_ARCHIVE_AFTER_DAYS are copied to
+    archived_leads / archived_communications and deleted from the active
+    tables (with tombstones, so delta-sync clients drop them), one batch
+    of LEAD_ARCHIVE_BATCH_SIZE per transaction.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize service with database session."""
+        self.db = db
+        self.repository = CRMLeadRepository(db)
+
+    def archive_closed_leads(self) -> int:
+        """Archive every eligible lead in batches; return leads archived."""
+        closed_before = datetime.now(timezone.utc) - timedelta(
+            days=settings.LEAD_ARCHIVE_AFTER_DAYS
+        )
+        batch_size = settings.LEAD_ARCHIVE_BATCH_SIZE
+        archived = 0
+
+        while True:
+            batch = self.repository.get_archivable_leads(closed_before, batch_size)
+            if not batch:
+                break
+
+            by_organization: Dict[UUID, List[UUID]] = defaultdict(list)
+            for row in batch:
+                by_organization[row.organization_id].append(row.id)
+
+            try:
+                _, communications = self.repository.copy_leads_to_archive([row.id for row in batch])
+                for org_id, lead_ids in by_organization.items():
+                    self.repository.bulk_delete_with_tombstones(org_id, lead_ids)
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+
+            for org_id in by_organization:
+                lead_contact_cache.invalidate_organization(org_id)
+
+            archived += len(batch)
+            logger.info(
+                "Leads archived",
+                extra={
+                    "leads": len(batch),
+                    "communications": communications,
+                    "organizations": len(by_organization),
+                },
+            )
+            if len(batch) < batch_size:
+                break
+
+        return archived
+
+
+def run_lead_maintenance() -> None:
+    """Archive closed leads and purge expired tombstones with its own session."""
+    db = SessionLocal()
+    try:
+        archived = CRMLeadArchiveService(db).archive_closed_leads()
+        purged = CRMLeadRepository(db).purge_tombstones(
+            datetime.now(timezone.utc) - timedelta(days=settings.LEAD_TOMBSTONE_RETENTION_DAYS)
+        )
+        logger.info(
+            "Lead maintenance completed",
+            extra={"archived": archived, "tombstones_purged": purged},
+        )
+    except Exception as e:
+        db.rollback()
+        logger.error("Lead maintenance failed", extra={"error": str(e)}, exc_info=True)
+    finally:
+        db.close()
+
+
+async def lead_maintenance_loop() -> None:
+    """Run lead maintenance every LEAD_MAINTENANCE_INTERVAL_SECONDS (off the event loop).
+
+    Each run also resumes organization purges a restart left unfinished.
+    """
+    while True:
+        await asyncio.to_thread(run_lead_maintenance)
+        await asyncio.to_thread(run_pending_organization_purges)
+        await asyncio.sleep(settings.LEAD_MAINTENANCE_INTERVAL_SECONDS)
@@ -0,0 +1,396 @@
+"""CRM Lead Dedup Service.
+
+Duplicate detection (blocking keys + union-find) and transactional lead merge.
+"""
+
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from api.core.config import settings
+from api.core.database import SessionLocal
+from api.core.utils import normalize_email, normalize_phone
+from api.models.crm_audit_log import AuditAction
+from api.models.crm_lead import Lead
+from api.models.crm_lead_custom_fields import LeadCustomFields
+from api.models.organization import Organization
+from api.repositories.crm_lead_repository import CRMLeadRepository
+from api.schemas.crm_lead import (
+    LeadDuplicateClusterResponse,
+    LeadDuplicateClustersResponse,
+    LeadMergeRequest,
+    LeadMergeResponse,
+    LeadResponse,
+)
+from api.services.crm_lead_resolver_service import lead_contact_cache
+
+logger = logging.getLogger(__name__)
+
+SCAN_BATCH_SIZE = 1000
+
+# Fields a merge copies into the primary only when it has none
+MERGE_FILL_FIELDS = (
+    "email",
+    "phone",
+    "estimated_value",
+    "assigned_user_id",
+    "last_contact_channel",
+)
+
+
+def name_key(name: Optional[str]) -> Optional[str]:
+    """Name-similarity blocking key: accent-folded, lowercase, sorted tokens.
+
+    "Silva, João" and "joao  SILVA" share a key. Single-token names are too
+    common to block on and yield no key.
+    """
+    if not name:
+        return None
+    folded = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode().lower()
+    tokens = sorted(set(re.findall(r"[a-z0-9]+", folded)))
+    if len(tokens) < 2:
+        return None
+    return " ".join(tokens)
+
+
+def blocking_keys(row) -> List[Tuple[str, str]]:
+    """A lead row's (kind, key) blocking keys; empty fields yield none."""
+    keys = (
+        ("email", normalize_email(row.email)),
+        ("phone", normalize_phone(row.phone)),
+        ("name", name_key(row.name)),
+    )
+    return [(kind, key) for kind, key in keys if key]
+
+
+class _DisjointSets:
+    """Union-find over lead ids with path halving."""
+
+    def __init__(self) -> None:
+        """Initialize with every lead in its own set."""
+        self.parent: Dict[UUID, UUID] = {}
+
+    def find(self, lead_id: UUID) -> UUID:
+        """Root of the lead's set."""
+        parent = self.parent
+        root = parent.setdefault(lead_id, lead_id)
+        while root != parent[root]:
+            parent[root] = parent[parent[root]]
+            root = parent[root]
+        return root
+
+    def union(self, lead_ids: List[UUID]) -> None:
+        """Join the leads into one set."""
+        first = self.find(lead_ids[0])
+        for lead_id in lead_ids[1:]:
+            self.parent[self.find(lead_id)] = first
+
+
+def cluster_duplicates(rows, max_block_size: int) -> List[Tuple[List[UUID], List[str]]]:
+    """Group lead rows (id, name, email, phone) into candidate duplicate clusters.
+
+    Each lead is only compared through its blocking keys (email, phone,
+    name), and leads sharing a key are joined with union-find, so the work
+    is near-linear in the number of leads. Blocks larger than
+    `max_block_size` are skipped as too generic to be real duplicates.
+    """
+    blocks: Dict[Tuple[str, str], List[UUID]] = defaultdict(list)
+    order: List[UUID] = []
+    for row in rows:
+        order.append(row.id)
+        for block in blocking_keys(row):
+            blocks[block].append(row.id)
+
+    sets = _DisjointSets()
+    linked = [
+        (kind, lead_ids)
+        for (kind, _), lead_ids in blocks.items()
+        if 1 < len(lead_ids) <= max_block_size
+    ]
+    for _, lead_ids in linked:
+        sets.union(lead_ids)
+
+    reasons: Dict[UUID, set] = defaultdict(set)
+    for kind, lead_ids in linked:
+        reasons[sets.find(lead_ids[0])].add(kind)
+
+    members: Dict[UUID, List[UUID]] = defaultdict(list)
+    for lead_id in order:
+        if lead_id in sets.parent:
+            members[sets.find(lead_id)].append(lead_id)
+
+    return [
+        (lead_ids, sorted(reasons[root])) for root, lead_ids in members.items() if len(lead_ids) > 1
+    ]
+
+
+def run_duplicate_scan(org_id: UUID) -> None:
+    """Background entry point: scan an organization with its own session."""
+    db = SessionLocal()
+    try:
+        CRMLeadDedupService(db).scan(org_id)
+    except Exception as e:
+        db.rollback()
+        logger.error(
+            "Lead duplicate scan failed",
+            extra={"organization_id": str(org_id), "error": str(e)},
+            exc_info=True,
+        )
+    finally:
+        db.close()
+
+
+class CRMLeadDedupService:
+    """Service for lead duplicate detection and merging with organizational scope."""
+
+    def __init__(self, db: Session):
+        """Initialize service with database session."""
+        self.db = db
+        self.repository = CRMLeadRepository(db)
+
+    def scan(self, org_id: UUID) -> int:
+        """Recompute duplicate clusters for organization; return cluster count."""
+        rows = (
+            self.repository.get_rows_query(org_id, ("id", "name", "email", "phone"))
+            .order_by(Lead.created_at, Lead.id)
+            .yield_per(SCAN_BATCH_SIZE)
+        )
+        clusters = cluster_duplicates(rows, settings.LEAD_DEDUP_MAX_BLOCK_SIZE)
+        self.repository.replace_duplicate_clusters(org_id, clusters)
+
+        logger.info(
+            "Lead duplicate scan completed",
+            extra={"organization_id": str(org_id), "clusters": len(clusters)},
+        )
+        return len(clusters)
+
+    def get_clusters(
+        self, organization: Organization, page: int = 1, page_size: int = 20
+    ) -> LeadDuplicateClustersResponse:
+        """Get candidate duplicate clusters with their leads."""
+        try:
+            clusters = self.repository.get_duplicate_clusters(
+                organization.id, skip=(page - 1) * page_size, limit=page_size
+            )
+            lead_ids = {lead_id for cluster in clusters for lead_id in cluster.lead_ids}
+            leads = {
+                lead.id: lead
+                for lead in self.repository.get_by_ids(organization.id, list(lead_ids))
+            }
+
+            responses = []
+            for cluster in clusters:
+                cluster_leads = [leads[lead_id] for lead_id in cluster.lead_ids if lead_id in leads]
+                # Leads deleted since the scan can leave a cluster with one member
+                if len(cluster_leads) > 1:
+                    responses.append(
+                        LeadDuplicateClusterResponse(
+                            id=cluster.id,
+                            reasons=cluster.reasons,
+                            leads=[LeadResponse.model_validate(lead) for lead in cluster_leads],
+                        )
+                    )
+
+            return LeadDuplicateClustersResponse(clusters=responses)
+
+        except Exception as e:
+            logger.error(
+                "Failed to get duplicate clusters",
+                extra={"organization_id": str(organization.id), "error": str(e)},
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve duplicate clusters",
+            )
+
+    async def merge_leads(
+        self,
+        organization: Organization,
+        merge_request: LeadMergeRequest,
+        user_id: Optional[UUID] = None,
+    ) -> LeadMergeResponse:
+        """Merge duplicate leads into a primary lead in one transaction.
+
+        Communications (with their attachments) and AI summaries are
+        re-pointed to the primary, blank primary fields are filled from the
+        duplicates, and the duplicates are deleted with tombstones.
+        """
+        duplicate_ids = [
+            lead_id
+            for lead_id in dict.fromkeys(merge_request.duplicate_ids)
+            if lead_id != merge_request.primary_id
+        ]
+        if not duplicate_ids:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="duplicate_ids must contain leads other than the primary",
+            )
+
+        try:
+            leads = self.repository.get_by_ids(
+                organization.id, [merge_request.primary_id, *duplicate_ids], for_update=True
+            )
+            by_id = {lead.id: lead for lead in leads}
+            if len(by_id) != len(duplicate_ids) + 1:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Lead not found")
+
+            primary = by_id[merge_request.primary_id]
+            duplicates = [lead for lead in leads if lead.id != primary.id]
+
+            # The primary may take over a duplicate's email / phone, so its
+            # unique contact keys must not be flushed before duplicates are gone
+            with self.db.no_autoflush:
+                changed = self._merge_fields(primary, duplicates)
+                communications_moved, summaries_moved = self.repository.repoint_lead_children(
+                    organization.id, duplicate_ids, primary.id
+                )
+                self.repository.bulk_delete_with_tombstones(organization.id, duplicate_ids)
+            self.repository.delete_duplicate_clusters_with(
+                organization.id, [primary.id, *duplicate_ids]
+            )
+            self.repository.write_audit_batch(
+                organization.id,
+                user_id,
+                AuditAction.UPDATE,
+                [(primary.id, None, {"merged_from": [str(i) for i in duplicate_ids], **changed})],
+            )
+            self.repository.write_audit_batch(
+                organization.id,
+                user_id,
+                AuditAction.DELETE,
+                [
+                    (lead.id, {"name": lead.name, "merged_into": str(primary.id)}, None)
+                    for lead in duplicates
+                ],
+            )
+
+            self.db.commit()
+            self.db.refresh(primary)
+            lead_contact_cache.invalidate_organization(organization.id)
+
+        except HTTPException:
+            self.db.rollback()
+            raise
+        except Exception as e:
+            self.db.rollback()
+            logger.error(
+                "Failed to merge leads",
+                extra={
+                    "organization_id": str(organization.id),
+                    "primary_id": str(merge_request.primary_id),
+                    "duplicate_ids": [str(i) for i in duplicate_ids],
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to merge leads"
+            )
+
+        logger.info(
+            "Leads merged",
+            extra={
+                "organization_id": str(organization.id),
+                "primary_id": str(primary.id),
+                "merged": len(duplicate_ids),
+            },
+        )
+        await self._broadcast_merge(organization, primary.id, duplicate_ids, user_id)
+
+        return LeadMergeResponse(
+            lead=LeadResponse.model_validate(primary),
+            merged_ids=duplicate_ids,
+            communications_moved=communications_moved,
+            summaries_moved=summaries_moved,
+        )
+
+    @staticmethod
+    def _merge_fields(primary: Lead, duplicates: List[Lead]) -> Dict:
+        """Fill the primary from duplicates (oldest first); return changed fields."""
+        changed = CRMLeadDedupService._fill_missing_fields(primary, duplicates)
+
+        tags = list(
+            dict.fromkeys([*(primary.tags or []), *(t for d in duplicates for t in d.tags or [])])
+        )
+        if tags != (primary.tags or []):
+            primary.tags = tags
+            changed["tags"] = tags
+
+        # Note history moves with the children; the merged text becomes the current notes
+        notes = [lead.notes for lead in [primary, *duplicates] if lead.notes]
+        if len(notes) > 1:
+            primary.add_note("\n\n".join(notes))
+            changed["notes"] = "merged"
+
+        contacts = [lead.last_contact_at for lead in [primary, *duplicates] if lead.last_contact_at]
+        if contacts and max(contacts) != primary.last_contact_at:
+            primary.last_contact_at = max(contacts)
+            changed["last_contact_at"] = primary.last_contact_at.isoformat()
+
+        if not primary.is_favorite and any(lead.is_favorite for lead in duplicates):
+            primary.is_favorite = True
+            changed["is_favorite"] = True
+
+        CRMLeadDedupService._merge_custom_fields(primary, duplicates)
+        return changed
+
+    @staticmethod
+    def _fill_missing_fields(primary: Lead, duplicates: List[Lead]) -> Dict:
+        """Set the primary's empty MERGE_FILL_FIELDS from the first duplicate having them."""
+        changed: Dict = {}
+        for field in MERGE_FILL_FIELDS:
+            if getattr(primary, field) is not None:
+                continue
+            value = next(
+                (getattr(lead, field) for lead in duplicates if getattr(lead, field) is not None),
+                None,
+            )
+            if value is not None:
+                setattr(primary, field, value)
+                changed[field] = str(value)
+        return changed
+
+    @staticmethod
+    def _merge_custom_fields(primary: Lead, duplicates: List[Lead]) -> None:
+        """Union custom fields; the primary's values win, then the oldest duplicate's."""
+        custom_fields: Dict = {}
+        for lead in [*reversed(duplicates), primary]:
+            custom_fields.update(lead.custom_fields.fields if lead.custom_fields else {})
+        if primary.custom_fields is None and custom_fields:
+            primary.custom_fields = LeadCustomFields(
+                organization_id=primary.organization_id, fields=custom_fields
+            )
+        elif primary.custom_fields is not None and custom_fields != primary.custom_fields.fields:
+            primary.custom_fields.fields = custom_fields
+
+    async def _broadcast_merge(
+        self,
+        organization: Organization,
+        primary_id: UUID,
+        merged_ids: List[UUID],
+        user_id: Optional[UUID],
+    ) -> None:
+        """Broadcast one merge event to the organization."""
+        try:
+            from api.core.websocket_manager import websocket_manager
+
+            await websocket_manager.broadcast_to_organization(
+                organization.id,
+                {
+                    "type": "leads_merged",
+                    "lead_id": str(primary_id),
+                    "merged_ids": [str(lead_id) for lead_id in merged_ids],
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "user_id": str(user_id) if user_id else None,
+                },
+            )
+        except Exception as e:
+            logger.error(f"Failed to broadcast lead merge: {e}")
@@ -0,0 +1,101 @@
+"""CRM Lead Event Relay.
+
+Drains the lead outbox and publishes committed lead changes to subscribers.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional
+
+from api.core.config import settings
+from api.core.database import SessionLocal
+from api.core.websocket_manager import websocket_manager
+from api.models.crm_lead_event import LeadOutboxEvent
+from api.repositories.crm_lead_repository import CRMLeadRepository
+
+logger = logging.getLogger(__name__)
+
+
+class LeadEventRelay:
+    """Publish lead outbox events in batches, off the request path.
+
+    Delivery is at-least-once: a batch is deleted only after every event in
+    it was published, so a crash mid-batch republishes it. Writers call
+    `notify()` after committing to skip the poll delay; events committed by
+    other processes are picked up every LEAD_EVENT_RELAY_POLL_SECONDS.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an idle relay."""
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def notify(self) -> None:
+        """Wake the relay (safe to call from request threads)."""
+        if self._loop is None or self._wakeup is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # Event loop already closed (shutdown)
+            pass
+
+    async def publish(self, event: LeadOutboxEvent) -> None:
+        """Deliver one event to the organization's WebSocket subscribers."""
+        await websocket_manager.broadcast_to_organization(
+            event.organization_id, dict(event.payload), replayable=True
+        )
+
+    async def drain(self) -> int:
+        """Publish every pending event; return the number delivered."""
+        db = SessionLocal()
+        repository = CRMLeadRepository(db)
+        batch_size = settings.LEAD_EVENT_RELAY_BATCH_SIZE
+        delivered = 0
+        try:
+            while True:
+                events: List[LeadOutboxEvent] = await asyncio.to_thread(
+                    repository.claim_outbox_events, batch_size
+                )
+                if not events:
+                    break
+
+                for event in events:
+                    await self.publish(event)
+
+                await asyncio.to_thread(
+                    self._acknowledge, db, repository, [event.id for event in events]
+                )
+                delivered += len(events)
+                if len(events) < batch_size:
+                    break
+        except Exception as e:
+            db.rollback()
+            logger.error("Lead event relay failed", extra={"error": str(e)}, exc_info=True)
+        finally:
+            db.close()
+        return delivered
+
+    @staticmethod
+    def _acknowledge(db, repository: CRMLeadRepository, event_ids: List[int]) -> None:
+        """Delete a published batch and release its row locks."""
+        repository.delete_outbox_events(event_ids)
+        db.commit()
+
+    async def run(self) -> None:
+        """Drain the outbox whenever notified, and at least every poll interval."""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        while True:
+            self._wakeup.clear()
+            await self.drain()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=settings.LEAD_EVENT_RELAY_POLL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+
+
+# Global relay instance (started on application startup)
+lead_event_relay = LeadEventRelay()
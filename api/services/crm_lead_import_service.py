@@ -0,0 +1,327 @@
+"""CRM Lead Import Service.
+
+Bulk lead import from CSV / NDJSON files with deduplication.
+"""
+
+import asyncio
+import csv
+import io
+import logging
+import threading
+from datetime import datetime
+from functools import partial
+from typing import Awaitable, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+import orjson
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from api.core.config import settings
+from api.core.utils import normalize_email, normalize_phone
+from api.core.websocket_manager import websocket_manager
+from api.models.organization import Organization
+from api.repositories.crm_lead_repository import CRMLeadRepository
+from api.schemas.crm_lead import LeadCreate, LeadImportError, LeadImportResponse
+
+logger = logging.getLogger(__name__)
+
+
+class _ImportProgress:
+    """Latest-wins progress reporter fed from the import worker thread.
+
+    The worker only records counts; the event loop sends them with at most
+    one send pending and LEAD_IMPORT_PROGRESS_INTERVAL_MS between frames, so
+    a long import can't fill the user's WebSocket send queue.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        send: Callable[[int, int, int], Awaitable[None]],
+    ):
+        self.loop = loop
+        self.send = send
+        self._lock = threading.Lock()
+        self._latest: Optional[Tuple[int, int, int]] = None
+        self._scheduled = False
+        self._last_sent = float("-inf")
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def report(self, processed: int, valid: int, invalid: int) -> None:
+        """Record counts from the worker thread and wake the loop if idle."""
+        with self._lock:
+            self._latest = (processed, valid, invalid)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self.loop.call_soon_threadsafe(self._start)
+
+    def _start(self) -> None:
+        self._task = self.loop.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        interval = settings.LEAD_IMPORT_PROGRESS_INTERVAL_MS / 1000
+        delay = self._last_sent + interval - self.loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        with self._lock:
+            counts, self._latest, self._scheduled = self._latest, None, False
+        self._last_sent = self.loop.time()
+        if counts:
+            await self.send(*counts)
+
+    def cancel(self) -> None:
+        """Drop a pending frame; the import summary supersedes it."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+
+class CRMLeadImportService:
+    """Service for bulk lead imports with organizational scope.
+
+    Rows are validated in chunks of LEAD_IMPORT_CHUNK_SIZE and batch-inserted
+    into a per-transaction staging table; a single INSERT ... SELECT then
+    merges them into leads, skipping duplicates. The import runs in a worker
+    thread so it doesn't block the event loop; throttled progress is sent to
+    the importing user and one summary event is broadcast to the
+    organization at the end.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize service with database session."""
+        self.db = db
+        self.repository = CRMLeadRepository(db)
+
+    async def import_leads(
+        self,
+        organization: Organization,
+        source: BinaryIO,
+        import_format: str = "csv",
+        user_id: Optional[UUID] = None,
+    ) -> LeadImportResponse:
+        """Import leads from a CSV or NDJSON file."""
+        import_id = uuid4()
+        organization_id = UUID(str(organization.id))
+        progress = None
+        if user_id:
+            progress = _ImportProgress(
+                asyncio.get_running_loop(),
+                partial(self._send_progress, organization_id, user_id, import_id),
+            )
+
+        try:
+            result = await asyncio.to_thread(
+                self._run_import,
+                organization_id,
+                source,
+                import_format,
+                import_id,
+                progress.report if progress else None,
+            )
+        finally:
+            if progress:
+                progress.cancel()
+
+        await self._broadcast_summary(organization_id, result, user_id)
+        return result
+
+    def _run_import(
+        self,
+        organization_id: UUID,
+        source: BinaryIO,
+        import_format: str,
+        import_id: UUID,
+        on_progress: Optional[Callable[[int, int, int], None]],
+    ) -> LeadImportResponse:
+        """Parse, validate, stage and merge an import file (runs in a worker thread)."""
+        total_rows = 0
+        staged = 0
+        invalid = 0
+        errors: List[LeadImportError] = []
+
+        try:
+            self.repository.create_import_staging()
+
+            for chunk in self._iter_chunks(self._iter_records(source, import_format)):
+                rows, chunk_errors = self._validate_chunk(chunk)
+                self.repository.stage_import_rows(rows)
+
+                total_rows += len(chunk)
+                staged += len(rows)
+                invalid += len(chunk_errors)
+                errors.extend(chunk_errors[: settings.LEAD_IMPORT_MAX_ERRORS - len(errors)])
+
+                if on_progress:
+                    on_progress(total_rows, staged, invalid)
+
+            created = self.repository.merge_import_staging(organization_id)
+            self.db.commit()
+
+        except Exception as e:
+            self.db.rollback()
+            logger.error(
+                "Failed to import leads",
+                extra={
+                    "organization_id": str(organization_id),
+                    "import_id": str(import_id),
+                    "rows_read": total_rows,
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to import leads"
+            )
+
+        result = LeadImportResponse(
+            import_id=import_id,
+            total_rows=total_rows,
+            created=created,
+            duplicates=staged - created,
+            invalid=invalid,
+            errors=errors,
+        )
+        logger.info(
+            "Leads imported",
+            extra={
+                "organization_id": str(organization_id),
+                **result.model_dump(exclude={"errors"}),
+            },
+        )
+        return result
+
+    def _iter_records(self, source: BinaryIO, import_format: str) -> Iterator[Tuple[int, Dict]]:
+        """Yield (row_number, raw record) pairs; unparseable NDJSON lines yield an error."""
+        text = io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+        try:
+            if import_format == "csv":
+                for row_number, record in enumerate(csv.DictReader(text), start=1):
+                    yield row_number, self._clean_csv_record(record)
+                return
+
+            row_number = 0
+            for line in text:
+                if not line.strip():
+                    continue
+                row_number += 1
+                try:
+                    yield row_number, orjson.loads(line)
+                except orjson.JSONDecodeError as e:
+                    yield row_number, e
+        finally:
+            # Leave the underlying upload file open for its owner
+            text.detach()
+
+    @staticmethod
+    def _clean_csv_record(record: Dict[str, Optional[str]]) -> Dict:
+        """Drop empty CSV cells (so schema defaults apply) and split ';' tags."""
+        cleaned = {
+            key.strip().lower(): value.strip()
+            for key, value in record.items()
+            if key and isinstance(value, str) and value.strip()
+        }
+        if "tags" in cleaned:
+            cleaned["tags"] = [tag.strip() for tag in cleaned["tags"].split(";") if tag.strip()]
+        return cleaned
+
+    @staticmethod
+    def _iter_chunks(records: Iterator[Tuple[int, Dict]]) -> Iterator[List[Tuple[int, Dict]]]:
+        """Group records into chunks of LEAD_IMPORT_CHUNK_SIZE."""
+        chunk: List[Tuple[int, Dict]] = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= settings.LEAD_IMPORT_CHUNK_SIZE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _validate_chunk(
+        self, chunk: List[Tuple[int, Dict]]
+    ) -> Tuple[List[Dict], List[LeadImportError]]:
+        """Validate a chunk, returning staging rows and row errors."""
+        rows: List[Dict] = []
+        errors: List[LeadImportError] = []
+
+        for row_number, record in chunk:
+            if isinstance(record, Exception):
+                errors.append(LeadImportError(row=row_number, message=f"Invalid JSON: {record}"))
+                continue
+            try:
+                lead = LeadCreate.model_validate(record)
+            except ValidationError as e:
+                errors.append(
+                    LeadImportError(
+                        row=row_number,
+                        message="; ".join(
+                            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                            for error in e.errors()
+                        ),
+                    )
+                )
+                continue
+
+            rows.append(
+                {
+                    "row_number": row_number,
+                    "lead_id": uuid4(),
+                    "name": lead.name,
+                    "email": lead.email,
+                    "phone": lead.phone,
+                    "email_key": normalize_email(lead.email),
+                    "phone_key": normalize_phone(lead.phone),
+                    "stage": lead.stage.value,
+                    "source": lead.source,
+                    "estimated_value": lead.estimated_value,
+                    "tags": lead.tags or [],
+                    "notes": lead.notes,
+                    "assigned_user_id": lead.assigned_user_id,
+                }
+            )
+
+        return rows, errors
+
+    async def _send_progress(
+        self,
+        organization_id: UUID,
+        user_id: UUID,
+        import_id: UUID,
+        processed: int,
+        valid: int,
+        invalid: int,
+    ) -> None:
+        """Send import progress to the importing user."""
+        try:
+            await websocket_manager.send_personal_message(
+                {
+                    "type": "lead_import_progress",
+                    "import_id": str(import_id),
+                    "processed": processed,
+                    "valid": valid,
+                    "invalid": invalid,
+                    "timestamp": datetime.utcnow().isoformat(),
+                },
+                organization_id,
+                user_id,
+            )
+        except Exception as e:
+            logger.error(f"Failed to send lead import progress: {e}")
+
+    async def _broadcast_summary(
+        self, organization_id: UUID, result: LeadImportResponse, user_id: Optional[UUID]
+    ) -> None:
+        """Broadcast one import summary event to the organization."""
+        try:
+            await websocket_manager.broadcast_to_organization(
+                organization_id,
+                {
+                    "type": "leads_imported",
+                    **result.model_dump(mode="json", exclude={"errors"}),
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "user_id": str(user_id) if user_id else None,
+                },
+            )
+        except Exception as e:
+            logger.error(f"Failed to broadcast lead import summary: {e}")
@@ -0,0 +1,134 @@
+"""CRM Lead Resolver Service.
+
+Resolve inbound contacts (email / phone) to lead IDs with an in-process cache.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from api.core.config import settings
+from api.core.utils import normalize_email, normalize_phone
+from api.repositories.crm_lead_repository import CRMLeadRepository
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[UUID, str, str]
+
+
+class LeadContactCache:
+    """Thread-safe LRU of (org_id, kind, key) -> lead_id with a TTL.
+
+    Only hits are cached, so a lead created after a miss is found on the
+    next lookup. Entries are dropped when the lead's contact changes or it
+    is deleted in this process; the TTL bounds staleness from other workers.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        """Initialize an empty cache."""
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, Tuple[UUID, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Optional[UUID]:
+        """Return the cached lead ID, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            lead_id, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return lead_id
+
+    def set(self, key: CacheKey, lead_id: UUID) -> None:
+        """Cache a lead ID, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (lead_id, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self, org_id: UUID, email_key: Optional[str] = None, phone_key: Optional[str] = None
+    ) -> None:
+        """Drop the entries for a lead's contact keys."""
+        with self._lock:
+            if email_key:
+                self._entries.pop((org_id, "email", email_key), None)
+            if phone_key:
+                self._entries.pop((org_id, "phone", phone_key), None)
+
+    def invalidate_organization(self, org_id: UUID) -> None:
+        """Drop every entry of an organization (bulk deletes, merges)."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == org_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+lead_contact_cache = LeadContactCache(
+    settings.LEAD_RESOLVER_CACHE_SIZE, settings.LEAD_RESOLVER_CACHE_TTL_SECONDS
+)
+
+
+class CRMLeadResolverService:
+    """Service for contact -> lead resolution with organizational scope."""
+
+    def __init__(self, db: Session):
+        """Initialize service with database session."""
+        self.db = db
+        self.repository = CRMLeadRepository(db)
+
+    def resolve(
+        self, org_id: UUID, phone: Optional[str] = None, email: Optional[str] = None
+    ) -> Optional[UUID]:
+        """Resolve a phone and/or email to a lead ID (phone first).
+
+        Each lookup is one equality probe on the unique per-organization
+        contact key index, served from the in-process cache when possible.
+        """
+        lookups = [("phone", normalize_phone(phone)), ("email", normalize_email(email))]
+        if not any(key for _, key in lookups):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="A valid phone or email is required",
+            )
+
+        try:
+            for kind, key in lookups:
+                if not key:
+                    continue
+                cache_key = (org_id, kind, key)
+                lead_id = lead_contact_cache.get(cache_key)
+                if lead_id is None:
+                    lead_id = self.repository.get_id_by_contact_key(org_id, kind, key)
+                    if lead_id is not None:
+                        lead_contact_cache.set(cache_key, lead_id)
+                if lead_id is not None:
+                    return lead_id
+            return None
+
+        except Exception as e:
+            logger.error(
+                "Failed to resolve lead contact",
+                extra={"organization_id": str(org_id), "error": str(e)},
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to resolve lead",
+            )
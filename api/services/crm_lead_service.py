@@ -3,38 +3,76 @@
 Business logic for Lead management with organizational isolation.
 """
 
+import csv
+import io
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional
+import zlib
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional, Union
 from uuid import UUID
 
+import orjson
 from fastapi import HTTPException, status
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from api.core.config import settings
+from api.core.database import SessionLocal
+from api.core.pagination import decode_cursor, encode_cursor
+from api.models.crm_audit_log import AuditAction
 from api.models.crm_lead import Lead, PipelineStage
+from api.models.crm_lead_note import LeadNoteKind
 from api.models.organization import Organization
 from api.repositories.crm_lead_repository import CRMLeadRepository
 from api.schemas.crm_lead import (
+    LEAD_CARD_FIELDS,
+    LEAD_EXPORT_FIELDS,
+    LEAD_RESPONSE_FIELDS,
+    LEAD_ROWS_ADAPTER,
+    LEAD_SPARSE_FIELDS,
+    LEAD_SPARSE_ROWS_ADAPTER,
     AdvancedFiltersSchema,
     AdvancedMetricsResponse,
+    BoardColumn,
+    BoardColumnPage,
     BottleneckAnalysis,
     ConversionFunnelStage,
     ConversionMetricsResponse,
     ExecutiveSummary,
     FilterOptionsResponse,
+    LeadBulkRequest,
+    LeadBulkResponse,
+    LeadChangesResponse,
     LeadCreate,
     LeadFavoriteToggle,
     LeadListResponse,
+    LeadNoteCreate,
+    LeadNoteResponse,
+    LeadNotesResponse,
     LeadResponse,
+    LeadSparseListResponse,
     LeadStageUpdate,
+    LeadTagSuggestion,
+    LeadTagSuggestionsResponse,
     LeadUpdate,
+    PipelineBoardResponse,
     PipelineStatsResponse,
     StageDistribution,
     TrendingData,
 )
+from api.services.crm_lead_event_relay import lead_event_relay
+from api.services.crm_lead_resolver_service import lead_contact_cache
 
 logger = logging.getLogger(__name__)
 
+# Leading characters that make spreadsheets read a CSV cell as a formula
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+# Delta-sync cursors at a sync time use an id sorting after every lead id
+SYNC_CURSOR_ID = UUID(int=(1 << 128) - 1)
+
 
 class CRMLeadService:
     """Service for Lead business logic with organizational scope."""
@@ -59,13 +97,34 @@ class CRMLeadService:
                 source=lead_data.source,
                 estimated_value=lead_data.estimated_value,
                 tags=lead_data.tags or [],
-                notes=lead_data.notes,
                 assigned_user_id=lead_data.assigned_user_id,
             )
+            if lead_data.notes:
+                lead.add_note(lead_data.notes, created_by=user_id)
 
             self.db.add(lead)
+            self.db.flush()
+            self._enqueue_event(
+                organization.id,
+                {
+                    "type": "lead_created",
+                    "lead": {
+                        "id": str(lead.id),
+                        "name": lead.name,
+                        "email": lead.email,
+                        "stage": self._audit_value(lead.stage),
+                        "estimated_value": (
+                            str(lead.estimated_value) if lead.estimated_value else None
+                        ),
+                        "organization_id": str(organization.id),
+                    },
+                    # Everyone gets the event, the creator included
+                    "user_id": str(user_id) if user_id else None,
+                },
+            )
             self.db.commit()
             self.db.refresh(lead)
+            lead_event_relay.notify()
 
             logger.info(
                 "Lead created successfully",
@@ -77,42 +136,14 @@ class CRMLeadService:
                 },
             )
 
-            # Broadcast lead creation event to organization
-            try:
-                lead_dict = {
-                    "id": str(lead.id),
-                    "name": lead.name,
-                    "email": lead.email,
-                    "stage": lead.stage.value if hasattr(lead.stage, "value") else lead.stage,
-                    "estimated_value": str(lead.estimated_value) if lead.estimated_value else None,
-                    "organization_id": str(organization.id),
-                }
-
-                # Import here to avoid circular imports
-                from api.core.websocket_manager import websocket_manager
-
-                event_message = {
-                    "type": "lead_created",
-                    "lead": lead_dict,
-                    "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
-                    "user_id": str(user_id) if user_id else None,
-                }
-
-                # Now we can use async/await directly since the method is async
-                # Note: We include the creator in the broadcast for better UX in collaborative environments
-                try:
-                    await websocket_manager.broadcast_to_organization(
-                        organization.id,
-                        event_message,  # No exclude_user_id - everyone gets the event
-                    )
-                except Exception as broadcast_error:
-                    logger.error(f"Failed to broadcast lead creation event: {broadcast_error}")
-
-            except Exception as e:
-                logger.error(f"Failed to prepare lead creation broadcast: {e}")
-
             return lead
 
+        except IntegrityError:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Lead with this email or phone already exists",
+            )
         except Exception as e:
             self.db.rollback()
             logger.error(
@@ -134,34 +165,45 @@ class CRMLeadService:
         page: int = 1,
         page_size: int = 20,
         stage: Optional[PipelineStage] = None,
-    ) -> LeadListResponse:
-        """Get leads for organization with pagination and optional stage filter."""
+        fields: Optional[str] = None,
+        include_archived: bool = False,
+    ) -> Union[LeadListResponse, LeadSparseListResponse]:
+        """Get leads for organization with pagination and optional stage filter.
+
+        Leads are read as plain rows (derived fields computed in SQL). With
+        `fields`, only the matching columns are selected and a
+        LeadSparseListResponse is returned. With `include_archived`, archived
+        leads are listed alongside active ones.
+        """
+        sparse_fields = self._parse_fields(fields)
+
         try:
             skip = (page - 1) * page_size
 
+            get_rows = (
+                self.repository.get_rows_with_archive
+                if include_archived
+                else self.repository.get_rows_by_organization
+            )
+            rows = get_rows(
+                org_id=organization.id,
+                fields=sparse_fields or LEAD_RESPONSE_FIELDS,
+                skip=skip,
+                limit=page_size,
+                stage=stage,
+            )
             if stage:
-                leads = self.repository.get_by_organization_and_stage(
-                    org_id=organization.id, stage=stage
+                total_count = self.repository.count_by_organization_and_stage(
+                    organization.id, stage
                 )
-                # Apply pagination manually for stage filter
-                total_count = len(leads)
-                leads = leads[skip : skip + page_size]
             else:
-                leads = self.repository.get_by_organization(
-                    org_id=organization.id, skip=skip, limit=page_size
-                )
                 total_count = self.repository.count_by_organization(organization.id)
+            if include_archived:
+                total_count += self.repository.count_archived(organization.id, stage)
 
-            # Convert to response models with computed properties
-            lead_responses = []
-            for lead in leads:
-                lead_response = LeadResponse.model_validate(lead)
-                lead_response.is_closed = lead.is_closed
-                lead_response.days_in_current_stage = lead.days_in_current_stage
-                lead_responses.append(lead_response)
-
-            return LeadListResponse(
-                leads=lead_responses,
+            return self._rows_to_list_response(
+                rows,
+                sparse_fields,
                 total_count=total_count,
                 page=page,
                 page_size=page_size,
@@ -184,6 +226,266 @@ class CRMLeadService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve leads"
             )
 
+    def get_pipeline_board(
+        self, organization: Organization, per_stage: int = 20
+    ) -> PipelineBoardResponse:
+        """Get every Kanban column (totals + first leads) in one query."""
+        try:
+            rows = self.repository.get_board(organization.id, per_stage)
+
+            columns: Dict[str, BoardColumn] = {
+                stage.value: BoardColumn(stage=stage, count=0, total_value=Decimal("0"), leads=[])
+                for stage in PipelineStage
+            }
+            for lead, stage_count, stage_value in rows:
+                stage_key = lead.stage.value if hasattr(lead.stage, "value") else lead.stage
+                column = columns.get(stage_key)
+                if column is None:
+                    continue
+                column.count = stage_count
+                column.total_value = stage_value
+                column.leads.append(self._to_lead_response(lead))
+
+            for column in columns.values():
+                if column.count > len(column.leads):
+                    last = column.leads[-1]
+                    column.next_cursor = encode_cursor(last.updated_at, last.id)
+
+            return PipelineBoardResponse(
+                columns=list(columns.values()),
+                total_leads=sum(column.count for column in columns.values()),
+            )
+
+        except Exception as e:
+            logger.error(
+                "Failed to get pipeline board",
+                extra={"organization_id": str(organization.id), "error": str(e)},
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve pipeline board",
+            )
+
+    def get_board_column_page(
+        self,
+        organization: Organization,
+        stage: PipelineStage,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+    ) -> BoardColumnPage:
+        """Load more leads for a single Kanban column after the given cursor."""
+        after = decode_cursor(cursor) if cursor else None
+
+        try:
+            # Fetch one extra row to know whether another page exists
+            leads = self.repository.get_stage_page(organization.id, stage, limit + 1, after)
+            has_more = len(leads) > limit
+            leads = leads[:limit]
+
+            next_cursor = None
+            if has_more:
+                next_cursor = encode_cursor(leads[-1].updated_at, leads[-1].id)
+
+            return BoardColumnPage(
+                stage=stage,
+                leads=[self._to_lead_response(lead) for lead in leads],
+                next_cursor=next_cursor,
+            )
+
+        except Exception as e:
+            logger.error(
+                "Failed to get board column page",
+                extra={"organization_id": str(organization.id), "stage": stage, "error": str(e)},
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve pipeline column",
+            )
+
+    def get_lead_changes(
+        self, organization: Organization, since: Optional[str] = None, limit: int = 100
+    ) -> LeadChangesResponse:
+        """Get leads created, updated or deleted after the `since` cursor.
+
+        Updates and tombstones are two keyset streams on (timestamp, id); both
+        are read past the cursor, merged in key order and cut at `limit`, so
+        the returned cursor is safe even when rows share a timestamp.
+
+        Rows are only read up to LEAD_CHANGES_SETTLE_SECONDS ago: timestamps
+        are taken when a transaction starts, so a slow one can still commit
+        rows older than the newest visible. Once caught up, the cursor is that
+        settle time rather than the last change, so idle clients keep a
+        fresh cursor instead of aging past the tombstone retention.
+        """
+        after = decode_cursor(since) if since else None
+        cursor_time = None
+        if after:
+            cursor_time = after[0] if after[0].tzinfo else after[0].replace(tzinfo=timezone.utc)
+            horizon = datetime.now(timezone.utc) - timedelta(
+                days=settings.LEAD_TOMBSTONE_RETENTION_DAYS
+            )
+            if cursor_time < horizon:
+                raise HTTPException(
+                    status_code=status.HTTP_410_GONE,
+                    detail="Cursor too old, full resync required",
+                )
+
+        until = datetime.now(timezone.utc) - timedelta(seconds=settings.LEAD_CHANGES_SETTLE_SECONDS)
+        try:
+            leads = self.repository.get_changed_since(organization.id, after, limit + 1, until)
+            tombstones = self.repository.get_tombstones_since(
+                organization.id, after, limit + 1, until
+            )
+
+            changes = [(lead.updated_at, lead.id, lead) for lead in leads] + [
+                (tombstone.deleted_at, tombstone.lead_id, None) for tombstone in tombstones
+            ]
+            changes.sort(key=lambda change: (change[0], change[1]))
+            has_more = len(changes) > limit
+            changes = changes[:limit]
+
+            next_cursor = since
+            if has_more:
+                last_timestamp, last_id, _ = changes[-1]
+                next_cursor = encode_cursor(last_timestamp, last_id)
+            elif cursor_time is None or cursor_time < until:
+                # Everything up to the settle time has been returned
+                next_cursor = encode_cursor(until, SYNC_CURSOR_ID)
+
+            return LeadChangesResponse(
+                updated=[self._to_lead_response(lead) for _, _, lead in changes if lead],
+                deleted=[lead_id for _, lead_id, lead in changes if lead is None],
+                next_cursor=next_cursor,
+                has_more=has_more,
+            )
+
+        except Exception as e:
+            logger.error(
+                "Failed to get lead changes",
+                extra={"organization_id": str(organization.id), "since": since, "error": str(e)},
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve lead changes",
+            )
+
+    def get_lead_notes(
+        self,
+        organization: Organization,
+        lead_id: UUID,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> LeadNotesResponse:
+        """Get a lead's note history newest first, keyset-paged on (created_at, id)."""
+        before = decode_cursor(cursor) if cursor else None
+        self.get_lead_by_id(organization, lead_id)
+
+        try:
+            notes = self.repository.get_notes_page(organization.id, lead_id, before, limit + 1)
+            has_more = len(notes) > limit
+            notes = notes[:limit]
+
+            return LeadNotesResponse(
+                notes=[LeadNoteResponse.model_validate(note) for note in notes],
+                next_cursor=encode_cursor(notes[-1].created_at, notes[-1].id) if has_more else None,
+                has_more=has_more,
+            )
+
+        except Exception as e:
+            logger.error(
+                "Failed to get lead notes",
+                extra={
+                    "organization_id": str(organization.id),
+                    "lead_id": str(lead_id),
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve lead notes",
+            )
+
+    def add_lead_note(
+        self,
+        organization: Organization,
+        lead_id: UUID,
+        note_data: LeadNoteCreate,
+        user_id: Optional[UUID] = None,
+    ) -> LeadNoteResponse:
+        """Append a note to a lead; it becomes the lead's current notes."""
+        lead = self.get_lead_by_id(organization, lead_id)
+
+        try:
+            note = lead.add_note(note_data.body, created_by=user_id)
+            self.db.commit()
+            self.db.refresh(note)
+
+            logger.info(
+                "Lead note added",
+                extra={"organization_id": str(organization.id), "lead_id": str(lead_id)},
+            )
+            return LeadNoteResponse.model_validate(note)
+
+        except Exception as e:
+            self.db.rollback()
+            logger.error(
+                "Failed to add lead note",
+                extra={
+                    "organization_id": str(organization.id),
+                    "lead_id": str(lead_id),
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to add lead note"
+            )
+
+    def _parse_fields(self, fields: Optional[str]) -> Optional[List[str]]:
+        """Resolve a `fields=` value into response field names (None = full response)."""
+        if not fields or not fields.strip():
+            return None
+
+        if fields.strip() == "card":
+            requested = list(LEAD_CARD_FIELDS)
+        else:
+            requested = [field.strip() for field in fields.split(",") if field.strip()]
+
+        unknown = set(requested) - LEAD_SPARSE_FIELDS
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown lead fields: {', '.join(sorted(unknown))}",
+            )
+
+        # id is always returned so clients can key the rows
+        return list(dict.fromkeys(["id", *requested]))
+
+    def _rows_to_list_response(
+        self, rows: List[Row], sparse_fields: Optional[List[str]], **page_info
+    ) -> Union[LeadListResponse, LeadSparseListResponse]:
+        """Validate a page of lead rows in one pass into a list response."""
+        if sparse_fields:
+            return LeadSparseListResponse(
+                leads=LEAD_SPARSE_ROWS_ADAPTER.validate_python(rows, from_attributes=True),
+                **page_info,
+            )
+
+        return LeadListResponse(
+            leads=LEAD_ROWS_ADAPTER.validate_python(rows, from_attributes=True), **page_info
+        )
+
+    def _to_lead_response(self, lead: Lead) -> LeadResponse:
+        """Convert lead to response model with computed properties."""
+        lead_response = LeadResponse.model_validate(lead)
+        lead_response.is_closed = lead.is_closed
+        lead_response.days_in_current_stage = lead.days_in_current_stage
+        return lead_response
+
     def get_lead_by_id(self, organization: Organization, lead_id: UUID) -> Lead:
         """Get single lead by ID with organization validation."""
         lead = self.repository.get_by_id_and_org(lead_id, organization.id)
@@ -200,12 +502,38 @@ class CRMLeadService:
 
             # Update fields that were provided
             update_data = lead_data.model_dump(exclude_unset=True)
+            old_keys = (lead.email_key, lead.phone_key)
 
             for field, value in update_data.items():
-                setattr(lead, field, value)
-
+                if field == "notes":
+                    # Notes are append-only: a new entry becomes the current notes
+                    if (value or None) != lead.notes:
+                        lead.add_note(value or "")
+                else:
+                    setattr(lead, field, value)
+
+            self._enqueue_event(
+                organization.id,
+                {
+                    "type": "lead_updated",
+                    "lead": {
+                        "id": str(lead.id),
+                        "name": lead.name,
+                        "email": lead.email,
+                        "stage": self._audit_value(lead.stage),
+                        "estimated_value": (
+                            str(lead.estimated_value) if lead.estimated_value else None
+                        ),
+                        "organization_id": str(organization.id),
+                        "updated_fields": list(update_data.keys()),
+                    },
+                },
+            )
             self.db.commit()
             self.db.refresh(lead)
+            lead_event_relay.notify()
+            if old_keys != (lead.email_key, lead.phone_key):
+                lead_contact_cache.invalidate(organization.id, *old_keys)
 
             logger.info(
                 "Lead updated successfully",
@@ -216,32 +544,16 @@ class CRMLeadService:
                 },
             )
 
-            # Broadcast lead update event to organization
-            try:
-                # lead_dict prepared for future websocket broadcast
-                # lead_dict = {
-                #     "id": str(lead.id),
-                #     "name": lead.name,
-                #     "email": lead.email,
-                #     "stage": lead.stage.value if hasattr(lead.stage, "value") else lead.stage,
-                #     "estimated_value": str(lead.estimated_value) if lead.estimated_value else None,
-                #     "organization_id": str(organization.id),
-                #     "updated_fields": list(update_data.keys()),
-                # }
-
-                # Note: WebSocket broadcast skipped in sync method for stability
-                logger.debug(
-                    f"Lead updated - websocket broadcast deferred for org {organization.id}"
-                )
-                # Future: event_message will be used for async websocket broadcasting
-
-            except Exception as e:
-                logger.error(f"Failed to prepare lead update broadcast: {e}")
-
             return lead
 
         except HTTPException:
             raise
+        except IntegrityError:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Lead with this email or phone already exists",
+            )
         except Exception as e:
             self.db.rollback()
             logger.error(
@@ -267,16 +579,26 @@ class CRMLeadService:
     ) -> Lead:
         """Update lead pipeline stage."""
         try:
-            lead = self.repository.update_stage(
-                lead_id=lead_id, org_id=organization.id, new_stage=stage_data.stage
-            )
+            lead = self.repository.get_by_id_and_org(lead_id, organization.id)
 
             if not lead:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Lead not found")
 
+            previous_stage = lead.stage
+            lead.move_to_stage(stage_data.stage)
+
             # Add notes about stage transition if provided
             if stage_data.notes:
-                self._add_stage_update_notes(lead, stage_data.notes)
+                lead.add_note(f"[Stage Update] {stage_data.notes}", LeadNoteKind.STAGE_CHANGE)
+
+            # Flush so the event carries the new updated_at / notes
+            self.db.flush()
+            self._enqueue_event(
+                organization.id, self._stage_change_event(lead, previous_stage, user_id)
+            )
+            self.db.commit()
+            self.db.refresh(lead)
+            lead_event_relay.notify()
 
             logger.info(
                 "Lead stage updated successfully",
@@ -288,9 +610,6 @@ class CRMLeadService:
                 },
             )
 
-            # Broadcast stage change event to organization
-            await self._broadcast_stage_change(lead, organization, stage_data, user_id)
-
             return lead
 
         except HTTPException:
@@ -317,35 +636,29 @@ class CRMLeadService:
         try:
             lead = self.get_lead_by_id(organization, lead_id)
 
-            # Store lead info before deletion for broadcasting
-            # lead_dict prepared for future websocket broadcast
-            # lead_dict = {
-            #     "id": str(lead.id),
-            #     "name": lead.name,
-            #     "email": lead.email,
-            #     "stage": lead.stage.value if hasattr(lead.stage, "value") else lead.stage,
-            #     "organization_id": str(organization.id),
-            # }
-
-            # Use repository delete method
-            self.repository.delete(lead)
+            self._enqueue_event(
+                organization.id,
+                {
+                    "type": "lead_deleted",
+                    "lead": {
+                        "id": str(lead.id),
+                        "name": lead.name,
+                        "email": lead.email,
+                        "stage": self._audit_value(lead.stage),
+                        "organization_id": str(organization.id),
+                    },
+                },
+            )
+            # Delete and leave a tombstone for delta-sync clients (commits the event too)
+            self.repository.delete_with_tombstone(lead)
+            lead_event_relay.notify()
+            lead_contact_cache.invalidate(organization.id, lead.email_key, lead.phone_key)
 
             logger.info(
                 "Lead deleted successfully",
                 extra={"organization_id": str(organization.id), "lead_id": str(lead_id)},
             )
 
-            # Broadcast lead deletion event to organization
-            try:
-                # Note: WebSocket broadcast skipped in sync method for stability
-                logger.debug(
-                    f"Lead deleted - websocket broadcast deferred for org {organization.id}"
-                )
-                # Future: event_message will be used for async websocket broadcasting
-
-            except Exception as e:
-                logger.error(f"Failed to prepare lead deletion broadcast: {e}")
-
             return True
 
         except HTTPException:
@@ -365,6 +678,163 @@ class CRMLeadService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to delete lead"
             )
 
+    async def bulk_update_leads(
+        self,
+        organization: Organization,
+        bulk_request: LeadBulkRequest,
+        user_id: Optional[UUID] = None,
+    ) -> LeadBulkResponse:
+        """Apply a stage move, reassignment, tag change or deletion to many leads.
+
+        Runs as one set-based statement, one batched audit insert and one
+        commit, followed by a single WebSocket event for the whole batch.
+        """
+        values, previous_columns, changes = self._bulk_update_values(bulk_request)
+        lead_ids = list(dict.fromkeys(bulk_request.lead_ids))
+
+        try:
+            if bulk_request.action == "delete":
+                rows = self.repository.bulk_delete_with_tombstones(organization.id, lead_ids)
+                audit_action = AuditAction.DELETE
+                audit = [
+                    (row.id, {"name": row.name, "stage": self._audit_value(row.stage)}, None)
+                    for row in rows
+                ]
+            else:
+                rows = self.repository.bulk_update(
+                    organization.id, lead_ids, values, previous_columns
+                )
+                audit_action = AuditAction.UPDATE
+                audit = [
+                    (
+                        row.id,
+                        {
+                            column: self._audit_value(row._mapping[column])
+                            for column in previous_columns
+                        },
+                        changes,
+                    )
+                    for row in rows
+                ]
+
+            self.repository.write_audit_batch(organization.id, user_id, audit_action, audit)
+            if rows:
+                self._enqueue_event(
+                    organization.id,
+                    self._bulk_change_event(
+                        bulk_request.action, [row.id for row in rows], changes, user_id
+                    ),
+                )
+            self.db.commit()
+            lead_event_relay.notify()
+            if bulk_request.action == "delete" and rows:
+                lead_contact_cache.invalidate_organization(organization.id)
+
+        except Exception as e:
+            self.db.rollback()
+            logger.error(
+                "Failed to apply bulk lead operation",
+                extra={
+                    "organization_id": str(organization.id),
+                    "action": bulk_request.action,
+                    "lead_count": len(lead_ids),
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to apply bulk lead operation",
+            )
+
+        affected = [row.id for row in rows]
+        logger.info(
+            "Bulk lead operation applied",
+            extra={
+                "organization_id": str(organization.id),
+                "action": bulk_request.action,
+                "requested": len(lead_ids),
+                "affected": len(affected),
+            },
+        )
+
+        affected_set = set(affected)
+        return LeadBulkResponse(
+            action=bulk_request.action,
+            affected=len(affected),
+            lead_ids=affected,
+            not_found=[lead_id for lead_id in lead_ids if lead_id not in affected_set],
+        )
+
+    def _bulk_update_values(self, bulk_request: LeadBulkRequest):
+        """Resolve (update values, columns to audit, change summary) for a bulk action."""
+        action = bulk_request.action
+
+        if action == "stage":
+            if not bulk_request.stage:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="stage is required"
+                )
+            stage = bulk_request.stage.value
+            return {"stage": stage}, ["stage"], {"stage": stage}
+
+        if action == "assign":
+            if "assigned_user_id" not in bulk_request.model_fields_set:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="assigned_user_id is required (null to unassign)",
+                )
+            assignee = bulk_request.assigned_user_id
+            return (
+                {"assigned_user_id": assignee},
+                ["assigned_user_id"],
+                {"assigned_user_id": str(assignee) if assignee else None},
+            )
+
+        if action == "tags":
+            if not bulk_request.add_tags and not bulk_request.remove_tags:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="add_tags or remove_tags is required",
+                )
+            expression = self.repository.tags_update_expression(
+                bulk_request.add_tags, bulk_request.remove_tags
+            )
+            return (
+                {"tags": expression},
+                ["tags"],
+                {"add_tags": bulk_request.add_tags, "remove_tags": bulk_request.remove_tags},
+            )
+
+        return {}, [], {}
+
+    @staticmethod
+    def _audit_value(value):
+        """Convert a column value to a JSON-safe audit value."""
+        if isinstance(value, PipelineStage):
+            return value.value
+        if isinstance(value, UUID):
+            return str(value)
+        return value
+
+    def _enqueue_event(self, org_id: UUID, message: Dict) -> None:
+        """Stage a WebSocket event in the current transaction (see LeadEventRelay)."""
+        message = {**message, "timestamp": datetime.utcnow().isoformat()}
+        self.repository.add_outbox_event(org_id, message["type"], message)
+
+    @staticmethod
+    def _bulk_change_event(
+        action: str, lead_ids: List[UUID], changes: Dict, user_id: Optional[UUID]
+    ) -> Dict:
+        """Build the single event describing a whole bulk operation."""
+        return {
+            "type": "leads_bulk_deleted" if action == "delete" else "leads_bulk_updated",
+            "action": action,
+            "lead_ids": [str(lead_id) for lead_id in lead_ids],
+            "changes": changes,
+            "user_id": str(user_id) if user_id else None,
+        }
+
     def get_pipeline_statistics(self, organization: Organization) -> PipelineStatsResponse:
         """Get pipeline statistics for organization."""
         try:
@@ -393,34 +863,36 @@ class CRMLeadService:
             )
 
     def search_leads(
-        self, organization: Organization, query: str, page: int = 1, page_size: int = 20
-    ) -> LeadListResponse:
+        self,
+        organization: Organization,
+        query: str,
+        page: int = 1,
+        page_size: int = 20,
+        fields: Optional[str] = None,
+    ) -> Union[LeadListResponse, LeadSparseListResponse]:
         """Search leads by name, email or phone."""
+        sparse_fields = self._parse_fields(fields)
+
         try:
             skip = (page - 1) * page_size
 
-            leads = self.repository.search_by_organization(
-                org_id=organization.id, query=query, skip=skip, limit=page_size
+            rows = self.repository.search_rows_by_organization(
+                org_id=organization.id,
+                query=query,
+                fields=sparse_fields or LEAD_RESPONSE_FIELDS,
+                skip=skip,
+                limit=page_size,
             )
 
             # For simplicity, we don't count total search results
             # In production, you might want to add a separate count query
-            total_count = len(leads)
-
-            # Convert to response models
-            lead_responses = []
-            for lead in leads:
-                lead_response = LeadResponse.model_validate(lead)
-                lead_response.is_closed = lead.is_closed
-                lead_response.days_in_current_stage = lead.days_in_current_stage
-                lead_responses.append(lead_response)
-
-            return LeadListResponse(
-                leads=lead_responses,
-                total_count=total_count,
+            return self._rows_to_list_response(
+                rows,
+                sparse_fields,
+                total_count=len(rows),
                 page=page,
                 page_size=page_size,
-                has_more=len(leads) == page_size,  # Simple approximation
+                has_more=len(rows) == page_size,  # Simple approximation
             )
 
         except Exception as e:
@@ -433,6 +905,106 @@ class CRMLeadService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to search leads"
             )
 
+    def export_leads(
+        self,
+        organization: Organization,
+        filters: AdvancedFiltersSchema,
+        export_format: str = "csv",
+        compress: bool = False,
+    ) -> Iterator[bytes]:
+        """Stream every matching lead of the organization as CSV or NDJSON chunks.
+
+        Rows are read through a server-side cursor in LEAD_EXPORT_BATCH_SIZE
+        batches, so memory stays flat regardless of pipeline size. The export
+        runs after the request session is closed and uses its own session.
+        """
+        chunks = self._iter_export_chunks(organization.id, filters, export_format)
+        return self._gzip_chunks(chunks) if compress else chunks
+
+    def _iter_export_chunks(
+        self, org_id: UUID, filters: AdvancedFiltersSchema, export_format: str
+    ) -> Iterator[bytes]:
+        """Yield encoded export chunks, one per cursor batch."""
+        batch_size = settings.LEAD_EXPORT_BATCH_SIZE
+        encode = self._encode_csv_rows if export_format == "csv" else self._encode_ndjson_rows
+        session = SessionLocal()
+        try:
+            query = CRMLeadRepository(session).get_rows_query(org_id, LEAD_EXPORT_FIELDS)
+            query = (
+                self._apply_advanced_filters(query, filters)
+                .order_by(Lead.created_at, Lead.id)
+                .yield_per(batch_size)
+            )
+
+            if export_format == "csv":
+                yield self._encode_csv_rows([LEAD_EXPORT_FIELDS])
+
+            batch = []
+            for row in query:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    yield encode(batch)
+                    batch = []
+            if batch:
+                yield encode(batch)
+
+        except Exception as e:
+            # Headers are already sent; the client sees a truncated stream
+            logger.error(
+                "Lead export failed",
+                extra={"organization_id": str(org_id), "format": export_format, "error": str(e)},
+                exc_info=True,
+            )
+            raise
+        finally:
+            session.close()
+
+    @staticmethod
+    def _export_value(value):
+        """Convert a row value to its flat export representation."""
+        if isinstance(value, PipelineStage):
+            return value.value
+        if isinstance(value, Decimal):
+            return str(value)
+        return value
+
+    @staticmethod
+    def _csv_value(value):
+        """Flat CSV cell; user text that would run as a spreadsheet formula is quoted with '."""
+        if isinstance(value, list):
+            value = ";".join(value)
+        if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+            return f"'{value}"
+        return CRMLeadService._export_value(value)
+
+    def _encode_csv_rows(self, rows) -> bytes:
+        """Encode rows as CSV lines (tags joined with ';')."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([self._csv_value(value) for value in row])
+        return buffer.getvalue().encode()
+
+    def _encode_ndjson_rows(self, rows) -> bytes:
+        """Encode rows as newline-delimited JSON objects."""
+        return b"".join(
+            orjson.dumps(
+                {field: self._export_value(value) for field, value in row._mapping.items()}
+            )
+            + b"\n"
+            for row in rows
+        )
+
+    @staticmethod
+    def _gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """Gzip a chunk stream incrementally."""
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
     def toggle_lead_favorite(
         self, organization: Organization, lead_id: UUID, favorite_data: LeadFavoriteToggle
     ) -> Lead:
@@ -476,63 +1048,31 @@ class CRMLeadService:
                 detail="Failed to toggle lead favorite status",
             )
 
-    def _add_stage_update_notes(self, lead: Lead, notes: str) -> None:
-        """Add stage update notes to lead."""
-        if lead.notes:
-            lead.notes += f"\n[Stage Update] {notes}"
-        else:
-            lead.notes = f"[Stage Update] {notes}"
-
-        self.db.commit()
-        self.db.refresh(lead)
-
-    async def _broadcast_stage_change(
-        self,
-        lead: Lead,
-        organization: Organization,
-        stage_data: LeadStageUpdate,
-        user_id: Optional[UUID],
-    ) -> None:
-        """Broadcast stage change event to organization."""
-        try:
-            lead_dict = {
+    def _stage_change_event(
+        self, lead: Lead, previous_stage: PipelineStage, user_id: Optional[UUID]
+    ) -> Dict:
+        """Build the stage change event (full card, so boards need no refetch)."""
+        return {
+            "type": "lead_stage_changed",
+            "lead": {
                 "id": str(lead.id),
                 "name": lead.name,
                 "email": lead.email,
                 "phone": lead.phone,
-                "stage": stage_data.stage.value
-                if hasattr(stage_data.stage, "value")
-                else stage_data.stage,
-                "previous_stage": lead.stage.value if hasattr(lead.stage, "value") else lead.stage,
+                "stage": self._audit_value(lead.stage),
+                "previous_stage": self._audit_value(previous_stage),
                 "estimated_value": float(lead.estimated_value) if lead.estimated_value else None,
                 "source": lead.source,
                 "assigned_user_id": str(lead.assigned_user_id) if lead.assigned_user_id else None,
-                "organization_id": str(organization.id),
+                "organization_id": str(lead.organization_id),
                 "notes": lead.notes,
                 "is_favorite": getattr(lead, "is_favorite", False),
                 "created_at": lead.created_at.isoformat() if lead.created_at else None,
                 "updated_at": lead.updated_at.isoformat() if lead.updated_at else None,
                 "tags": getattr(lead, "tags", []),
-            }
-
-            # Import here to avoid circular imports
-            from api.core.websocket_manager import websocket_manager
-
-            event_message = {
-                "type": "lead_stage_changed",
-                "lead": lead_dict,
-                "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
-                "user_id": str(user_id) if user_id else None,
-            }
-
-            # Broadcast to all organization members
-            try:
-                await websocket_manager.broadcast_to_organization(organization.id, event_message)
-            except Exception as broadcast_error:
-                logger.error(f"Failed to broadcast lead stage change event: {broadcast_error}")
-
-        except Exception as e:
-            logger.error(f"Failed to prepare lead stage change broadcast: {e}")
+            },
+            "user_id": str(user_id) if user_id else None,
+        }
 
     def get_conversion_metrics(
         self,
@@ -623,6 +1163,24 @@ class CRMLeadService:
                 detail="Failed to retrieve filter options",
             )
 
+    def get_tag_suggestions(
+        self, organization: Organization, query: str = "", limit: int = 20
+    ) -> LeadTagSuggestionsResponse:
+        """Get tag autocomplete suggestions for organization."""
+        try:
+            tags = self.repository.search_tags(organization.id, query.strip(), limit)
+
+            return LeadTagSuggestionsResponse(
+                tags=[LeadTagSuggestion.model_validate(tag) for tag in tags]
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to get tag suggestions: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve tag suggestions",
+            )
+
     def _calculate_average_stage_times(self, leads: List[Lead]) -> Dict[str, float]:
         """Calculate average time spent in each stage."""
         # This would require stage history tracking
@@ -720,12 +1278,16 @@ class CRMLeadService:
         return query
 
     def _apply_tag_filters(self, query, filters: AdvancedFiltersSchema):
-        """Apply tag filtering to query."""
-        if filters.tags:
-            from sqlalchemy import func
+        """Apply tag filtering to query.
 
-            for tag in filters.tags:
-                query = query.filter(func.array_position(Lead.tags, tag) > 0)
+        Uses array containment (@>) for match-all and overlap (&&) for
+        match-any so the GIN index on leads.tags can serve the predicate.
+        """
+        if filters.tags:
+            if filters.tag_match == "any":
+                query = query.filter(Lead.tags.overlap(filters.tags))
+            else:
+                query = query.filter(Lead.tags.contains(filters.tags))
         return query
 
     def _apply_value_filters(self, query, filters: AdvancedFiltersSchema):
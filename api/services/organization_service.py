@@ -3,17 +3,86 @@
 Simplified service following KISS principles from CLAUDE.md
 """
 import logging
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..core.websocket_auth import websocket_auth_cache
+from ..models.crm_ai_summary import AISummary
+from ..models.crm_audit_log import AuditLog
+from ..models.crm_communication import Communication
+from ..models.crm_file_attachment import FileAttachment
+from ..models.crm_lead import Lead
+from ..models.crm_lead_archive import ArchivedCommunication, ArchivedLead
+from ..models.crm_lead_custom_fields import LeadCustomFields
+from ..models.crm_lead_note import LeadNote
+from ..models.crm_lead_tombstone import LeadTombstone
 from ..models.organization import Organization, OrganizationMember
 from ..models.user import User
+from .crm_lead_resolver_service import lead_contact_cache
 
 logger = logging.getLogger(__name__)
 
+# Bulky tenant tables, children before parents, purged in chunks before the
+# organization row itself; the remaining small tables go with its ON DELETE CASCADE.
+PURGE_ORDER = (
+    FileAttachment,
+    Communication,
+    AISummary,
+    LeadNote,
+    LeadCustomFields,
+    Lead,
+    ArchivedCommunication,
+    ArchivedLead,
+    LeadTombstone,
+    AuditLog,
+)
+
+
+def run_organization_purge(org_id: UUID) -> None:
+    """Background entry point: purge a deleted organization with its own session."""
+    db = SessionLocal()
+    try:
+        OrganizationService(db).purge_organization(org_id)
+    except Exception as e:
+        db.rollback()
+        logger.error(
+            "Organization purge failed",
+            extra={"organization_id": str(org_id), "error": str(e)},
+            exc_info=True,
+        )
+    finally:
+        db.close()
+
+
+def run_pending_organization_purges() -> None:
+    """Maintenance entry point: finish purges that were interrupted (e.g. by a restart)."""
+    db = SessionLocal()
+    try:
+        service = OrganizationService(db)
+        for org_id in service.get_pending_purge_ids():
+            # One failing purge must not hold back the others
+            try:
+                service.purge_organization(org_id)
+            except Exception as e:
+                db.rollback()
+                logger.error(
+                    "Organization purge failed",
+                    extra={"organization_id": str(org_id), "error": str(e)},
+                    exc_info=True,
+                )
+    except Exception as e:
+        db.rollback()
+        logger.error("Pending organization purges failed", extra={"error": str(e)}, exc_info=True)
+    finally:
+        db.close()
+
 
 class OrganizationService:
     """Ultra-simple organization service without complex features."""
@@ -130,21 +199,76 @@ class OrganizationService:
         return org
 
     def delete_organization(self, org_id: UUID) -> bool:
-        """Delete organization and all members."""
+        """Deactivate organization and its memberships and request its purge.
+
+        The data goes with purge_organization, which only acts on
+        organizations marked here (plain deactivation keeps the data).
+        """
         org = self.get_organization_by_id(org_id)
         if not org:
             return False
 
-        # Delete members first
+        org.is_active = False
+        org.purge_requested_at = datetime.now(timezone.utc)
         self.db.query(OrganizationMember).filter(
             OrganizationMember.organization_id == org_id
-        ).delete()
-
-        # Delete organization
-        self.db.delete(org)
+        ).update({OrganizationMember.is_active: False}, synchronize_session=False)
         self.db.commit()
+        websocket_auth_cache.invalidate_organization(org_id)
         return True
 
+    def get_pending_purge_ids(self) -> List[UUID]:
+        """Deleted organizations still awaiting (or part-way through) their purge.
+
+        The purge deletes the row last, so every organization still marked
+        by delete_organization is a purge to resume.
+        """
+        return list(
+            self.db.execute(
+                select(Organization.id).where(Organization.purge_requested_at.isnot(None))
+            )
+            .scalars()
+            .all()
+        )
+
+    def purge_organization(self, org_id: UUID) -> int:
+        """Hard-delete a deactivated organization in bounded chunks; return rows deleted.
+
+        Each chunk is its own transaction, so a tenant with millions of rows
+        never holds one huge transaction or loads its children into memory.
+        """
+        org = self.get_organization_by_id(org_id)
+        if not org or org.is_active or org.purge_requested_at is None:
+            logger.warning(
+                "Skipping purge of missing, active or not deleted organization",
+                extra={"organization_id": str(org_id)},
+            )
+            return 0
+
+        batch_size = settings.ORGANIZATION_PURGE_BATCH_SIZE
+        deleted = 0
+        for model in PURGE_ORDER:
+            table = model.__table__
+            pk = next(iter(table.primary_key.columns))
+            chunk = select(pk).where(table.c.organization_id == org_id).limit(batch_size)
+            while True:
+                count = self.db.execute(delete(table).where(pk.in_(chunk))).rowcount
+                self.db.commit()
+                deleted += count
+                if count < batch_size:
+                    break
+
+        # Core delete: the ORM would otherwise load the relationships it cascades to
+        self.db.execute(delete(Organization.__table__).where(Organization.id == org_id))
+        self.db.commit()
+        lead_contact_cache.invalidate_organization(org_id)
+
+        logger.info(
+            "Organization purged",
+            extra={"organization_id": str(org_id), "rows_deleted": deleted},
+        )
+        return deleted
+
     def add_member(self, org_id: UUID, user_id: UUID, role: str = "member") -> OrganizationMember:
         """Add member to organization."""
         member = OrganizationMember(
@@ -170,6 +294,7 @@ class OrganizationService:
 
         self.db.delete(member)
         self.db.commit()
+        websocket_auth_cache.invalidate(org_id, user_id)
         return True
 
     def update_member_role(
@@ -266,4 +391,5 @@ class OrganizationService:
 
         membership.is_active = False
         self.db.commit()
+        websocket_auth_cache.invalidate(membership.organization_id, membership.user_id)
         return {"message": "Successfully left organization"}
@@ -68,6 +68,11 @@ export interface PipelineWebSocketMessage {
   stageId?: string
   action?: string
   data?: Record<string, unknown>
+  // pipeline_event_batch frames
+  events?: PipelineWebSocketMessage[]
+  // Resumable stream: per-org sequence of lead events and the stream cursor
+  seq?: number
+  stream?: { id: string; seq: number } | null
 }
 
 export interface UsePipelineWebSocketOptions {
@@ -78,6 +83,7 @@ export interface UsePipelineWebSocketOptions {
   onUserActivity?: (data: PipelineWebSocketMessage) => void
   onUserDragging?: (data: PipelineWebSocketMessage) => void
   onConnectionEstablished?: (data: PipelineWebSocketMessage) => void
+  onResyncRequired?: (data: PipelineWebSocketMessage) => void
   autoReconnect?: boolean
   reconnectInterval?: number
   enablePollingFallback?: boolean
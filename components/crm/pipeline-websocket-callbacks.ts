@@ -33,6 +33,7 @@ export function useWebSocketCallbacks(
   onUserActivity: (data: WebSocketUserEvent) => void
   onUserDragging: (data: WebSocketDragEvent) => void
   onConnectionEstablished: (data: WebSocketConnectionData) => void
+  onResyncRequired: () => void
 } {
   const onLeadStageChanged = useCallback(
     (data: WebSocketLeadEvent) => {
@@ -104,6 +105,11 @@ export function useWebSocketCallbacks(
     [setRealtimeUsers]
   )
 
+  const onResyncRequired = useCallback(() => {
+    // Missed events are no longer replayable
+    void reloadLeadsData()
+  }, [reloadLeadsData])
+
   return {
     onLeadStageChanged,
     onLeadCreated,
@@ -112,5 +118,6 @@ export function useWebSocketCallbacks(
     onUserActivity,
     onUserDragging,
     onConnectionEstablished,
+    onResyncRequired,
   }
 }
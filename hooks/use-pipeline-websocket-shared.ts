@@ -24,9 +24,13 @@ class WebSocketManager {
   private subscribers = new Set<string>()
   private messageHandlers = new Map<string, (message: PipelineWebSocketMessage) => void>()
   private reconnectTimeout: NodeJS.Timeout | null = null
-  private pollingInterval: NodeJS.Timeout | null = null
+  // Server-Sent Events fallback for networks that block WebSockets
+  private eventSource: EventSource | null = null
   private isPolling: boolean = false
   private updateCallbacks = new Set<() => void>()
+  // Resume cursor: stream id and last lead event seq applied
+  private streamId: string | null = null
+  private lastSeq = 0
 
   static getInstance(): WebSocketManager {
     if (!WebSocketManager.instance) {
@@ -85,7 +89,12 @@ class WebSocketManager {
     this.notifySubscribers()
 
     try {
-      const ws = new WebSocket(url)
+      // Resume where we left off; the server replays the gap or asks for a resync
+      const resumeUrl =
+        this.streamId !== null
+          ? `${url}&stream=${this.streamId}&resume_from=${this.lastSeq}`
+          : url
+      const ws = new WebSocket(resumeUrl)
       this.ws = ws
 
       ws.onopen = () => {
@@ -101,35 +110,7 @@ class WebSocketManager {
         this.notifySubscribers()
       }
 
-      ws.onmessage = event => {
-        try {
-          const data: PipelineWebSocketMessage = JSON.parse(event.data)
-          this.lastMessage = data
-
-          switch (data.type) {
-            case 'pipeline_connection_established':
-              this.connectionStatus = 'connected'
-              this.isConnected = true
-              if (data.active_users) {
-                this.activeUsers = data.active_users
-              }
-              break
-          }
-
-          // Notify all subscribers
-          this.messageHandlers.forEach(handler => {
-            try {
-              handler(data)
-            } catch (error) {
-              console.error('WebSocket handler error:', error)
-            }
-          })
-
-          this.notifySubscribers()
-        } catch (error) {
-          console.error('WebSocket message parse error:', error)
-        }
-      }
+      ws.onmessage = event => this.handleFrame(event.data)
 
       ws.onclose = event => {
         this.connectionStatus = 'disconnected'
@@ -144,7 +125,7 @@ class WebSocketManager {
             this.connect(url, options)
           }, reconnectInterval)
         } else if (enablePollingFallback && this.subscribers.size > 0) {
-          this.startPolling()
+          this.startPolling(url)
         }
       }
 
@@ -153,7 +134,7 @@ class WebSocketManager {
         this.notifySubscribers()
 
         if (enablePollingFallback && this.subscribers.size > 0) {
-          setTimeout(() => this.startPolling(), 2000)
+          setTimeout(() => this.startPolling(url), 2000)
         }
       }
     } catch (error) {
@@ -183,28 +164,86 @@ class WebSocketManager {
     }
   }
 
+  private handleFrame(raw: string) {
+    try {
+      const frame: PipelineWebSocketMessage = JSON.parse(raw)
+      // Drag / activity events arrive coalesced into one batch frame
+      const messages =
+        frame.type === 'pipeline_event_batch' && frame.events ? frame.events : [frame]
+
+      messages.forEach(data => {
+        if (typeof data.seq === 'number') {
+          // Already applied (replay overlapping live delivery)
+          if (data.seq <= this.lastSeq) return
+          this.lastSeq = data.seq
+        }
+        this.lastMessage = data
+
+        switch (data.type) {
+          case 'pipeline_connection_established':
+          case 'connection_established':
+            if (!this.isPolling) {
+              this.connectionStatus = 'connected'
+              this.isConnected = true
+            }
+            if (data.active_users) {
+              this.activeUsers = data.active_users
+            }
+            if (data.stream && this.streamId === null) {
+              this.streamId = data.stream.id
+              this.lastSeq = data.stream.seq
+            }
+            break
+          case 'resync_required':
+            // Cursor too old: start over from the current position after a refetch
+            this.streamId = data.stream?.id ?? null
+            this.lastSeq = data.stream?.seq ?? 0
+            break
+        }
+
+        // Notify all subscribers
+        this.messageHandlers.forEach(handler => {
+          try {
+            handler(data)
+          } catch (error) {
+            console.error('WebSocket handler error:', error)
+          }
+        })
+      })
+
+      this.notifySubscribers()
+    } catch (error) {
+      console.error('WebSocket message parse error:', error)
+    }
+  }
+
   sendMessage(message: any) {
     if (this.ws && this.ws.readyState === WebSocket.OPEN) {
       this.ws.send(JSON.stringify(message))
     }
   }
 
-  private startPolling() {
-    if (this.isPolling) return
+  private startPolling(url: string) {
+    if (this.isPolling || typeof EventSource === 'undefined') return
 
     this.isPolling = true
     this.connectionStatus = 'polling'
     this.notifySubscribers()
 
-    this.pollingInterval = setInterval(() => {
-      // Polling fallback implementation
-    }, 10000)
+    // Same events over plain HTTP; EventSource resends Last-Event-ID on its own reconnects
+    const streamUrl = url.replace(/^ws/, 'http').replace('/ws/pipeline', '/events/stream')
+    const resumeUrl =
+      this.streamId !== null
+        ? `${streamUrl}&last_event_id=${this.streamId}:${this.lastSeq}`
+        : streamUrl
+    this.eventSource = new EventSource(resumeUrl)
+    this.eventSource.onmessage = event => this.handleFrame(event.data)
   }
 
   private stopPolling() {
-    if (this.pollingInterval) {
-      clearInterval(this.pollingInterval)
-      this.pollingInterval = null
+    if (this.eventSource) {
+      this.eventSource.close()
+      this.eventSource = null
     }
     this.isPolling = false
   }
@@ -221,6 +260,7 @@ export function usePipelineWebSocketShared(
     onUserActivity,
     onUserDragging,
     onConnectionEstablished,
+    onResyncRequired,
   } = options
 
   const { user, organization, token } = useAuthStore()
@@ -258,6 +298,9 @@ export function usePipelineWebSocketShared(
         case 'pipeline_connection_established':
           onConnectionEstablished?.(data)
           break
+        case 'resync_required':
+          onResyncRequired?.(data)
+          break
         case 'lead_stage_changed':
         case 'stage_change':
           onLeadStageChanged?.(data)
@@ -281,6 +324,7 @@ export function usePipelineWebSocketShared(
     },
     [
       onConnectionEstablished,
+      onResyncRequired,
       onLeadStageChanged,
       onLeadCreated,
       onLeadUpdated,
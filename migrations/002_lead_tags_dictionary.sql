@@ -0,0 +1,111 @@
+-- =============================================
+-- 002_lead_tags_dictionary.sql
+-- Per-organization tag dictionary + GIN index on leads.tags
+-- Focus: Serve filter dropdowns and tag autocomplete without scanning leads
+-- =============================================
+
+\echo '🏷️  Creating lead tags dictionary...'
+
+-- =============================================
+-- GIN INDEX ON LEADS.TAGS
+-- =============================================
+
+-- Query pattern: WHERE organization_id = ? AND tags @> ARRAY[...] / tags && ARRAY[...]
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_tags_gin
+ON leads USING GIN (tags);
+
+-- =============================================
+-- TAG DICTIONARY TABLE
+-- =============================================
+
+CREATE TABLE IF NOT EXISTS lead_tags (
+    organization_id UUID NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    usage_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (organization_id, tag)
+);
+
+-- Query pattern: WHERE organization_id = ? AND tag LIKE 'prefix%' (index-only)
+CREATE INDEX IF NOT EXISTS idx_lead_tags_org_tag_prefix
+ON lead_tags (organization_id, tag text_pattern_ops) INCLUDE (usage_count);
+
+-- =============================================
+-- MAINTAIN DICTIONARY ON WRITE
+-- =============================================
+
+CREATE OR REPLACE FUNCTION lead_tags_decrement(org_id UUID, tags TEXT[]) RETURNS VOID AS $$
+BEGIN
+    UPDATE lead_tags lt
+    SET usage_count = GREATEST(lt.usage_count - 1, 0), updated_at = NOW()
+    FROM (SELECT DISTINCT unnest(tags) AS tag) t
+    WHERE lt.organization_id = org_id AND lt.tag = t.tag;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION lead_tags_increment(org_id UUID, tags TEXT[]) RETURNS VOID AS $$
+BEGIN
+    INSERT INTO lead_tags (organization_id, tag, usage_count)
+    SELECT org_id, t.tag, 1
+    FROM (SELECT DISTINCT unnest(tags) AS tag) t
+    WHERE t.tag IS NOT NULL
+    ON CONFLICT (organization_id, tag)
+    DO UPDATE SET usage_count = lead_tags.usage_count + 1, updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION maintain_lead_tags() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.tags IS NOT NULL THEN
+        PERFORM lead_tags_decrement(OLD.organization_id, OLD.tags);
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.tags IS NOT NULL THEN
+        PERFORM lead_tags_increment(NEW.organization_id, NEW.tags);
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_leads_tags_insert ON leads;
+CREATE TRIGGER trg_leads_tags_insert
+AFTER INSERT ON leads
+FOR EACH ROW WHEN (NEW.tags IS NOT NULL)
+EXECUTE FUNCTION maintain_lead_tags();
+
+DROP TRIGGER IF EXISTS trg_leads_tags_update ON leads;
+CREATE TRIGGER trg_leads_tags_update
+AFTER UPDATE OF tags, organization_id ON leads
+FOR EACH ROW
+WHEN (OLD.tags IS DISTINCT FROM NEW.tags OR OLD.organization_id IS DISTINCT FROM NEW.organization_id)
+EXECUTE FUNCTION maintain_lead_tags();
+
+DROP TRIGGER IF EXISTS trg_leads_tags_delete ON leads;
+CREATE TRIGGER trg_leads_tags_delete
+AFTER DELETE ON leads
+FOR EACH ROW WHEN (OLD.tags IS NOT NULL)
+EXECUTE FUNCTION maintain_lead_tags();
+
+-- =============================================
+-- BACKFILL FROM EXISTING LEADS
+-- =============================================
+
+INSERT INTO lead_tags (organization_id, tag, usage_count)
+SELECT organization_id, tag, COUNT(DISTINCT id)
+FROM (
+    SELECT id, organization_id, unnest(tags) AS tag
+    FROM leads
+    WHERE tags IS NOT NULL
+) lead_tag_rows
+WHERE tag IS NOT NULL
+GROUP BY organization_id, tag
+ON CONFLICT (organization_id, tag)
+DO UPDATE SET usage_count = EXCLUDED.usage_count, updated_at = NOW();
+
+\echo '✅ Lead tags dictionary created and backfilled'
+
+-- Update schema version
+INSERT INTO schema_versions (version, description)
+VALUES (2, 'Lead tags dictionary with usage counts and GIN index on leads.tags')
+ON CONFLICT (version) DO NOTHING;
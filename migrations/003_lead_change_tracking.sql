@@ -0,0 +1,38 @@
+-- =============================================
+-- 003_lead_change_tracking.sql
+-- Delta-sync support: lead tombstones + org-wide updated_at keyset index
+-- Focus: GET /crm/leads/changes?since=<cursor>
+-- =============================================
+
+\echo '🔄 Creating lead change tracking...'
+
+-- =============================================
+-- KEYSET INDEX FOR CHANGES FEED
+-- =============================================
+
+-- Query pattern: WHERE organization_id = ? AND (updated_at, id) > (?, ?) ORDER BY updated_at, id
+-- idx_leads_org_stage_updated has stage in the middle, so it cannot serve an
+-- org-wide ordered scan; this index can.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_org_updated_id
+ON leads (organization_id, updated_at, id);
+
+-- =============================================
+-- LEAD TOMBSTONES
+-- =============================================
+
+CREATE TABLE IF NOT EXISTS lead_tombstones (
+    lead_id UUID PRIMARY KEY,
+    organization_id UUID NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    deleted_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- Query pattern: WHERE organization_id = ? AND (deleted_at, lead_id) > (?, ?)
+CREATE INDEX IF NOT EXISTS idx_lead_tombstones_org_deleted
+ON lead_tombstones (organization_id, deleted_at, lead_id);
+
+\echo '✅ Lead change tracking created'
+
+-- Update schema version
+INSERT INTO schema_versions (version, description)
+VALUES (3, 'Lead delta-sync: tombstones and (organization_id, updated_at, id) index')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,30 @@
+-- =============================================
+-- 004_lead_duplicate_clusters.sql
+-- Candidate duplicate clusters produced by the lead dedup scan
+-- Focus: GET /crm/leads/duplicates + POST /crm/leads/duplicates/merge
+-- =============================================
+
+\echo '🧬 Creating lead duplicate clusters...'
+
+CREATE TABLE IF NOT EXISTS lead_duplicate_clusters (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    organization_id UUID NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    lead_ids UUID[] NOT NULL,
+    reasons TEXT[] NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- Query pattern: WHERE organization_id = ? (list / replace on rescan)
+CREATE INDEX IF NOT EXISTS idx_lead_duplicate_clusters_org
+ON lead_duplicate_clusters (organization_id);
+
+-- Query pattern: WHERE lead_ids && ARRAY[...] (drop stale clusters after merge)
+CREATE INDEX IF NOT EXISTS idx_lead_duplicate_clusters_lead_ids
+ON lead_duplicate_clusters USING GIN (lead_ids);
+
+\echo '✅ Lead duplicate clusters created'
+
+-- Update schema version
+INSERT INTO schema_versions (version, description)
+VALUES (4, 'Lead dedup: candidate duplicate clusters')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,78 @@
+-- =============================================
+-- 005_lead_contact_keys.sql
+-- Normalized contact keys for exact lead lookup by email / phone
+-- Focus: GET /crm/leads/resolve + import dedupe
+-- =============================================
+
+\echo '📞 Adding lead contact keys...'
+
+ALTER TABLE leads ADD COLUMN IF NOT EXISTS email_key VARCHAR(255);
+ALTER TABLE leads ADD COLUMN IF NOT EXISTS phone_key VARCHAR(20);
+
+-- Backfill: mirrors normalize_email / normalize_phone in api/core/utils.py
+-- ('55' = DEFAULT_PHONE_COUNTRY_CODE, 11 = NATIONAL_NUMBER_MAX_DIGITS)
+WITH normalized AS (
+    SELECT
+        id,
+        NULLIF(lower(btrim(email)), '') AS email_key,
+        CASE
+            WHEN btrim(phone) LIKE '+%' THEN regexp_replace(phone, '\D', '', 'g')
+            WHEN regexp_replace(phone, '\D', '', 'g') LIKE '00%'
+                THEN substr(regexp_replace(phone, '\D', '', 'g'), 3)
+            WHEN length(ltrim(regexp_replace(phone, '\D', '', 'g'), '0')) <= 11
+                THEN '55' || ltrim(regexp_replace(phone, '\D', '', 'g'), '0')
+            ELSE ltrim(regexp_replace(phone, '\D', '', 'g'), '0')
+        END AS phone_digits
+    FROM leads
+)
+UPDATE leads
+SET email_key = normalized.email_key,
+    phone_key = CASE
+        WHEN length(normalized.phone_digits) BETWEEN 8 AND 15
+            THEN '+' || normalized.phone_digits
+    END
+FROM normalized
+WHERE leads.id = normalized.id;
+
+-- Existing duplicates keep the key on the oldest lead only
+-- (the rest stay reachable through the dedup scan / merge)
+UPDATE leads SET email_key = NULL
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id, row_number() OVER (
+            PARTITION BY organization_id, email_key ORDER BY created_at, id
+        ) AS position
+        FROM leads
+        WHERE email_key IS NOT NULL
+    ) ranked
+    WHERE position > 1
+);
+
+UPDATE leads SET phone_key = NULL
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id, row_number() OVER (
+            PARTITION BY organization_id, phone_key ORDER BY created_at, id
+        ) AS position
+        FROM leads
+        WHERE phone_key IS NOT NULL
+    ) ranked
+    WHERE position > 1
+);
+
+-- Query pattern: WHERE organization_id = ? AND email_key = ? (resolve, import)
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_org_email_key
+ON leads (organization_id, email_key)
+WHERE email_key IS NOT NULL;
+
+-- Query pattern: WHERE organization_id = ? AND phone_key = ? (resolve, import)
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_org_phone_key
+ON leads (organization_id, phone_key)
+WHERE phone_key IS NOT NULL;
+
+\echo '✅ Lead contact keys added'
+
+-- Update schema version
+INSERT INTO schema_versions (version, description)
+VALUES (5, 'Lead contact keys: normalized email / E.164 phone with unique lookups')
+ON CONFLICT (version) DO NOTHING;
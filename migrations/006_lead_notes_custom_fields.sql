@@ -0,0 +1,69 @@
+-- =============================================
+-- 006_lead_notes_custom_fields.sql
+-- Move bulky columns out of the hot leads table
+-- Focus: append-only lead_notes + lead_custom_fields side table
+-- =============================================
+
+\echo '🗒️ Creating lead notes and custom fields...'
+
+CREATE TABLE IF NOT EXISTS lead_notes (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    organization_id UUID NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    lead_id UUID NOT NULL REFERENCES leads(id) ON DELETE CASCADE,
+    kind VARCHAR(20) NOT NULL DEFAULT 'note',
+    body TEXT NOT NULL,
+    created_by UUID REFERENCES users(id) ON DELETE SET NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT clock_timestamp(),
+    CONSTRAINT lead_notes_kind_check CHECK (kind IN ('note', 'stage_change'))
+);
+
+-- Query pattern: WHERE lead_id = ? ORDER BY created_at DESC, id DESC (history pages,
+-- current notes)
+CREATE INDEX IF NOT EXISTS idx_lead_notes_lead_created_id
+ON lead_notes (lead_id, created_at, id);
+
+CREATE TABLE IF NOT EXISTS lead_custom_fields (
+    lead_id UUID PRIMARY KEY REFERENCES leads(id) ON DELETE CASCADE,
+    organization_id UUID NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    fields JSONB NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_lead_custom_fields_org
+ON lead_custom_fields (organization_id);
+
+-- Backfill: existing notes text becomes each lead's first NOTE entry
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'leads' AND column_name = 'notes'
+    ) THEN
+        INSERT INTO lead_notes (organization_id, lead_id, kind, body, created_at)
+        SELECT organization_id, id, 'note', notes, updated_at
+        FROM leads
+        WHERE notes IS NOT NULL AND notes <> '';
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'leads' AND column_name = 'lead_metadata'
+    ) THEN
+        INSERT INTO lead_custom_fields (lead_id, organization_id, fields)
+        SELECT id, organization_id, lead_metadata
+        FROM leads
+        WHERE lead_metadata IS NOT NULL AND lead_metadata <> '{}'::jsonb
+        ON CONFLICT (lead_id) DO NOTHING;
+    END IF;
+END $$;
+
+-- Narrow the hot table (space is reclaimed as rows are rewritten / by VACUUM FULL)
+ALTER TABLE leads DROP COLUMN IF EXISTS notes;
+ALTER TABLE leads DROP COLUMN IF EXISTS lead_metadata;
+
+\echo '✅ Lead notes and custom fields created'
+
+-- Update schema version
+INSERT INTO schema_versions (version, description)
+VALUES (6, 'Lead notes history and custom fields moved out of leads')
+ON CONFLICT (version) DO NOTHING;
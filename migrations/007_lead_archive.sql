@@ -0,0 +1,61 @@
+-- =============================================
+-- 007_lead_archive.sql
+-- Archive tier for long-closed leads and their communications
+-- Focus: lead maintenance job + GET /crm/leads?include_archived=true
+-- =============================================
+
+\echo '🗄️ Creating lead archive tables...'
+
+CREATE TABLE IF NOT EXISTS archived_leads (
+    id UUID PRIMARY KEY,
+    organization_id UUID NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    name VARCHAR(255) NOT NULL,
+    email VARCHAR(255),
+    phone VARCHAR(50),
+    email_key VARCHAR(255),
+    phone_key VARCHAR(20),
+    stage VARCHAR(50) NOT NULL,
+    source VARCHAR(100),
+    estimated_value DECIMAL(12, 2),
+    tags TEXT[],
+    notes TEXT,
+    assigned_user_id UUID,
+    last_contact_at TIMESTAMP WITH TIME ZONE,
+    last_contact_channel VARCHAR(20),
+    is_favorite BOOLEAN NOT NULL DEFAULT FALSE,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    -- custom_fields, note_history and ai_summaries of the lead
+    archived_data JSONB NOT NULL DEFAULT '{}',
+    archived_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- Query pattern: WHERE organization_id = ? ORDER BY created_at DESC (include_archived lists)
+CREATE INDEX IF NOT EXISTS idx_archived_leads_org_created
+ON archived_leads (organization_id, created_at);
+
+CREATE TABLE IF NOT EXISTS archived_communications (
+    id UUID PRIMARY KEY,
+    organization_id UUID NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    lead_id UUID NOT NULL,
+    -- Original communications row plus its file_attachments rows
+    payload JSONB NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    archived_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- Query pattern: WHERE lead_id = ? ORDER BY created_at
+CREATE INDEX IF NOT EXISTS idx_archived_communications_lead
+ON archived_communications (lead_id, created_at);
+
+-- Query pattern: WHERE stage = 'fechado' AND updated_at < ? (archival scan)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_closed_updated
+ON leads (updated_at)
+WHERE stage = 'fechado';
+
+\echo '✅ Lead archive tables created'
+
+-- Update schema version
+INSERT INTO schema_versions (version, description)
+VALUES (7, 'Lead archive: archived leads and communications')
+ON CONFLICT (version) DO NOTHING;
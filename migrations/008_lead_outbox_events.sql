@@ -0,0 +1,25 @@
+-- =============================================
+-- 008_lead_outbox_events.sql
+-- Transactional outbox for lead change events
+-- Focus: events written with the lead change, drained by the async relay
+-- =============================================
+
+\echo '📤 Creating lead outbox events...'
+
+CREATE TABLE IF NOT EXISTS lead_outbox_events (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    organization_id UUID NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    event_type VARCHAR(50) NOT NULL,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT clock_timestamp()
+);
+
+-- Query pattern: ORDER BY id LIMIT ? FOR UPDATE SKIP LOCKED (relay batches use the
+-- primary key; delivered rows are deleted, so the table stays small)
+
+\echo '✅ Lead outbox events created'
+
+-- Update schema version
+INSERT INTO schema_versions (version, description)
+VALUES (8, 'Transactional outbox for lead change events')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,21 @@
+-- =============================================
+-- 009_organization_purge_requests.sql
+-- Marker for organizations deleted and awaiting their chunked purge
+-- Focus: maintenance resumes interrupted purges; deactivated orgs are never purged
+-- =============================================
+
+\echo '🗑️ Adding organization purge requests...'
+
+ALTER TABLE organizations ADD COLUMN IF NOT EXISTS purge_requested_at TIMESTAMP WITH TIME ZONE;
+
+-- Query pattern: WHERE purge_requested_at IS NOT NULL (almost always empty)
+CREATE INDEX IF NOT EXISTS idx_organizations_purge_requested
+    ON organizations (purge_requested_at)
+    WHERE purge_requested_at IS NOT NULL;
+
+\echo '✅ Organization purge requests added'
+
+-- Update schema version
+INSERT INTO schema_versions (version, description)
+VALUES (9, 'Organization purge request marker')
+ON CONFLICT (version) DO NOTHING;
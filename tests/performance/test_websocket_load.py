@@ -0,0 +1,40 @@
+"""Regression benchmark for /ws/pipeline fan-out.
+
+Following CLAUDE.md principles:
+- FUNCTIONALITY FIRST: Test success scenarios before error scenarios
+- Focus on what the system DOES, not just what it REJECTS
+- Test real connections to a real server process across organizations
+"""
+
+import pytest
+
+from tests.performance.websocket_load import LoadConfig, check_thresholds, run_load
+
+# Generous limits for shared CI runners: they catch regressions, not tune capacity
+MAX_FANOUT_P99_MS = 1000
+MAX_KB_PER_CONNECTION = 1024
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestPipelineLoad:
+    """Test a worker sustains a small mixed load - FUNCTIONALITY FIRST."""
+
+    @pytest.mark.asyncio
+    async def test_mixed_load_delivers_every_event_success(self):
+        """Test stage changes, drags and pings all arrive within the limits."""
+        # ✅ SUCCESS SCENARIO: 40 boards in 4 organizations, 100 events/s
+        report = await run_load(LoadConfig(clients=40, orgs=4, rate=100, duration=3))
+
+        assert report["connections"]["opened"] == 40
+        assert all(stats["sent"] > 0 for stats in report["events"].values())
+        assert report["connections"]["evicted"] == 0
+        assert (
+            check_thresholds(
+                report,
+                max_p99_ms=MAX_FANOUT_P99_MS,
+                max_drop_rate=0.0,
+                max_kb_per_connection=MAX_KB_PER_CONNECTION,
+            )
+            == []
+        )
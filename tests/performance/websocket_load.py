@@ -0,0 +1,458 @@
+"""WebSocket load harness for /ws/pipeline.
+
+Serves the production WebSocket router from a separate uvicorn process (one
+worker, in-memory broker) and drives simulated clients across organizations
+from this process, reporting fan-out latency, memory per connection and
+drop rate.
+
+    python -m tests.performance.websocket_load --clients 500 --orgs 10 --rate 200
+    python -m tests.performance.websocket_load --max-p99-ms 250 --max-drop-rate 0 --json out.json
+
+Identities are seeded into the WebSocket auth cache and the token blacklist
+check is skipped, so no database or Redis is needed; neither is on the
+broadcast path being measured. Drag latency includes the coalescing window.
+Clients and server each hold one socket per connection: raise `ulimit -n`
+for more than ~900 clients.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import socket
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import psutil
+from websockets.asyncio.client import ClientConnection, connect
+
+from api.core.security import create_access_token
+from api.models.crm_lead import PipelineStage
+
+EVENT_TYPES = ("stage_change", "drag", "ping")
+FANOUT_TYPES = ("stage_change", "drag")
+STAGES = [stage.value for stage in PipelineStage]
+
+
+@dataclass
+class LoadConfig:
+    """One load run: who connects and what they send."""
+
+    clients: int = 100
+    orgs: int = 5
+    rate: float = 100.0  # Events per second across all clients
+    duration: float = 10.0  # Seconds of load
+    mix: Dict[str, float] = field(
+        default_factory=lambda: {"stage_change": 0.6, "drag": 0.3, "ping": 0.1}
+    )
+    drain: float = 2.0  # Seconds to wait for in-flight deliveries
+    connect_concurrency: int = 50
+    seed: int = 1
+
+
+class DeliveryTracker:
+    """Send time of every event and the deliveries it should produce."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters per event type."""
+        # key -> (event type, sent at, sender user id)
+        self.in_flight: Dict[str, Tuple[str, float, str]] = {}
+        self.latencies: Dict[str, List[float]] = {event_type: [] for event_type in EVENT_TYPES}
+        self.sent = dict.fromkeys(EVENT_TYPES, 0)
+        self.expected = dict.fromkeys(EVENT_TYPES, 0)
+        self.delivered = dict.fromkeys(EVENT_TYPES, 0)
+
+    def record_sent(self, key: str, event_type: str, sender: str, recipients: int) -> None:
+        """Record an event about to be sent and how many clients should get it."""
+        self.in_flight[key] = (event_type, time.perf_counter(), sender)
+        self.sent[event_type] += 1
+        self.expected[event_type] += recipients
+
+    def record_received(self, key: Optional[str], receiver: str) -> None:
+        """Record a delivery (unknown keys, and fan-out echoes to the sender, are ignored)."""
+        entry = self.in_flight.get(key) if key else None
+        if entry is None:
+            return
+        event_type, sent_at, sender = entry
+        # Senders are excluded from fan-out, so a copy reaching them is not a delivery
+        if event_type in FANOUT_TYPES and receiver == sender:
+            return
+        self.latencies[event_type].append(time.perf_counter() - sent_at)
+        self.delivered[event_type] += 1
+
+
+class SimulatedClient:
+    """One pipeline board: a user connection that sends events and records deliveries."""
+
+    def __init__(self, org_id: str, user_id: str) -> None:
+        """Initialize a client for a seeded identity."""
+        self.org_id = org_id
+        self.user_id = user_id
+        self.token = create_access_token({"sub": user_id, "org_id": org_id})
+        self.connection: Optional[ClientConnection] = None
+        self.close_code: Optional[int] = None
+        self.receiver: Optional[asyncio.Task] = None
+
+    async def open(self, port: int) -> float:
+        """Connect and wait for the established message; returns seconds taken."""
+        started = time.perf_counter()
+        self.connection = await connect(
+            f"ws://127.0.0.1:{port}/ws/pipeline?token={self.token}&org_id={self.org_id}",
+            max_queue=None,
+        )
+        while json.loads(await self.connection.recv())["type"] != "pipeline_connection_established":
+            pass
+        return time.perf_counter() - started
+
+    def start_receiving(self, tracker: DeliveryTracker) -> None:
+        """Record deliveries in the background until the connection closes."""
+        self.receiver = asyncio.create_task(self._receive(tracker))
+
+    async def _receive(self, tracker: DeliveryTracker) -> None:
+        """Match received frames to sent events."""
+        try:
+            async for frame in self.connection:
+                message = json.loads(frame)
+                events = message.get("events", []) if "events" in message else [message]
+                for event in events:
+                    if event.get("type") == "pong":
+                        tracker.record_received(event.get("timestamp"), self.user_id)
+                    else:
+                        tracker.record_received(event.get("lead_id"), self.user_id)
+        except Exception:
+            pass
+        finally:
+            self.close_code = self.connection.close_code
+
+    async def send(
+        self, event_type: str, tracker: DeliveryTracker, recipients: int, rng: random.Random
+    ) -> bool:
+        """Send one event; False when the connection is gone."""
+        key = uuid.uuid4().hex
+        if event_type == "ping":
+            message: Dict[str, Any] = {"type": "ping", "timestamp": key}
+            recipients = 1
+        elif event_type == "drag":
+            message = {"type": "lead_drag_start", "lead_id": key}
+        else:
+            old_stage, new_stage = rng.sample(STAGES, 2)
+            message = {
+                "type": "stage_change",
+                "lead_id": key,
+                "old_stage": old_stage,
+                "new_stage": new_stage,
+                "lead_name": "Load test lead",
+            }
+
+        tracker.record_sent(key, event_type, self.user_id, recipients)
+        try:
+            await self.connection.send(json.dumps(message))
+            return True
+        except Exception:
+            return False
+
+    async def close(self) -> None:
+        """Close the connection and stop receiving."""
+        if self.connection is not None:
+            await self.connection.close()
+        if self.receiver is not None:
+            await self.receiver
+
+
+def _serve(port: int, identities: List[Tuple[str, str]]) -> None:
+    """Server process: seed identities and serve the WebSocket router."""
+    from uuid import UUID
+
+    import uvicorn
+    from fastapi import FastAPI
+
+    from api.core import deps
+    from api.core.websocket_auth import websocket_auth_cache
+    from api.models.organization import Organization
+    from api.models.user import User
+    from api.routers.websocket import router
+
+    async def not_blacklisted(token: str, redis_url: str) -> bool:
+        return False
+
+    deps.is_token_blacklisted = not_blacklisted
+
+    websocket_auth_cache.maxsize = len(identities)
+    websocket_auth_cache.ttl_seconds = float("inf")
+    organizations: Dict[str, Organization] = {}
+    for org_id, user_id in identities:
+        if org_id not in organizations:
+            organizations[org_id] = Organization(
+                id=UUID(org_id), name=f"Load org {org_id[:8]}", is_active=True
+            )
+        user = User(
+            id=UUID(user_id),
+            email=f"{user_id}@load.test",
+            full_name=f"Load user {user_id[:8]}",
+            is_active=True,
+        )
+        websocket_auth_cache.set((UUID(org_id), UUID(user_id)), (user, organizations[org_id]))
+
+    app = FastAPI()
+    app.include_router(router)
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def _free_port() -> int:
+    """An unused local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_for_port(port: int, timeout: float = 30.0) -> None:
+    """Wait until the server accepts connections."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Load server did not start on port {port}")
+            await asyncio.sleep(0.1)
+
+
+def _cpu_seconds(process: psutil.Process) -> float:
+    """CPU time (user + system) a process has used."""
+    times = process.cpu_times()
+    return times.user + times.system
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """Nearest-rank percentile in milliseconds (0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(percent / 100 * len(ordered))) - 1))
+    return round(ordered[index] * 1000, 3)
+
+
+async def _drive(
+    clients: List[SimulatedClient],
+    org_sizes: Dict[str, int],
+    config: LoadConfig,
+    tracker: DeliveryTracker,
+) -> float:
+    """Send events open-loop at the configured rate; returns seconds taken."""
+    rng = random.Random(config.seed)
+    event_types, weights = zip(*config.mix.items())
+    live = list(clients)
+    started = time.perf_counter()
+    sent = 0
+    while live and time.perf_counter() - started < config.duration:
+        # Behind schedule: catch up rather than lower the offered rate
+        due = int((time.perf_counter() - started) * config.rate) + 1
+        for _ in range(due - sent):
+            client = rng.choice(live)
+            event_type = rng.choices(event_types, weights)[0]
+            if not await client.send(event_type, tracker, org_sizes[client.org_id] - 1, rng):
+                live.remove(client)
+                if not live:
+                    break
+        sent = due
+        await asyncio.sleep(max(0.0, started + sent / config.rate - time.perf_counter()))
+    return time.perf_counter() - started
+
+
+async def run_load(config: LoadConfig) -> Dict[str, Any]:
+    """Run one load test against a fresh server process and return its report."""
+    org_ids = [str(uuid.uuid4()) for _ in range(config.orgs)]
+    clients = [
+        SimulatedClient(org_ids[i % config.orgs], str(uuid.uuid4())) for i in range(config.clients)
+    ]
+    org_sizes = {org_id: 0 for org_id in org_ids}
+    for client in clients:
+        org_sizes[client.org_id] += 1
+
+    # Loads the connection code paths before the idle memory baseline
+    warmup = SimulatedClient(org_ids[0], str(uuid.uuid4()))
+
+    port = _free_port()
+    server = multiprocessing.get_context("spawn").Process(
+        target=_serve,
+        args=(port, [(client.org_id, client.user_id) for client in [warmup, *clients]]),
+        daemon=True,
+    )
+    server.start()
+    tracker = DeliveryTracker()
+    try:
+        await _wait_for_port(port)
+        await warmup.open(port)
+        await warmup.close()
+        server_process = psutil.Process(server.pid)
+        idle_rss = server_process.memory_info().rss
+
+        gate = asyncio.Semaphore(config.connect_concurrency)
+
+        async def open_client(client: SimulatedClient) -> Optional[float]:
+            async with gate:
+                try:
+                    return await client.open(port)
+                except Exception:
+                    return None
+
+        connect_times = await asyncio.gather(*(open_client(client) for client in clients))
+        connected = [client for client, took in zip(clients, connect_times) if took is not None]
+        await asyncio.sleep(0.5)
+        connected_rss = server_process.memory_info().rss
+
+        for client in connected:
+            client.start_receiving(tracker)
+        harness_process = psutil.Process()
+        cpu_before = (_cpu_seconds(server_process), _cpu_seconds(harness_process))
+        elapsed = await _drive(connected, org_sizes, config, tracker)
+        # Saturated harness CPU means the clients, not the server, limit the numbers
+        cpu = {
+            "server_percent": round(
+                (_cpu_seconds(server_process) - cpu_before[0]) / elapsed * 100, 1
+            ),
+            "harness_percent": round(
+                (_cpu_seconds(harness_process) - cpu_before[1]) / elapsed * 100, 1
+            ),
+        }
+        await asyncio.sleep(config.drain)
+    finally:
+        await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+        server.terminate()
+        server.join(timeout=10)
+
+    return _report(config, tracker, connected, connect_times, idle_rss, connected_rss, elapsed, cpu)
+
+
+def _report(
+    config: LoadConfig,
+    tracker: DeliveryTracker,
+    connected: List[SimulatedClient],
+    connect_times: List[Optional[float]],
+    idle_rss: int,
+    connected_rss: int,
+    elapsed: float,
+    cpu: Dict[str, float],
+) -> Dict[str, Any]:
+    """Summarize a run."""
+    events = {}
+    for event_type in EVENT_TYPES:
+        expected, delivered = tracker.expected[event_type], tracker.delivered[event_type]
+        events[event_type] = {
+            "sent": tracker.sent[event_type],
+            "expected_deliveries": expected,
+            "delivered": delivered,
+            "drop_rate": round(1 - delivered / expected, 6) if expected else 0.0,
+            "p50_ms": _percentile(tracker.latencies[event_type], 50),
+            "p99_ms": _percentile(tracker.latencies[event_type], 99),
+        }
+
+    fanout = [latency for event_type in FANOUT_TYPES for latency in tracker.latencies[event_type]]
+    expected = sum(tracker.expected.values())
+    delivered = sum(tracker.delivered.values())
+    opened = [took for took in connect_times if took is not None]
+    return {
+        "config": asdict(config),
+        "connections": {
+            "opened": len(opened),
+            "failed": len(connect_times) - len(opened),
+            "evicted": sum(1 for client in connected if client.close_code == 1013),
+            "connect_p50_ms": _percentile(opened, 50),
+            "connect_p99_ms": _percentile(opened, 99),
+        },
+        "memory": {
+            "server_idle_mb": round(idle_rss / 2**20, 2),
+            "server_connected_mb": round(connected_rss / 2**20, 2),
+            "per_connection_kb": round((connected_rss - idle_rss) / 1024 / max(len(opened), 1), 2),
+        },
+        "cpu": cpu,
+        "throughput": {
+            "events_per_second": round(sum(tracker.sent.values()) / elapsed, 2),
+            "deliveries_per_second": round(delivered / elapsed, 2),
+        },
+        "fanout_p50_ms": _percentile(fanout, 50),
+        "fanout_p99_ms": _percentile(fanout, 99),
+        "drop_rate": round(1 - delivered / expected, 6) if expected else 0.0,
+        "events": events,
+    }
+
+
+def check_thresholds(
+    report: Dict[str, Any],
+    max_p99_ms: Optional[float] = None,
+    max_drop_rate: Optional[float] = None,
+    max_kb_per_connection: Optional[float] = None,
+) -> List[str]:
+    """Regressions of a report against the given limits (empty when within them)."""
+    failures = []
+    if report["connections"]["failed"]:
+        failures.append(f"{report['connections']['failed']} connections failed to open")
+    if max_p99_ms is not None and report["fanout_p99_ms"] > max_p99_ms:
+        failures.append(f"fan-out p99 {report['fanout_p99_ms']}ms > {max_p99_ms}ms")
+    if max_drop_rate is not None and report["drop_rate"] > max_drop_rate:
+        failures.append(f"drop rate {report['drop_rate']} > {max_drop_rate}")
+    per_connection = report["memory"]["per_connection_kb"]
+    if max_kb_per_connection is not None and per_connection > max_kb_per_connection:
+        failures.append(f"memory {per_connection}KB/connection > {max_kb_per_connection}KB")
+    return failures
+
+
+def _parse_mix(value: str) -> Dict[str, float]:
+    """Parse "stage_change=0.6,drag=0.3,ping=0.1"."""
+    mix = {}
+    for part in value.split(","):
+        event_type, _, weight = part.partition("=")
+        if event_type not in EVENT_TYPES:
+            raise argparse.ArgumentTypeError(f"Unknown event type: {event_type}")
+        mix[event_type] = float(weight)
+    return mix
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the harness from the command line; exit status 1 on regressions."""
+    defaults = LoadConfig()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=defaults.clients)
+    parser.add_argument("--orgs", type=int, default=defaults.orgs)
+    parser.add_argument("--rate", type=float, default=defaults.rate, help="events/s, all clients")
+    parser.add_argument("--duration", type=float, default=defaults.duration, help="seconds")
+    parser.add_argument(
+        "--mix", type=_parse_mix, default=defaults.mix, help="e.g. stage_change=6,drag=3,ping=1"
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--json", help="also write the report to this file")
+    parser.add_argument("--max-p99-ms", type=float)
+    parser.add_argument("--max-drop-rate", type=float)
+    parser.add_argument("--max-kb-per-connection", type=float)
+    args = parser.parse_args(argv)
+
+    config = LoadConfig(
+        clients=args.clients,
+        orgs=args.orgs,
+        rate=args.rate,
+        duration=args.duration,
+        mix=args.mix,
+        seed=args.seed,
+    )
+    report = asyncio.run(run_load(config))
+    print(json.dumps(report, indent=2))
+    if args.json:
+        with open(args.json, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+
+    failures = check_thresholds(
+        report, args.max_p99_ms, args.max_drop_rate, args.max_kb_per_connection
+    )
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+"""Shared fixtures for core unit tests."""
+
+from typing import Any, List
+
+import pytest_asyncio
+
+from api.core.websocket_manager import WebSocketConnectionManager
+
+
+@pytest_asyncio.fixture
+async def make_manager():
+    """Build WebSocket managers that are closed, writer tasks awaited, after the test."""
+    managers: List[WebSocketConnectionManager] = []
+
+    def make(*args: Any, **kwargs: Any) -> WebSocketConnectionManager:
+        manager = WebSocketConnectionManager(*args, **kwargs)
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        await manager.close()
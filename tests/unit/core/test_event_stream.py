@@ -0,0 +1,111 @@
+"""Unit tests for core.event_stream module.
+
+Following CLAUDE.md principles:
+- FUNCTIONALITY FIRST: Test success scenarios before error scenarios
+- Focus on what the system DOES, not just what it REJECTS
+- Test SSE and WebSocket clients sharing one broadcast path
+"""
+
+import asyncio
+import json
+import uuid
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from api.core.event_stream import EventStreamConnection, parse_event_id
+from api.core.websocket_codec import SSE_FORMAT
+from api.core.websocket_manager import WebSocketConnectionManager
+from api.core.websocket_replay import InMemoryReplayBuffer
+
+
+def _websocket() -> Mock:
+    """Build a connected WebSocket mock."""
+    websocket = Mock()
+    websocket.accept = AsyncMock()
+    websocket.send_text = AsyncMock()
+    websocket.close = AsyncMock()
+    websocket.client_state.name = "CONNECTED"
+    return websocket
+
+
+async def _read(connection: EventStreamConnection, count: int) -> list:
+    """Read SSE frames (after the retry hint) from a connection."""
+    frames = connection.frames()
+    assert (await frames.__anext__()).startswith("retry:")
+    return [await asyncio.wait_for(frames.__anext__(), 1) for _ in range(count)]
+
+
+def _parse(frame: str) -> dict:
+    """Fields of one SSE event: {"id": ..., "data": parsed JSON}."""
+    fields = dict(line.split(": ", 1) for line in frame.strip().split("\n"))
+    return {"id": fields.get("id"), "data": json.loads(fields["data"])}
+
+
+async def _lead_event(manager: WebSocketConnectionManager, org_id, lead_id: str) -> None:
+    """Broadcast a replayable lead update."""
+    await manager.broadcast_to_organization(
+        org_id, {"type": "lead_updated", "lead": {"id": lead_id}}, replayable=True
+    )
+
+
+class TestEventStreamConnection:
+    """Test SSE delivery through the WebSocket manager - FUNCTIONALITY FIRST."""
+
+    @pytest.mark.asyncio
+    async def test_sse_and_websocket_clients_share_broadcasts_success(self, make_manager):
+        """Test one broadcast reaches both transports, with resumable SSE ids."""
+        # ✅ SUCCESS SCENARIO: one user behind a proxy, one on WebSockets
+        manager = make_manager(replay_buffer=InMemoryReplayBuffer(size=10))
+        org_id = uuid.uuid4()
+        stream = (await manager.stream_position(org_id))["id"]
+        connection = EventStreamConnection(stream, heartbeat_seconds=5)
+        websocket = _websocket()
+        await manager.connect(connection, org_id, uuid.uuid4(), {}, wire_format=SSE_FORMAT)
+        await manager.connect(websocket, org_id, uuid.uuid4(), {})
+
+        await _lead_event(manager, org_id, "L1")
+        user_joined, lead_event = [_parse(frame) for frame in await _read(connection, 2)]
+
+        assert user_joined["id"] is None  # presence isn't replayable
+        assert lead_event["id"] == f"{stream}:1"
+        assert lead_event["data"] == json.loads(websocket.send_text.call_args[0][0])
+        assert manager.get_delivery_metrics(org_id)["wire_formats"] == {"sse": 1, "json": 1}
+
+    @pytest.mark.asyncio
+    async def test_last_event_id_replays_missed_events(self, make_manager):
+        """Test a reconnecting EventSource gets what it missed."""
+        manager = make_manager(replay_buffer=InMemoryReplayBuffer(size=10))
+        org_id, user_id = uuid.uuid4(), uuid.uuid4()
+        stream = (await manager.stream_position(org_id))["id"]
+        for lead_id in ("L1", "L2", "L3"):
+            await _lead_event(manager, org_id, lead_id)
+
+        connection = EventStreamConnection(stream, heartbeat_seconds=5)
+        await manager.connect(
+            connection, org_id, user_id, {}, resuming=True, wire_format=SSE_FORMAT
+        )
+        await manager.resume(org_id, user_id, connection, *parse_event_id(f"{stream}:1"))
+        events = [_parse(frame) for frame in await _read(connection, 3)]
+
+        assert [event["id"] for event in events] == [f"{stream}:2", f"{stream}:3", None]
+        assert events[2]["data"] == {"type": "replay_complete", "replayed": 2}
+
+    @pytest.mark.asyncio
+    async def test_idle_stream_sends_keepalives_and_close_ends_it(self):
+        """Test proxies see traffic while idle and eviction ends the response."""
+        connection = EventStreamConnection("stream", heartbeat_seconds=0.01)
+        await connection.accept()
+        frames = connection.frames()
+        await frames.__anext__()
+
+        assert await frames.__anext__() == ": keepalive\n\n"
+        await connection.send_text("data: {}\n\n")
+        await connection.close(code=1013, reason="Slow consumer")
+        assert [frame async for frame in frames] == []
+
+    def test_parse_event_id_rejects_malformed_ids(self):
+        """Test only `<stream>:<seq>` ids are resumable."""
+        assert parse_event_id("abc:12") == ("abc", 12)
+        for event_id in (None, "", "12", "abc:", ":12", "abc:x"):
+            assert parse_event_id(event_id) is None
@@ -0,0 +1,96 @@
+"""Unit tests for core.websocket_auth module.
+
+Following CLAUDE.md principles:
+- FUNCTIONALITY FIRST: Test success scenarios before error scenarios
+- Focus on what the system DOES, not just what it REJECTS
+- Test reconnect storms with organization isolation
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from api.core import websocket_auth
+from api.core.websocket_auth import WebSocketAuthCache
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Replace the database load with a slow stub counting calls per key."""
+    calls = []
+    lock = threading.Lock()
+
+    def fake_load(org_id, user_id):
+        with lock:
+            calls.append((org_id, user_id))
+        time.sleep(0.05)
+        if user_id == "outsider":
+            raise HTTPException(status_code=403, detail="User does not belong to organization")
+        return (f"user-{user_id}", f"org-{org_id}")
+
+    monkeypatch.setattr(websocket_auth, "load_websocket_identity", fake_load)
+    return calls
+
+
+class TestWebSocketAuthCache:
+    """Test cached identity resolution - FUNCTIONALITY FIRST."""
+
+    @pytest.mark.asyncio
+    async def test_reconnect_storm_loads_each_user_once_success(self, loads):
+        """Test concurrent and repeated connects share one load per user."""
+        # ✅ SUCCESS SCENARIO: 20 sockets of one user reconnect at once
+        cache = WebSocketAuthCache(maxsize=10, ttl_seconds=60)
+        org_id = uuid.uuid4()
+        results = await asyncio.gather(*(cache.resolve(org_id, "ana") for _ in range(20)))
+        assert set(results) == {("user-ana", f"org-{org_id}")}
+
+        await cache.resolve(org_id, "ana")
+        await cache.resolve(uuid.uuid4(), "ana")
+        assert len(loads) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_forces_a_fresh_load(self, loads):
+        """Test membership changes drop cached identities."""
+        cache = WebSocketAuthCache(maxsize=10, ttl_seconds=60)
+        org_id, other_org_id = uuid.uuid4(), uuid.uuid4()
+        for key in ((org_id, "ana"), (org_id, "bia"), (other_org_id, "ana")):
+            await cache.resolve(*key)
+
+        cache.invalidate(org_id, "ana")
+        assert cache.get((org_id, "ana")) is None
+        assert cache.get((org_id, "bia")) is not None
+
+        cache.invalidate_organization(org_id)
+        assert cache.get((org_id, "bia")) is None
+        assert cache.get((other_org_id, "ana")) is not None
+
+    @pytest.mark.asyncio
+    async def test_rejections_are_not_cached(self, loads):
+        """Test a denied user is checked again on the next connect."""
+        cache = WebSocketAuthCache(maxsize=10, ttl_seconds=60)
+        org_id = uuid.uuid4()
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                await cache.resolve(org_id, "outsider")
+            assert exc_info.value.status_code == 403
+
+        assert len(loads) == 2
+        assert cache.get((org_id, "outsider")) is None
+
+    def test_entries_expire_and_lru_is_bounded(self):
+        """Test TTL expiry and eviction of the least recently used entry."""
+        cache = WebSocketAuthCache(maxsize=2, ttl_seconds=60)
+        cache.set(("org", "a"), ("a", "org"))
+        cache.set(("org", "b"), ("b", "org"))
+        cache.get(("org", "a"))
+        cache.set(("org", "c"), ("c", "org"))
+        assert cache.get(("org", "b")) is None
+        assert cache.get(("org", "a")) is not None
+
+        expired = WebSocketAuthCache(maxsize=2, ttl_seconds=0)
+        expired.set(("org", "a"), ("a", "org"))
+        assert expired.get(("org", "a")) is None
@@ -0,0 +1,159 @@
+"""Unit tests for core.websocket_broker module.
+
+Following CLAUDE.md principles:
+- FUNCTIONALITY FIRST: Test success scenarios before error scenarios
+- Focus on what the system DOES, not just what it REJECTS
+- Test real multi-process fan-out with organization isolation
+"""
+
+import asyncio
+import json
+import uuid
+from typing import Dict, List, Set
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+
+from api.core.websocket_broker import InMemoryBroker, RedisBroker
+from api.core.websocket_manager import WebSocketConnectionManager
+
+
+class FakePubSub:
+    """In-process stand-in for redis.asyncio PubSub."""
+
+    def __init__(self) -> None:
+        self.channels: Set[str] = set()
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, *channels: str) -> None:
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels: str) -> None:
+        self.channels.difference_update(channels)
+
+    async def get_message(self, ignore_subscribe_messages: bool = False, timeout: float = 0.0):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        pass
+
+
+class FakeRedis:
+    """In-process stand-in for redis.asyncio.Redis pub/sub (one shared server)."""
+
+    def __init__(self) -> None:
+        self.pubsubs: List[FakePubSub] = []
+        self.published: Dict[str, int] = {}
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> FakePubSub:
+        pubsub = FakePubSub()
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def publish(self, channel: str, data: str) -> int:
+        self.published[channel] = self.published.get(channel, 0) + 1
+        receivers = [pubsub for pubsub in self.pubsubs if channel in pubsub.channels]
+        for pubsub in receivers:
+            pubsub.queue.put_nowait({"type": "message", "channel": channel, "data": data})
+        return len(receivers)
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _websocket() -> Mock:
+    """Build a connected WebSocket mock."""
+    websocket = Mock()
+    websocket.accept = AsyncMock()
+    websocket.send_text = AsyncMock()
+    websocket.client_state.name = "CONNECTED"
+    return websocket
+
+
+async def _settle() -> None:
+    """Let broker listeners deliver pending messages."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestRedisBrokerFanOut:
+    """Test cross-process broadcast through Redis pub/sub - FUNCTIONALITY FIRST."""
+
+    @pytest_asyncio.fixture
+    async def processes(self):
+        """Two managers ("processes") sharing one fake Redis server."""
+        server = FakeRedis()
+        managers = [
+            WebSocketConnectionManager(RedisBroker(server, poll_timeout=0.01)) for _ in range(2)
+        ]
+        yield server, managers
+        for manager in managers:
+            await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_connections_on_other_process_success(self, processes):
+        """Test an event published on one process is delivered on another."""
+        # ✅ SUCCESS SCENARIO: sender on process A, receiver on process B
+        _, (process_a, process_b) = processes
+        org_id, sender, receiver = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        sender_ws, receiver_ws = _websocket(), _websocket()
+        await process_a.connect(sender_ws, org_id, sender, {})
+        await process_b.connect(receiver_ws, org_id, receiver, {})
+        await _settle()
+        receiver_ws.send_text.reset_mock()
+
+        await process_a.broadcast_to_organization(
+            org_id, {"type": "lead_stage_changed"}, exclude_user_id=sender
+        )
+        await _settle()
+
+        receiver_ws.send_text.assert_awaited_once()
+        event = json.loads(receiver_ws.send_text.call_args[0][0])
+        assert event["type"] == "lead_stage_changed"
+        assert event["organization_id"] == str(org_id)
+        assert all(
+            json.loads(call[0][0])["type"] != "lead_stage_changed"
+            for call in sender_ws.send_text.call_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_process_subscribes_only_while_it_has_connections(self, processes):
+        """Test channels follow local connections and other orgs are never received."""
+        server, (process_a, process_b) = processes
+        org_id, other_org = uuid.uuid4(), uuid.uuid4()
+        user_id = uuid.uuid4()
+        websocket = _websocket()
+        await process_b.connect(websocket, org_id, user_id, {})
+
+        pubsub_a, pubsub_b = server.pubsubs
+        assert pubsub_b.channels == {f"ws:org:{org_id}"}
+        assert pubsub_a.channels == set()
+
+        await process_a.broadcast_to_organization(other_org, {"type": "lead_created"})
+        await _settle()
+        assert websocket.send_text.await_count == 0
+
+        process_b.disconnect(org_id, user_id, websocket)
+        await _settle()
+        assert pubsub_b.channels == set()
+
+
+class TestInMemoryBroker:
+    """Test the single-process broker - FUNCTIONALITY FIRST."""
+
+    @pytest.mark.asyncio
+    async def test_publish_delivers_only_subscribed_organizations_success(self):
+        """Test in-memory publish calls the handler for subscribed orgs only."""
+        broker = InMemoryBroker()
+        handler = AsyncMock()
+        broker.bind(handler)
+        await broker.subscribe("org-a")
+
+        await broker.publish("org-a", "payload")
+        await broker.publish("org-b", "payload")
+
+        handler.assert_awaited_once_with("org-a", "payload")
@@ -0,0 +1,93 @@
+"""Unit tests for core.websocket_coalescer module.
+
+Following CLAUDE.md principles:
+- FUNCTIONALITY FIRST: Test success scenarios before error scenarios
+- Focus on what the system DOES, not just what it REJECTS
+- Test real pipeline event storms with organization isolation
+"""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from api.core.websocket_coalescer import BATCH_EVENT_TYPE, PipelineEventCoalescer
+
+
+def _drag(message_type: str, lead_id: str, user_id: str) -> dict:
+    """Build a drag event as relayed by /ws/pipeline."""
+    return {"type": message_type, "lead_id": lead_id, "user_id": user_id}
+
+
+class TestPipelineEventCoalescer:
+    """Test per-organization event coalescing - FUNCTIONALITY FIRST."""
+
+    @pytest.mark.asyncio
+    async def test_storm_becomes_one_latest_wins_frame_per_sender_success(self):
+        """Test a window of drag/activity events is sent as one batch per sender."""
+        # ✅ SUCCESS SCENARIO: 2 users dragging the same lead, activity spam
+        publish = AsyncMock()
+        coalescer = PipelineEventCoalescer(publish, window_seconds=0.01)
+        org_id = uuid.uuid4()
+        ana, bia = str(uuid.uuid4()), str(uuid.uuid4())
+
+        for _ in range(10):
+            for user_id in (ana, bia):
+                await coalescer.submit(
+                    org_id, ("lead_drag", "L1", user_id), _drag("lead_drag_start", "L1", user_id)
+                )
+            await coalescer.submit(
+                org_id, ("lead_drag", "L1", ana), _drag("lead_drag_end", "L1", ana)
+            )
+            await coalescer.submit(
+                org_id, ("user_activity", bia), {"type": "activity", "user_id": bia}
+            )
+        await asyncio.sleep(0.05)
+
+        frames = {str(call[0][2]): call[0][1] for call in publish.call_args_list}
+        assert set(frames) == {ana, bia}
+        assert frames[ana]["type"] == "lead_drag_end"
+        assert frames[bia]["type"] == BATCH_EVENT_TYPE
+        assert [event["type"] for event in frames[bia]["events"]] == [
+            "lead_drag_start",
+            "activity",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_single_sender_frame_excludes_sender_success(self):
+        """Test a lone event is sent unwrapped and not echoed to its sender."""
+        publish = AsyncMock()
+        coalescer = PipelineEventCoalescer(publish, window_seconds=0.01)
+        org_id, user_id = uuid.uuid4(), uuid.uuid4()
+
+        await coalescer.submit(
+            org_id, ("lead_drag", "L1"), _drag("lead_drag_start", "L1", str(user_id))
+        )
+        await asyncio.sleep(0.05)
+
+        _, frame, exclude = publish.call_args[0]
+        assert frame["type"] == "lead_drag_start" and exclude == user_id
+
+    @pytest.mark.asyncio
+    async def test_organizations_are_flushed_separately(self):
+        """Test each organization gets its own frame."""
+        publish = AsyncMock()
+        coalescer = PipelineEventCoalescer(publish, window_seconds=0.01)
+        org_a, org_b, user_id = uuid.uuid4(), uuid.uuid4(), str(uuid.uuid4())
+
+        await coalescer.submit(org_a, ("lead_drag", "L1"), _drag("lead_drag_end", "L1", user_id))
+        await coalescer.submit(org_b, ("lead_drag", "L1"), _drag("lead_drag_end", "L1", user_id))
+        await asyncio.sleep(0.05)
+
+        assert {call[0][0] for call in publish.call_args_list} == {org_a, org_b}
+
+    @pytest.mark.asyncio
+    async def test_zero_window_publishes_immediately(self):
+        """Test coalescing can be turned off."""
+        publish = AsyncMock()
+        coalescer = PipelineEventCoalescer(publish, window_seconds=0)
+
+        await coalescer.submit(uuid.uuid4(), "key", {"type": "activity", "user_id": None})
+
+        publish.assert_awaited_once()
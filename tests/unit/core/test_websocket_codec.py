@@ -0,0 +1,106 @@
+"""Unit tests for core.websocket_codec module.
+
+Following CLAUDE.md principles:
+- FUNCTIONALITY FIRST: Test success scenarios before error scenarios
+- Focus on what the system DOES, not just what it REJECTS
+- Test mixed-format broadcasts with organization isolation
+"""
+
+import asyncio
+import json
+import uuid
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from api.core import websocket_codec
+from api.core.websocket_codec import EncodedMessage, negotiate_wire_format
+
+
+@pytest.fixture
+def packs(monkeypatch):
+    """Pretend msgpack is installed, packing with a stub that records its calls."""
+    calls = []
+
+    def fake_pack(message):
+        calls.append(message)
+        return json.dumps(message).encode()
+
+    monkeypatch.setattr(websocket_codec, "MSGPACK_AVAILABLE", True)
+    monkeypatch.setattr(websocket_codec, "_pack", fake_pack)
+    return calls
+
+
+def _websocket() -> Mock:
+    """Build a connected WebSocket mock."""
+    websocket = Mock()
+    websocket.accept = AsyncMock()
+    websocket.send_text = AsyncMock()
+    websocket.send_bytes = AsyncMock()
+    websocket.close = AsyncMock()
+    websocket.client_state.name = "CONNECTED"
+    return websocket
+
+
+class TestWireFormatNegotiation:
+    """Test format negotiation - FUNCTIONALITY FIRST."""
+
+    def test_msgpack_negotiated_by_query_or_subprotocol_success(self, packs):
+        """Test clients can ask for msgpack either way."""
+        # ✅ SUCCESS SCENARIO: mobile client asks for binary frames
+        assert negotiate_wire_format("msgpack") == ("msgpack", None)
+        assert negotiate_wire_format(None, ["v2", "msgpack"]) == ("msgpack", "msgpack")
+        assert negotiate_wire_format(None, []) == ("json", None)
+
+    def test_unsupported_formats_fall_back_to_json(self, monkeypatch):
+        """Test unknown formats, or msgpack without the library, get JSON."""
+        assert negotiate_wire_format("xml") == ("json", None)
+
+        monkeypatch.setattr(websocket_codec, "MSGPACK_AVAILABLE", False)
+        assert negotiate_wire_format("msgpack") == ("json", None)
+        assert negotiate_wire_format(None, ["msgpack"]) == ("json", None)
+
+    def test_msgpack_frames_round_trip(self):
+        """Test msgpack frames decode to the message minus organization_id."""
+        msgpack = pytest.importorskip("msgpack")
+        encoded = EncodedMessage.from_message(
+            {"type": "lead_updated", "lead": {"id": "L1"}, "organization_id": "org"}
+        )
+
+        frame = encoded.frame("msgpack")
+        assert msgpack.unpackb(frame) == {"type": "lead_updated", "lead": {"id": "L1"}}
+        assert len(frame) < len(encoded.frame("json"))
+
+
+class TestMixedFormatBroadcast:
+    """Test broadcasts to connections in different formats - FUNCTIONALITY FIRST."""
+
+    @pytest.mark.asyncio
+    async def test_each_format_is_encoded_once_per_broadcast_success(self, make_manager, packs):
+        """Test msgpack connections share one encode and JSON ones get text frames."""
+        # ✅ SUCCESS SCENARIO: two mobile clients and one browser
+        manager = make_manager()
+        org_id = uuid.uuid4()
+        mobile = [_websocket(), _websocket()]
+        browser = _websocket()
+        for websocket in mobile:
+            await manager.connect(websocket, org_id, uuid.uuid4(), {}, wire_format="msgpack")
+        await manager.connect(browser, org_id, uuid.uuid4(), {})
+        packs.clear()
+
+        await manager.broadcast_to_organization(
+            org_id, {"type": "lead_updated", "lead": {"id": "L1"}}
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert len(packs) == 1
+        assert "organization_id" not in packs[0]
+        for websocket in mobile:
+            assert json.loads(websocket.send_bytes.call_args[0][0])["type"] == "lead_updated"
+            assert websocket.send_text.await_count == 0
+        assert json.loads(browser.send_text.call_args[0][0])["organization_id"] == str(org_id)
+
+        metrics = manager.get_delivery_metrics(org_id)
+        assert metrics["wire_formats"] == {"msgpack": 2, "json": 1}
+        assert metrics["bytes_sent"] > 0
@@ -0,0 +1,157 @@
+"""Unit tests for core.websocket_manager module.
+
+Following CLAUDE.md principles:
+- FUNCTIONALITY FIRST: Test success scenarios before error scenarios
+- Focus on what the system DOES, not just what it REJECTS
+- Test real-time delivery with organization isolation
+"""
+
+import asyncio
+import json
+import uuid
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from api.core.websocket_manager import SLOW_CONSUMER_CLOSE_CODE, event_topics
+
+
+def _websocket() -> Mock:
+    """Build a connected WebSocket mock."""
+    websocket = Mock()
+    websocket.accept = AsyncMock()
+    websocket.send_text = AsyncMock()
+    websocket.close = AsyncMock()
+    websocket.client_state.name = "CONNECTED"
+    return websocket
+
+
+def _stalled_websocket(release: asyncio.Event) -> Mock:
+    """Build a WebSocket whose sends block until `release` is set (slow mobile client)."""
+    websocket = _websocket()
+
+    async def send_text(_):
+        await release.wait()
+
+    websocket.send_text = AsyncMock(side_effect=send_text)
+    return websocket
+
+
+async def _settle() -> None:
+    """Let writer tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestConcurrentBroadcast:
+    """Test per-connection send queues - FUNCTIONALITY FIRST."""
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_delay_others_success(self, make_manager):
+        """Test a stalled socket doesn't hold back delivery to the rest of the org."""
+        # ✅ SUCCESS SCENARIO: fast client receives while slow client is stuck
+        manager = make_manager(send_queue_size=8)
+        org_id, release = uuid.uuid4(), asyncio.Event()
+        slow, fast = _stalled_websocket(release), _websocket()
+        await manager.connect(slow, org_id, uuid.uuid4(), {})
+        await manager.connect(fast, org_id, uuid.uuid4(), {})
+        await _settle()
+
+        await asyncio.wait_for(
+            manager.broadcast_to_organization(org_id, {"type": "lead_created"}), timeout=0.1
+        )
+        await _settle()
+
+        sent = [json.loads(call[0][0])["type"] for call in fast.send_text.call_args_list]
+        assert sent[-1] == "lead_created"
+        metrics = manager.get_delivery_metrics(org_id)
+        assert metrics["connections"] == 2 and metrics["queue_depth_max"] >= 1
+        assert metrics["messages_sent"] >= 1
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_queue_overflow_evicts_slow_consumer(self, make_manager):
+        """Test a client that overflows its queue is closed and removed."""
+        manager = make_manager(send_queue_size=2)
+        org_id, user_id, release = uuid.uuid4(), uuid.uuid4(), asyncio.Event()
+        slow = _stalled_websocket(release)
+        await manager.connect(slow, org_id, user_id, {})
+        await _settle()
+
+        for _ in range(4):
+            await manager.broadcast_to_organization(org_id, {"type": "lead_updated"})
+        await _settle()
+
+        slow.close.assert_awaited_once()
+        assert slow.close.call_args.kwargs["code"] == SLOW_CONSUMER_CLOSE_CODE
+        assert str(org_id) not in manager.connections
+        assert slow not in manager.senders
+        assert manager.get_delivery_metrics()["evicted_connections"] == 1
+        release.set()
+
+
+def _received(websocket: Mock) -> list:
+    """Types of messages sent to a WebSocket mock."""
+    return [json.loads(call[0][0])["type"] for call in websocket.send_text.call_args_list]
+
+
+class TestTopicSubscriptions:
+    """Test topic-filtered delivery - FUNCTIONALITY FIRST."""
+
+    @pytest.mark.asyncio
+    async def test_subscribed_connection_receives_only_its_topics_success(self, make_manager):
+        """Test a stage viewer gets its stage's events, not the rest of the board."""
+        # ✅ SUCCESS SCENARIO: one client watches "proposta", one never subscribed
+        manager = make_manager()
+        org_id, viewer, legacy = uuid.uuid4(), _websocket(), _websocket()
+        viewer_id = uuid.uuid4()
+        await manager.connect(viewer, org_id, viewer_id, {})
+        await manager.connect(legacy, org_id, uuid.uuid4(), {})
+        assert manager.subscribe(org_id, viewer_id, viewer, ["stage:proposta"]) == {
+            "stage:proposta"
+        }
+        await _settle()
+        viewer.send_text.reset_mock()
+        legacy.send_text.reset_mock()
+
+        for lead_id, stage in (("L1", "proposta"), ("L2", "contato")):
+            await manager.broadcast_to_organization(
+                org_id, {"type": "lead_updated", "lead": {"id": lead_id, "stage": stage}}
+            )
+        await manager.broadcast_to_organization(org_id, {"type": "leads_bulk_deleted"})
+        await _settle()
+
+        assert [
+            json.loads(c[0][0]).get("lead", {}).get("id") for c in viewer.send_text.call_args_list
+        ] == ["L1", None]
+        assert _received(legacy) == ["lead_updated", "lead_updated", "leads_bulk_deleted"]
+        stats = (await manager.get_organization_stats(org_id))["subscriptions"]
+        assert stats == {"filtered_connections": 1, "topics": 1}
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_and_disconnect_clean_the_index(self, make_manager):
+        """Test topics are removed from the index when dropped or the socket leaves."""
+        manager = make_manager()
+        org_id, user_id, websocket = uuid.uuid4(), uuid.uuid4(), _websocket()
+        await manager.connect(websocket, org_id, user_id, {})
+        manager.subscribe(org_id, user_id, websocket, ["presence", "lead:L1"])
+
+        assert manager.unsubscribe(org_id, websocket, ["lead:L1"]) == {"presence"}
+        assert set(manager.topic_index[str(org_id)]) == {"presence"}
+
+        manager.disconnect(org_id, user_id, websocket)
+        assert str(org_id) not in manager.topic_index
+        assert websocket not in manager.connection_topics
+
+    def test_event_topics_follow_lead_stage_and_presence(self):
+        """Test events are scoped by lead, old/new stage, and presence."""
+        stage_change = {
+            "type": "lead_stage_changed",
+            "lead": {"id": "L1", "stage": "fechado", "previous_stage": "negociacao"},
+        }
+        assert event_topics(stage_change) == {"lead:L1", "stage:fechado", "stage:negociacao"}
+        assert event_topics({"type": "user_joined"}) == {"presence"}
+        assert event_topics(
+            {"type": "pipeline_event_batch", "events": [{"type": "lead_drag_end", "lead_id": "L2"}]}
+        ) == {"lead:L2"}
+        assert event_topics({"type": "leads_bulk_updated", "lead_ids": ["L1"]}) is None
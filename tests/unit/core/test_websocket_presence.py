@@ -0,0 +1,167 @@
+"""Unit tests for core.websocket_presence module.
+
+Following CLAUDE.md principles:
+- FUNCTIONALITY FIRST: Test success scenarios before error scenarios
+- Focus on what the system DOES, not just what it REJECTS
+- Test real multi-process presence with organization isolation
+"""
+
+import asyncio
+import time
+from typing import Dict
+
+import pytest
+import pytest_asyncio
+
+from api.core.websocket_presence import LocalPresence, RedisPresence
+
+
+class FakePipeline:
+    """Buffers commands and runs them on execute(), like redis.asyncio pipelines."""
+
+    def __init__(self, server: "FakeRedis") -> None:
+        self.server = server
+        self.commands = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        pass
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+
+        return command
+
+    async def execute(self) -> list:
+        return [
+            await getattr(self.server, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+class FakeRedis:
+    """In-process stand-in for the sorted set / hash commands presence uses."""
+
+    def __init__(self) -> None:
+        self.zsets: Dict[str, Dict[str, float]] = {}
+        self.hashes: Dict[str, Dict[str, str]] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def zadd(self, key: str, mapping: Dict[str, float]) -> None:
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zrem(self, key: str, *members: str) -> None:
+        for member in members:
+            self.zsets.get(key, {}).pop(member, None)
+
+    async def zrangebyscore(self, key: str, low, high) -> list:
+        def bound(value, default):
+            if value in ("-inf", "+inf"):
+                return default
+            return float(str(value).lstrip("("))
+
+        low_value, high_value = bound(low, float("-inf")), bound(high, float("inf"))
+        exclusive_high = str(high).startswith("(")
+        return [
+            member
+            for member, score in sorted(self.zsets.get(key, {}).items(), key=lambda i: i[1])
+            if score >= low_value
+            and (score < high_value if exclusive_high else score <= high_value)
+        ]
+
+    async def hset(self, key: str, mapping: Dict[str, str]) -> None:
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    async def hdel(self, key: str, *fields: str) -> None:
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+    async def hmget(self, key: str, fields: list) -> list:
+        return [self.hashes.get(key, {}).get(field) for field in fields]
+
+    async def expire(self, key: str, seconds: int) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+async def _settle() -> None:
+    """Let scheduled presence writes run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestLocalPresence:
+    """Test incremental presence counters - FUNCTIONALITY FIRST."""
+
+    def test_counters_follow_joins_and_leaves_success(self):
+        """Test users and connections are counted without rescanning."""
+        # ✅ SUCCESS SCENARIO: one user with two tabs, one with one tab
+        presence = LocalPresence()
+        presence.join("org", "ana", {"full_name": "Ana"})
+        presence.join("org", "ana", {"full_name": "Ana"})
+        presence.join("org", "bia", {"full_name": "Bia"})
+        assert presence.local_counts("org") == {"online_users": 2, "connections": 3}
+
+        assert presence.leave("org", "ana") is False
+        assert presence.leave("org", "bia") is True
+        assert presence.local_counts("org") == {"online_users": 1, "connections": 1}
+        assert presence.local_users("org")[0]["full_name"] == "Ana"
+
+        assert presence.leave("org", "ana") is True
+        assert presence.local_counts("org") == {"online_users": 0, "connections": 0}
+        assert presence.entries == {}
+
+
+class TestRedisPresence:
+    """Test cluster-wide presence through Redis - FUNCTIONALITY FIRST."""
+
+    @pytest_asyncio.fixture
+    async def processes(self):
+        """Two presence stores ("processes") sharing one fake Redis server."""
+        server = FakeRedis()
+        stores = [RedisPresence(server, ttl_seconds=60) for _ in range(2)]
+        yield server, stores
+        for store in stores:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_users_are_merged_across_processes_success(self, processes):
+        """Test each process sees users connected to the other one."""
+        # ✅ SUCCESS SCENARIO: Ana has a tab on each process, Bia on process B
+        _, (process_a, process_b) = processes
+        process_a.join("org", "ana", {"full_name": "Ana"})
+        process_b.join("org", "ana", {"full_name": "Ana"})
+        process_b.join("org", "bia", {"full_name": "Bia"})
+        process_b.join("other-org", "caio", {"full_name": "Caio"})
+        await _settle()
+
+        users = {user["user_id"]: user for user in await process_a.users("org")}
+        assert set(users) == {"ana", "bia"}
+        assert users["ana"]["connections"] == 2
+
+        process_b.leave("org", "ana")
+        await _settle()
+        users = {user["user_id"]: user for user in await process_a.users("org")}
+        assert users["ana"]["connections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_crashed_process_entries_expire(self, processes):
+        """Test entries without heartbeats drop out after the TTL."""
+        server, (process_a, process_b) = processes
+        process_b.join("org", "bia", {"full_name": "Bia"})
+        await _settle()
+
+        # Process B stops heartbeating: its entry's expiry passes
+        seen_key, users_key = process_b._keys("org")
+        member = process_b._member("bia")
+        server.zsets[seen_key][member] = time.time() - 1
+
+        assert await process_a.users("org") == []
+        assert member not in server.hashes[users_key]
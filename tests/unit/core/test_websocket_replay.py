@@ -0,0 +1,176 @@
+"""Unit tests for core.websocket_replay module.
+
+Following CLAUDE.md principles:
+- FUNCTIONALITY FIRST: Test success scenarios before error scenarios
+- Focus on what the system DOES, not just what it REJECTS
+- Test real reconnects with organization isolation
+"""
+
+import asyncio
+import json
+import uuid
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from api.core.websocket_broker import InMemoryBroker, RedisBroker
+from api.core.websocket_manager import WebSocketConnectionManager
+from api.core.websocket_replay import InMemoryReplayBuffer, RedisReplayBuffer
+
+
+def _websocket() -> Mock:
+    """Build a connected WebSocket mock."""
+    websocket = Mock()
+    websocket.accept = AsyncMock()
+    websocket.send_text = AsyncMock()
+    websocket.close = AsyncMock()
+    websocket.client_state.name = "CONNECTED"
+    return websocket
+
+
+def _frames(websocket: Mock) -> list:
+    """Messages sent to a WebSocket mock."""
+    return [json.loads(call[0][0]) for call in websocket.send_text.call_args_list]
+
+
+async def _settle() -> None:
+    """Let writer tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _publish_all(buffer: InMemoryReplayBuffer, names) -> list:
+    """Publish `{"name": ...}` envelopes through the buffer; returns their buffered form."""
+    for name in names:
+        await buffer.publish("org", json.dumps({"name": name}), InMemoryBroker())
+    return [json.dumps({"name": name, "seq": seq}) for seq, name in enumerate(names, 1)]
+
+
+async def _lead_event(manager: WebSocketConnectionManager, org_id, lead_id: str, **kwargs):
+    """Broadcast a replayable lead update."""
+    await manager.broadcast_to_organization(
+        org_id, {"type": "lead_updated", "lead": {"id": lead_id}}, replayable=True, **kwargs
+    )
+
+
+class TestInMemoryReplayBuffer:
+    """Test sequence numbering and gap detection - FUNCTIONALITY FIRST."""
+
+    @pytest.mark.asyncio
+    async def test_since_returns_the_gap_success(self):
+        """Test a cursor inside the buffer gets exactly the events after it."""
+        # ✅ SUCCESS SCENARIO: client saw seq 2 of 4
+        buffer = InMemoryReplayBuffer(size=10)
+        a, b, c, d = await _publish_all(buffer, "abcd")
+
+        stream, latest = await buffer.position("org")
+        assert latest == 4
+        assert await buffer.since("org", stream, 2) == [c, d]
+        assert await buffer.since("org", stream, 4) == []
+        assert await buffer.position("other-org") == (stream, 0)
+
+    @pytest.mark.asyncio
+    async def test_cursor_too_old_or_from_another_stream_needs_resync(self):
+        """Test evicted events and restarted streams can't be resumed."""
+        buffer = InMemoryReplayBuffer(size=2)
+        a, b, c = await _publish_all(buffer, "abc")
+
+        assert await buffer.since("org", buffer.stream, 0) is None
+        assert await buffer.since("org", buffer.stream, 1) == [b, c]
+        assert await buffer.since("org", "previous-stream", 2) is None
+        assert await buffer.since("org", buffer.stream, 9) is None
+
+
+class TestRedisReplayBuffer:
+    """Test numbering, buffering and publishing are one script - FUNCTIONALITY FIRST."""
+
+    @pytest.mark.asyncio
+    async def test_script_publishes_on_the_broker_channel_success(self):
+        """Test the Redis broker's channel is published from inside the script."""
+        # ✅ SUCCESS SCENARIO: no other process can publish between INCR and PUBLISH
+        client = Mock()
+        client.register_script.return_value = AsyncMock(return_value=7)
+        buffer = RedisReplayBuffer(client, size=10)
+        broker = RedisBroker(Mock())
+        broker.publish = AsyncMock()
+
+        assert await buffer.publish("org", '{"name": "a"}', broker) == 7
+        script_args = client.register_script.return_value.call_args.kwargs["args"]
+        assert script_args[0] == '{"name": "a"}'
+        assert script_args[3] == broker.channel("org")
+        broker.publish.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_other_brokers_publish_the_numbered_envelope(self):
+        """Test brokers without a Redis channel still get the numbered envelope."""
+        client = Mock()
+        client.register_script.return_value = AsyncMock(return_value=3)
+        broker = InMemoryBroker()
+        broker.publish = AsyncMock()
+
+        await RedisReplayBuffer(client, size=10).publish("org", '{"name": "a"}', broker)
+
+        broker.publish.assert_awaited_once_with("org", '{"name": "a", "seq": 3}')
+
+
+class TestConnectionResume:
+    """Test resuming a connection through the manager - FUNCTIONALITY FIRST."""
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_missed_events_in_order_success(self, make_manager):
+        """Test a reconnecting client gets what it missed, then live events, each once."""
+        # ✅ SUCCESS SCENARIO: network blip during two lead updates
+        manager = make_manager()
+        org_id, user_id = uuid.uuid4(), uuid.uuid4()
+        stream = (await manager.stream_position(org_id))["id"]
+        await _lead_event(manager, org_id, "L1")
+        await _lead_event(manager, org_id, "L2")
+        await _lead_event(manager, org_id, "L3", exclude_user_id=user_id)
+
+        websocket = _websocket()
+        await manager.connect(websocket, org_id, user_id, {}, resuming=True)
+        await _lead_event(manager, org_id, "L4")  # arrives while the replay is loading
+        summary = await manager.resume(org_id, user_id, websocket, stream, 1)
+        await _lead_event(manager, org_id, "L5")
+        await _settle()
+
+        assert summary == {"type": "replay_complete", "replayed": 2}
+        sequenced = [frame for frame in _frames(websocket) if "seq" in frame or "replayed" in frame]
+        assert [frame.get("seq", "done") for frame in sequenced] == [2, 4, "done", 5]
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_only_subscribed_topics(self, make_manager):
+        """Test a replay is filtered like live broadcasts for a subscribed connection."""
+        manager = make_manager()
+        org_id, user_id = uuid.uuid4(), uuid.uuid4()
+        stream = (await manager.stream_position(org_id))["id"]
+        await _lead_event(manager, org_id, "L1")
+        await _lead_event(manager, org_id, "L2")
+        await _lead_event(manager, org_id, "L3", topics=[])
+
+        websocket = _websocket()
+        await manager.connect(websocket, org_id, user_id, {}, resuming=True)
+        manager.subscribe(org_id, user_id, websocket, ["lead:L2"])
+        summary = await manager.resume(org_id, user_id, websocket, stream, 0)
+        await _settle()
+
+        assert summary == {"type": "replay_complete", "replayed": 1}
+        assert [frame["lead"]["id"] for frame in _frames(websocket) if "lead" in frame] == ["L2"]
+
+    @pytest.mark.asyncio
+    async def test_resume_from_evicted_cursor_requires_resync(self, make_manager):
+        """Test a cursor older than the buffer gets resync_required with the new cursor."""
+        manager = make_manager(replay_buffer=InMemoryReplayBuffer(size=2))
+        org_id, user_id = uuid.uuid4(), uuid.uuid4()
+        stream = (await manager.stream_position(org_id))["id"]
+        for lead_id in ("L1", "L2", "L3"):
+            await _lead_event(manager, org_id, lead_id)
+
+        websocket = _websocket()
+        await manager.connect(websocket, org_id, user_id, {}, resuming=True)
+        summary = await manager.resume(org_id, user_id, websocket, stream, 0)
+        await _settle()
+
+        assert summary["type"] == "resync_required"
+        assert summary["stream"] == {"id": stream, "seq": 3}
+        assert all("seq" not in frame for frame in _frames(websocket))
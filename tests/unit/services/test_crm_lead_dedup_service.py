@@ -0,0 +1,166 @@
+"""Unit tests for services.crm_lead_dedup_service module.
+
+Following CLAUDE.md principles:
+- FUNCTIONALITY FIRST: Test success scenarios (2XX) before error scenarios (4XX)
+- Focus on what the system DOES, not just what it REJECTS
+- Test real usage scenarios with proper multi-tenant lead management
+"""
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from fastapi import HTTPException
+
+from api.models.crm_audit_log import AuditAction
+from api.models.crm_lead import Lead
+from api.models.crm_lead_custom_fields import LeadCustomFields
+from api.schemas.crm_lead import LeadMergeRequest
+from api.services.crm_lead_dedup_service import CRMLeadDedupService, cluster_duplicates, name_key
+
+
+def _row(name, email=None, phone=None):
+    """Build a scan row."""
+    return SimpleNamespace(id=uuid.uuid4(), name=name, email=email, phone=phone)
+
+
+def _lead(**values) -> Lead:
+    """Build a detached lead."""
+    now = datetime.now(timezone.utc)
+    defaults = dict(
+        id=uuid.uuid4(),
+        organization_id=uuid.uuid4(),
+        name="Lead",
+        stage="lead",
+        source="web",
+        tags=[],
+        is_favorite=False,
+        created_at=now,
+        updated_at=now,
+    )
+    defaults.update(values)
+    return Lead(**defaults)
+
+
+class TestDuplicateClustering:
+    """Test blocking-key clustering - FUNCTIONALITY FIRST."""
+
+    def test_clusters_link_through_any_key_success(self):
+        """Test leads sharing email, phone or name key end in one cluster."""
+        # ✅ SUCCESS SCENARIO: a-b share email, b-c share phone -> {a, b, c}
+        a = _row("Ana Souza", email="ANA@example.com")
+        b = _row("A. Souza", email="ana@example.com ", phone="+55 11 9999-0000")
+        c = _row("Ana S.", phone="(+55) 11 99990000")
+        d = _row("Souza Ana")  # same name key as a
+        e = _row("Bruno Lima", email="bruno@example.com")
+
+        clusters = cluster_duplicates([a, b, c, d, e], max_block_size=50)
+
+        assert len(clusters) == 1
+        lead_ids, reasons = clusters[0]
+        assert lead_ids == [a.id, b.id, c.id, d.id]
+        assert reasons == ["email", "name", "phone"]
+
+    def test_generic_blocks_are_skipped_success(self):
+        """Test keys shared by too many leads do not create clusters."""
+        # ✅ SUCCESS SCENARIO: a name shared by 3 leads exceeds block size 2
+        rows = [_row("Maria Silva") for _ in range(3)]
+
+        assert cluster_duplicates(rows, max_block_size=2) == []
+
+    def test_name_key_folds_accents_and_order(self):
+        """Test name keys ignore accents, case, punctuation and token order."""
+        assert name_key("Silva, João") == name_key("joao  SILVA") == "joao silva"
+        assert name_key("Maria") is None
+
+
+class TestCRMLeadDedupServiceMerge:
+    """Test transactional lead merge - FUNCTIONALITY FIRST."""
+
+    @pytest.fixture
+    def broadcasts(self, monkeypatch):
+        """Patch the WebSocket manager broadcast."""
+        broadcast = AsyncMock()
+        monkeypatch.setattr(
+            "api.core.websocket_manager.websocket_manager.broadcast_to_organization", broadcast
+        )
+        return broadcast
+
+    @pytest.fixture
+    def service(self):
+        """Create dedup service with mock session and repository."""
+        service = CRMLeadDedupService(MagicMock())
+        service.repository = Mock()
+        service.repository.repoint_lead_children.return_value = (3, 1)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_merge_repoints_children_and_fills_primary_success(self, service, broadcasts):
+        """Test merge moves children, fills blanks, deletes duplicates and audits."""
+        # ✅ SUCCESS SCENARIO: Primary absorbs phone, tags and favorite flag
+        primary = _lead(name="Ana", email="ana@example.com", tags=["VIP"], notes="first")
+        duplicate = _lead(
+            name="Ana S.", phone="+5511999990000", tags=["VIP", "Hot"], notes="second"
+        )
+        duplicate.is_favorite = True
+        duplicate.custom_fields = LeadCustomFields(fields={"origem": "feira"})
+        primary.add_note = Mock()
+        service.repository.get_by_ids.return_value = [primary, duplicate]
+        organization = Mock(id=uuid.uuid4())
+
+        result = await service.merge_leads(
+            organization,
+            LeadMergeRequest(primary_id=primary.id, duplicate_ids=[duplicate.id, primary.id]),
+            uuid.uuid4(),
+        )
+
+        assert service.repository.get_by_ids.call_args.kwargs["for_update"] is True
+        service.repository.repoint_lead_children.assert_called_once_with(
+            organization.id, [duplicate.id], primary.id
+        )
+        service.repository.bulk_delete_with_tombstones.assert_called_once_with(
+            organization.id, [duplicate.id]
+        )
+        assert primary.phone == "+5511999990000"
+        assert primary.tags == ["VIP", "Hot"]
+        primary.add_note.assert_called_once_with("first\n\nsecond")
+        assert primary.custom_fields.fields == {"origem": "feira"}
+        assert primary.is_favorite is True
+        actions = [call[0][2] for call in service.repository.write_audit_batch.call_args_list]
+        assert actions == [AuditAction.UPDATE, AuditAction.DELETE]
+        service.db.commit.assert_called_once()
+        broadcasts.assert_awaited_once()
+        assert broadcasts.call_args[0][1]["type"] == "leads_merged"
+        assert result.merged_ids == [duplicate.id]
+        assert (result.communications_moved, result.summaries_moved) == (3, 1)
+
+    @pytest.mark.asyncio
+    async def test_merge_rejects_leads_outside_organization(self, service):
+        """Test merge fails with 404 when a lead is not in the organization."""
+        primary = _lead()
+        service.repository.get_by_ids.return_value = [primary]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.merge_leads(
+                Mock(id=uuid.uuid4()),
+                LeadMergeRequest(primary_id=primary.id, duplicate_ids=[uuid.uuid4()]),
+            )
+
+        assert exc_info.value.status_code == 404
+        service.db.rollback.assert_called_once()
+        service.repository.repoint_lead_children.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_merge_requires_other_leads(self, service):
+        """Test merging a lead only into itself is rejected with 400."""
+        lead_id = uuid.uuid4()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.merge_leads(
+                Mock(id=uuid.uuid4()),
+                LeadMergeRequest(primary_id=lead_id, duplicate_ids=[lead_id]),
+            )
+
+        assert exc_info.value.status_code == 400
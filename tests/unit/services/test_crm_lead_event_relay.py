@@ -0,0 +1,90 @@
+"""Unit tests for services.crm_lead_event_relay module.
+
+Following CLAUDE.md principles:
+- FUNCTIONALITY FIRST: Test success scenarios (2XX) before error scenarios (4XX)
+- Focus on what the system DOES, not just what it REJECTS
+- Test real usage scenarios with proper multi-tenant lead management
+"""
+
+import uuid
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from api.core.config import settings
+from api.models.crm_lead_event import LeadOutboxEvent
+from api.services import crm_lead_event_relay
+from api.services.crm_lead_event_relay import LeadEventRelay
+
+
+def _event(event_id: int, org_id: uuid.UUID) -> LeadOutboxEvent:
+    """Build a pending outbox event."""
+    return LeadOutboxEvent(
+        id=event_id,
+        organization_id=org_id,
+        event_type="lead_created",
+        payload={"type": "lead_created", "lead": {"id": str(uuid.uuid4())}},
+    )
+
+
+class TestLeadEventRelay:
+    """Test outbox draining - FUNCTIONALITY FIRST."""
+
+    @pytest.fixture
+    def db(self, monkeypatch):
+        """Patch the relay's session factory."""
+        db = Mock()
+        monkeypatch.setattr(crm_lead_event_relay, "SessionLocal", lambda: db)
+        monkeypatch.setattr(settings, "LEAD_EVENT_RELAY_BATCH_SIZE", 2)
+        return db
+
+    @pytest.fixture
+    def broadcasts(self, monkeypatch):
+        """Patch the WebSocket manager broadcast."""
+        broadcast = AsyncMock()
+        monkeypatch.setattr(
+            "api.core.websocket_manager.websocket_manager.broadcast_to_organization", broadcast
+        )
+        return broadcast
+
+    @pytest.fixture
+    def repository(self, monkeypatch):
+        """Patch the relay's repository."""
+        repository = Mock()
+        monkeypatch.setattr(crm_lead_event_relay, "CRMLeadRepository", lambda db: repository)
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_drain_publishes_and_deletes_in_batches_success(self, db, broadcasts, repository):
+        """Test each batch is published in order, then deleted and committed."""
+        # ✅ SUCCESS SCENARIO: one full batch and one short batch
+        org_id = uuid.uuid4()
+        first = [_event(1, org_id), _event(2, org_id)]
+        second = [_event(3, org_id)]
+        repository.claim_outbox_events.side_effect = [first, second]
+
+        assert await LeadEventRelay().drain() == 3
+
+        published = [call[0][1] for call in broadcasts.call_args_list]
+        assert published == [event.payload for event in [*first, *second]]
+        assert all(call.kwargs["replayable"] for call in broadcasts.call_args_list)
+        deleted = [call[0][0] for call in repository.delete_outbox_events.call_args_list]
+        assert deleted == [[1, 2], [3]]
+        assert db.commit.call_count == 2
+        db.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_publish_keeps_batch_for_retry(self, db, broadcasts, repository):
+        """Test a publish failure rolls back so the batch is delivered again."""
+        repository.claim_outbox_events.return_value = [_event(1, uuid.uuid4())]
+        broadcasts.side_effect = RuntimeError("boom")
+
+        assert await LeadEventRelay().drain() == 0
+
+        repository.delete_outbox_events.assert_not_called()
+        db.rollback.assert_called_once()
+        db.close.assert_called_once()
+
+    def test_notify_before_start_is_a_noop(self):
+        """Test writers can notify a relay that is not running."""
+        LeadEventRelay().notify()
@@ -0,0 +1,659 @@
+"""Unit tests for services.crm_lead_service module.
+
+Following CLAUDE.md principles:
+- FUNCTIONALITY FIRST: Test success scenarios (2XX) before error scenarios (4XX)
+- Focus on what the system DOES, not just what it REJECTS
+- Test real usage scenarios with proper multi-tenant lead management
+"""
+
+import csv
+import gzip
+import io
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from api.core.config import settings
+from api.core.pagination import decode_cursor, encode_cursor
+from api.models.crm_audit_log import AuditAction
+from api.models.crm_lead import Lead, PipelineStage
+from api.models.crm_lead_tombstone import LeadTombstone
+from api.schemas.crm_lead import (
+    LEAD_EXPORT_FIELDS,
+    AdvancedFiltersSchema,
+    LeadBulkRequest,
+    LeadCreate,
+    LeadStageUpdate,
+    LeadUpdate,
+)
+from api.services.crm_lead_service import SYNC_CURSOR_ID, CRMLeadService
+
+
+def _compiled(clause) -> str:
+    """Compile a SQLAlchemy clause with the PostgreSQL dialect."""
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+class TestCRMLeadServiceTagFilters:
+    """Test index-friendly tag filtering - FUNCTIONALITY FIRST."""
+
+    @pytest.fixture
+    def service(self):
+        """Create CRM lead service with mock session."""
+        return CRMLeadService(Mock())
+
+    @pytest.fixture
+    def query(self):
+        """Create chainable mock query."""
+        query = MagicMock()
+        query.filter.return_value = query
+        return query
+
+    def test_tag_filter_match_all_uses_containment_success(self, service, query):
+        """Test default match mode uses a single @> predicate."""
+        # ✅ SUCCESS SCENARIO: All tags required via array containment
+        filters = AdvancedFiltersSchema(tags=["VIP", "Urgente"])
+
+        service._apply_tag_filters(query, filters)
+
+        query.filter.assert_called_once()
+        assert "@>" in _compiled(query.filter.call_args[0][0])
+
+    def test_tag_filter_match_any_uses_overlap_success(self, service, query):
+        """Test match-any mode uses a single && predicate."""
+        # ✅ SUCCESS SCENARIO: Any tag matches via array overlap
+        filters = AdvancedFiltersSchema(tags=["VIP", "Urgente"], tag_match="any")
+
+        service._apply_tag_filters(query, filters)
+
+        query.filter.assert_called_once()
+        assert "&&" in _compiled(query.filter.call_args[0][0])
+
+    def test_tag_filter_without_tags_success(self, service, query):
+        """Test query is untouched when no tags are given."""
+        # ✅ SUCCESS SCENARIO: No tags means no predicate
+        result = service._apply_tag_filters(query, AdvancedFiltersSchema())
+
+        assert result is query
+        query.filter.assert_not_called()
+
+    def test_tag_match_rejects_unknown_mode(self):
+        """Test unknown tag match modes are rejected."""
+        with pytest.raises(ValueError):
+            AdvancedFiltersSchema(tags=["VIP"], tag_match="some")
+
+
+class TestCRMLeadServiceBoard:
+    """Test single-query Kanban board assembly - FUNCTIONALITY FIRST."""
+
+    @staticmethod
+    def _lead(stage: str, value: str = "100.00") -> Lead:
+        """Build a detached lead in the given stage."""
+        now = datetime.now(timezone.utc)
+        return Lead(
+            id=uuid.uuid4(),
+            organization_id=uuid.uuid4(),
+            name="Lead",
+            stage=stage,
+            source="web",
+            estimated_value=Decimal(value),
+            tags=[],
+            is_favorite=False,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def test_board_returns_every_stage_success(self):
+        """Test board fills empty stages and exposes per-column cursors."""
+        # ✅ SUCCESS SCENARIO: One query result becomes five Kanban columns
+        first, second = self._lead("lead"), self._lead("lead")
+        closed = self._lead("fechado", "900.00")
+        service = CRMLeadService(Mock())
+        service.repository.get_board = Mock(
+            return_value=[
+                (first, 3, Decimal("300.00")),
+                (second, 3, Decimal("300.00")),
+                (closed, 1, Decimal("900.00")),
+            ]
+        )
+        organization = Mock(id=uuid.uuid4())
+
+        board = service.get_pipeline_board(organization, per_stage=2)
+
+        columns = {column.stage.value: column for column in board.columns}
+        assert list(columns) == [stage.value for stage in PipelineStage]
+        assert board.total_leads == 4
+        assert columns["lead"].count == 3
+        assert [lead.id for lead in columns["lead"].leads] == [first.id, second.id]
+        assert decode_cursor(columns["lead"].next_cursor) == (second.updated_at, second.id)
+        assert columns["fechado"].total_value == Decimal("900.00")
+        assert columns["fechado"].next_cursor is None
+        assert columns["contato"].count == 0 and columns["contato"].leads == []
+
+    def test_column_page_detects_more_rows_success(self):
+        """Test column paging fetches one extra row to build the next cursor."""
+        # ✅ SUCCESS SCENARIO: limit + 1 rows means another page exists
+        leads = [self._lead("contato") for _ in range(3)]
+        service = CRMLeadService(Mock())
+        service.repository.get_stage_page = Mock(return_value=leads)
+        organization = Mock(id=uuid.uuid4())
+        cursor = encode_cursor(leads[0].updated_at, leads[0].id)
+
+        page = service.get_board_column_page(organization, PipelineStage.CONTATO, cursor, limit=2)
+
+        after = service.repository.get_stage_page.call_args[0][3]
+        assert after == (leads[0].updated_at, leads[0].id)
+        assert len(page.leads) == 2
+        assert decode_cursor(page.next_cursor) == (leads[1].updated_at, leads[1].id)
+
+    def test_column_page_rejects_invalid_cursor(self):
+        """Test malformed cursors are rejected with 400."""
+        service = CRMLeadService(Mock())
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_board_column_page(Mock(id=uuid.uuid4()), PipelineStage.LEAD, "not-a-cursor")
+
+        assert exc_info.value.status_code == 400
+
+
+class TestCRMLeadServiceChanges:
+    """Test delta-sync change feed - FUNCTIONALITY FIRST."""
+
+    def test_changes_merge_updates_and_tombstones_success(self):
+        """Test updates and deletions are merged in (timestamp, id) order."""
+        # ✅ SUCCESS SCENARIO: Both streams are interleaved and cut at limit
+        base = datetime.now(timezone.utc)
+        updated = TestCRMLeadServiceBoard._lead("lead")
+        updated.updated_at = base
+        later = TestCRMLeadServiceBoard._lead("lead")
+        later.updated_at = base + timedelta(seconds=2)
+        tombstone = LeadTombstone(
+            lead_id=uuid.uuid4(),
+            organization_id=uuid.uuid4(),
+            deleted_at=base + timedelta(seconds=1),
+        )
+        service = CRMLeadService(Mock())
+        service.repository.get_changed_since = Mock(return_value=[updated, later])
+        service.repository.get_tombstones_since = Mock(return_value=[tombstone])
+
+        changes = service.get_lead_changes(Mock(id=uuid.uuid4()), since=None, limit=2)
+
+        assert [lead.id for lead in changes.updated] == [updated.id]
+        assert changes.deleted == [tombstone.lead_id]
+        assert changes.has_more is True
+        assert decode_cursor(changes.next_cursor) == (tombstone.deleted_at, tombstone.lead_id)
+
+    def test_caught_up_cursor_moves_to_sync_time_success(self):
+        """Test an idle organization's cursor advances, so it never ages past retention."""
+        # ✅ SUCCESS SCENARIO: Nothing changed in 20 days, cursor moves to the settle time
+        since = encode_cursor(datetime.now(timezone.utc) - timedelta(days=20), uuid.uuid4())
+        service = CRMLeadService(Mock())
+        service.repository.get_changed_since = Mock(return_value=[])
+        service.repository.get_tombstones_since = Mock(return_value=[])
+
+        changes = service.get_lead_changes(Mock(id=uuid.uuid4()), since=since)
+
+        assert changes.updated == [] and changes.deleted == []
+        assert changes.has_more is False
+        cursor_time, cursor_id = decode_cursor(changes.next_cursor)
+        until = service.repository.get_changed_since.call_args[0][3]
+        assert (cursor_time, cursor_id) == (until, SYNC_CURSOR_ID)
+        settle = timedelta(seconds=settings.LEAD_CHANGES_SETTLE_SECONDS)
+        assert until <= datetime.now(timezone.utc) - settle
+        assert service.repository.get_tombstones_since.call_args[0][3] == until
+
+    def test_changes_cursor_past_sync_time_is_kept(self):
+        """Test a cursor already past the settle time is handed back unchanged."""
+        since = encode_cursor(datetime.now(timezone.utc), SYNC_CURSOR_ID)
+        service = CRMLeadService(Mock())
+        service.repository.get_changed_since = Mock(return_value=[])
+        service.repository.get_tombstones_since = Mock(return_value=[])
+
+        changes = service.get_lead_changes(Mock(id=uuid.uuid4()), since=since)
+
+        assert changes.next_cursor == since
+
+    def test_changes_reject_cursor_older_than_retention(self):
+        """Test cursors older than tombstone retention require full resync."""
+        old = datetime.now(timezone.utc) - timedelta(days=365)
+        service = CRMLeadService(Mock())
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_lead_changes(Mock(id=uuid.uuid4()), since=encode_cursor(old, uuid.uuid4()))
+
+        assert exc_info.value.status_code == 410
+
+
+class TestCRMLeadServiceSparseFields:
+    """Test sparse fieldsets and column projection - FUNCTIONALITY FIRST."""
+
+    @pytest.fixture
+    def service(self):
+        """Create CRM lead service with mock session."""
+        return CRMLeadService(Mock())
+
+    def test_card_preset_skips_notes_success(self, service):
+        """Test the card preset never selects notes or metadata."""
+        # ✅ SUCCESS SCENARIO: Card projection is narrow
+        fields = service._parse_fields("card")
+
+        assert fields[0] == "id"
+        assert "notes" not in fields and "lead_metadata" not in fields
+        sql = _compiled(service.repository.get_rows_query(uuid.uuid4(), fields).statement)
+        assert "lead_notes" not in sql and "lead_custom_fields" not in sql
+
+    def test_sparse_list_returns_only_requested_fields_success(self, service):
+        """Test list endpoint selects only the requested fields as rows."""
+        # ✅ SUCCESS SCENARIO: fields=name,is_closed returns exactly those keys
+        lead_id = uuid.uuid4()
+        row = SimpleNamespace(id=lead_id, name="Lead", is_closed=True)
+        service.repository.get_rows_by_organization = Mock(return_value=[row])
+        service.repository.count_by_organization = Mock(return_value=1)
+
+        result = service.get_organization_leads(Mock(id=uuid.uuid4()), fields="name,is_closed")
+
+        fields = service.repository.get_rows_by_organization.call_args.kwargs["fields"]
+        assert fields == ["id", "name", "is_closed"]
+        assert result.leads[0].model_dump(exclude_unset=True) == {
+            "id": lead_id,
+            "name": "Lead",
+            "is_closed": True,
+        }
+
+    def test_unknown_fields_are_rejected(self, service):
+        """Test unknown fields return 400 instead of leaking attributes."""
+        with pytest.raises(HTTPException) as exc_info:
+            service._parse_fields("name,lead_metadata")
+
+        assert exc_info.value.status_code == 400
+
+
+class TestCRMLeadServiceRowSerialization:
+    """Test row-to-schema list serialization - FUNCTIONALITY FIRST."""
+
+    def test_full_list_validates_rows_in_one_pass_success(self):
+        """Test full list reads rows with SQL-computed fields and no ORM objects."""
+        # ✅ SUCCESS SCENARIO: Rows become LeadResponse without model_validate per lead
+        now = datetime.now(timezone.utc)
+        row = SimpleNamespace(
+            id=uuid.uuid4(),
+            organization_id=uuid.uuid4(),
+            name="Lead",
+            email="lead@example.com",
+            phone=None,
+            source="web",
+            estimated_value=Decimal("10.50"),
+            tags=["VIP"],
+            notes=None,
+            stage="fechado",
+            assigned_user_id=None,
+            last_contact_at=None,
+            last_contact_channel=None,
+            created_at=now,
+            updated_at=now,
+            is_favorite=False,
+            is_closed=True,
+            days_in_current_stage=0,
+        )
+        service = CRMLeadService(Mock())
+        service.repository.get_rows_by_organization = Mock(return_value=[row])
+        service.repository.count_by_organization_and_stage = Mock(return_value=1)
+
+        result = service.get_organization_leads(Mock(id=uuid.uuid4()), stage=PipelineStage.FECHADO)
+
+        call = service.repository.get_rows_by_organization.call_args.kwargs
+        assert call["stage"] == PipelineStage.FECHADO
+        assert "is_closed" in call["fields"] and "organization_id" in call["fields"]
+        assert result.leads[0].stage == PipelineStage.FECHADO
+        assert result.leads[0].is_closed is True
+        assert result.has_more is False
+
+    def test_computed_fields_are_sql_expressions_success(self):
+        """Test derived fields are computed by the database, not in Python."""
+        # ✅ SUCCESS SCENARIO: is_closed / days_in_current_stage compile to SQL
+        repository = CRMLeadService(Mock()).repository
+
+        assert "leads.stage =" in _compiled(repository._row_column("is_closed"))
+        assert "date_part" in _compiled(repository._row_column("days_in_current_stage"))
+
+
+class _ExportRow(tuple):
+    """Minimal stand-in for a SQLAlchemy Row (tuple + _mapping)."""
+
+    def __new__(cls, **values):
+        row = super().__new__(cls, values.values())
+        row._mapping = values
+        return row
+
+
+class TestCRMLeadServiceExport:
+    """Test streaming lead export - FUNCTIONALITY FIRST."""
+
+    @staticmethod
+    def _row(name: str) -> _ExportRow:
+        """Build an export row with every export field."""
+        now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        values = dict.fromkeys(LEAD_EXPORT_FIELDS)
+        values.update(
+            id=uuid.uuid4(),
+            name=name,
+            source="web",
+            stage=PipelineStage.CONTATO,
+            estimated_value=Decimal("10.50"),
+            tags=["VIP", "Urgente"],
+            created_at=now,
+            updated_at=now,
+            is_favorite=False,
+            is_closed=False,
+        )
+        return _ExportRow(**values)
+
+    @pytest.fixture
+    def export_session(self, monkeypatch):
+        """Patch the export session factory with a mock streaming three rows."""
+        query = MagicMock()
+        query.filter.return_value = query
+        query.order_by.return_value = query
+        query.yield_per.return_value = [self._row(name) for name in ("Ana", "Bia", "Caio")]
+        session = Mock()
+        session.query.return_value = query
+        monkeypatch.setattr("api.services.crm_lead_service.SessionLocal", lambda: session)
+        monkeypatch.setattr(settings, "LEAD_EXPORT_BATCH_SIZE", 2)
+        return session
+
+    def test_ndjson_export_streams_in_batches_success(self, export_session):
+        """Test NDJSON export yields one chunk per cursor batch."""
+        # ✅ SUCCESS SCENARIO: 3 rows with batch size 2 -> 2 chunks
+        service = CRMLeadService(Mock())
+
+        chunks = list(
+            service.export_leads(Mock(id=uuid.uuid4()), AdvancedFiltersSchema(), "ndjson")
+        )
+
+        assert len(chunks) == 2
+        lines = [json.loads(line) for line in b"".join(chunks).splitlines()]
+        assert [line["name"] for line in lines] == ["Ana", "Bia", "Caio"]
+        assert lines[0]["stage"] == "contato" and lines[0]["estimated_value"] == "10.50"
+        export_session.query.return_value.yield_per.assert_called_once_with(2)
+        export_session.close.assert_called_once()
+
+    def test_csv_export_with_gzip_success(self, export_session):
+        """Test gzip CSV export decompresses to header plus rows."""
+        # ✅ SUCCESS SCENARIO: Compressed CSV round-trips
+        service = CRMLeadService(Mock())
+
+        body = b"".join(
+            service.export_leads(
+                Mock(id=uuid.uuid4()), AdvancedFiltersSchema(), "csv", compress=True
+            )
+        )
+
+        rows = list(csv.reader(io.StringIO(gzip.decompress(body).decode())))
+        assert rows[0] == list(LEAD_EXPORT_FIELDS)
+        assert len(rows) == 4
+        record = dict(zip(rows[0], rows[1]))
+        assert record["name"] == "Ana" and record["tags"] == "VIP;Urgente"
+        assert record["stage"] == "contato"
+
+    def test_csv_export_neutralizes_formulas(self, export_session):
+        """Test user text starting like a formula is exported as plain text."""
+        values = dict(self._row('=HYPERLINK("http://evil")')._mapping)
+        values.update(source="@SUM(A1)", tags=["-1+1", "ok"], notes="\t=1")
+        row = _ExportRow(**values)
+        export_session.query.return_value.yield_per.return_value = [row]
+        service = CRMLeadService(Mock())
+
+        body = b"".join(service.export_leads(Mock(id=uuid.uuid4()), AdvancedFiltersSchema(), "csv"))
+
+        rows = list(csv.reader(io.StringIO(body.decode())))
+        record = dict(zip(rows[0], rows[1]))
+        assert record["name"] == '\'=HYPERLINK("http://evil")'
+        assert record["source"] == "'@SUM(A1)"
+        assert record["tags"] == "'-1+1;ok"
+        assert record["notes"] == "'\t=1"
+        assert record["estimated_value"] == "10.50"
+
+
+class TestCRMLeadServiceBulk:
+    """Test set-based bulk lead operations - FUNCTIONALITY FIRST."""
+
+    @pytest.fixture
+    def service(self):
+        """Create CRM lead service with mock session."""
+        service = CRMLeadService(Mock())
+        service.repository.write_audit_batch = Mock()
+        service.repository.add_outbox_event = Mock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_bulk_stage_move_is_one_update_success(self, service):
+        """Test a stage move runs one UPDATE, one audit batch and one outbox event."""
+        # ✅ SUCCESS SCENARIO: 2 of 3 IDs belong to the organization
+        moved = [uuid.uuid4(), uuid.uuid4()]
+        foreign = uuid.uuid4()
+        service.repository.bulk_update = Mock(
+            return_value=[
+                SimpleNamespace(id=lead_id, _mapping={"id": lead_id, "stage": "lead"})
+                for lead_id in moved
+            ]
+        )
+        organization = Mock(id=uuid.uuid4())
+        request = LeadBulkRequest(lead_ids=[*moved, foreign], action="stage", stage="contato")
+
+        result = await service.bulk_update_leads(organization, request, uuid.uuid4())
+
+        org_id, lead_ids, values, previous = service.repository.bulk_update.call_args[0]
+        assert values == {"stage": "contato"} and previous == ["stage"]
+        assert lead_ids == [*moved, foreign]
+        _, _, action, audit = service.repository.write_audit_batch.call_args[0]
+        assert action == AuditAction.UPDATE
+        assert audit[0] == (moved[0], {"stage": "lead"}, {"stage": "contato"})
+        service.db.commit.assert_called_once()
+        service.repository.add_outbox_event.assert_called_once()
+        _, event_type, event = service.repository.add_outbox_event.call_args[0]
+        assert event_type == "leads_bulk_updated" and len(event["lead_ids"]) == 2
+        assert result.affected == 2 and result.not_found == [foreign]
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_tombstones_and_audits_success(self, service):
+        """Test bulk delete goes through the tombstoning delete and audits old values."""
+        # ✅ SUCCESS SCENARIO: Deleted rows are audited with name and stage
+        lead_id = uuid.uuid4()
+        service.repository.bulk_delete_with_tombstones = Mock(
+            return_value=[SimpleNamespace(id=lead_id, name="Lead", stage="fechado")]
+        )
+
+        result = await service.bulk_update_leads(
+            Mock(id=uuid.uuid4()), LeadBulkRequest(lead_ids=[lead_id], action="delete")
+        )
+
+        _, _, action, audit = service.repository.write_audit_batch.call_args[0]
+        assert action == AuditAction.DELETE
+        assert audit == [(lead_id, {"name": "Lead", "stage": "fechado"}, None)]
+        assert service.repository.add_outbox_event.call_args[0][1] == "leads_bulk_deleted"
+        assert result.lead_ids == [lead_id]
+
+    def test_bulk_tags_builds_single_array_expression_success(self, service):
+        """Test tag changes compile to one in-place array expression."""
+        # ✅ SUCCESS SCENARIO: add + remove in the same statement
+        request = LeadBulkRequest(
+            lead_ids=[uuid.uuid4()], action="tags", add_tags=["VIP"], remove_tags=["Frio"]
+        )
+
+        values, previous, changes = service._bulk_update_values(request)
+
+        sql = _compiled(values["tags"])
+        assert "add_tags" in sql and "remove_tags" in sql and "ORDINALITY" in sql
+        assert previous == ["tags"]
+        assert changes == {"add_tags": ["VIP"], "remove_tags": ["Frio"]}
+
+    @pytest.mark.asyncio
+    async def test_bulk_stage_requires_stage(self, service):
+        """Test stage action without a stage is rejected with 400."""
+        with pytest.raises(HTTPException) as exc_info:
+            await service.bulk_update_leads(
+                Mock(id=uuid.uuid4()), LeadBulkRequest(lead_ids=[uuid.uuid4()], action="stage")
+            )
+
+        assert exc_info.value.status_code == 400
+
+    def test_bulk_request_rejects_unknown_action(self):
+        """Test unknown bulk actions fail validation."""
+        with pytest.raises(ValueError):
+            LeadBulkRequest(lead_ids=[uuid.uuid4()], action="archive")
+
+
+class TestCRMLeadServiceContactKeys:
+    """Test normalized contact keys on single-lead writes - FUNCTIONALITY FIRST."""
+
+    @pytest.fixture
+    def service(self):
+        """Create CRM lead service with mock session."""
+        return CRMLeadService(Mock())
+
+    def test_update_syncs_keys_and_invalidates_cache_success(self, service, monkeypatch):
+        """Test changing a phone recomputes its key and drops the old cache entry."""
+        # ✅ SUCCESS SCENARIO: old key leaves the resolver cache
+        cache = Mock()
+        monkeypatch.setattr("api.services.crm_lead_service.lead_contact_cache", cache)
+        organization = Mock(id=uuid.uuid4())
+        lead = Lead(organization_id=organization.id, name="Ana", phone="11 99999-0000")
+        service.get_lead_by_id = Mock(return_value=lead)
+
+        service.update_lead(organization, uuid.uuid4(), LeadUpdate(phone="+1 415 555 0100"))
+
+        assert lead.phone_key == "+14155550100"
+        cache.invalidate.assert_called_once_with(organization.id, None, "+5511999990000")
+
+    @pytest.mark.asyncio
+    async def test_create_duplicate_contact_returns_conflict(self, service):
+        """Test a unique contact key violation surfaces as 409."""
+        service.db.commit.side_effect = IntegrityError("INSERT", {}, Exception("duplicate"))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.create_lead(
+                Mock(id=uuid.uuid4()), LeadCreate(name="Ana", email="ana@example.com")
+            )
+
+        assert exc_info.value.status_code == 409
+        service.db.rollback.assert_called_once()
+
+
+class TestCRMLeadServiceNotes:
+    """Test append-only lead notes - FUNCTIONALITY FIRST."""
+
+    @pytest.fixture
+    def service(self):
+        """Create CRM lead service with mock session."""
+        return CRMLeadService(Mock())
+
+    def test_current_notes_start_at_latest_note_entry_success(self):
+        """Test the derived notes field aggregates entries since the latest NOTE."""
+        # ✅ SUCCESS SCENARIO: one correlated subquery over lead_notes
+        sql = _compiled(Lead.notes.expression)
+
+        assert "string_agg(lead_notes.body" in sql
+        assert "ORDER BY lead_notes.created_at, lead_notes.id" in sql
+        assert "max(latest_note.created_at)" in sql
+
+    def test_notes_history_is_keyset_paged_success(self, service):
+        """Test note history pages newest first with a (created_at, id) cursor."""
+        # ✅ SUCCESS SCENARIO: limit + 1 rows read, cursor points at the last returned
+        now = datetime.now(timezone.utc)
+        notes = [
+            SimpleNamespace(
+                id=uuid.uuid4(),
+                kind="note",
+                body=f"note {i}",
+                created_by=None,
+                created_at=now - timedelta(minutes=i),
+            )
+            for i in range(3)
+        ]
+        service.get_lead_by_id = Mock()
+        service.repository.get_notes_page = Mock(return_value=notes)
+        organization, lead_id = Mock(id=uuid.uuid4()), uuid.uuid4()
+        before = (now, uuid.uuid4())
+
+        result = service.get_lead_notes(
+            organization, lead_id, cursor=encode_cursor(*before), limit=2
+        )
+
+        service.repository.get_notes_page.assert_called_once_with(
+            organization.id, lead_id, before, 3
+        )
+        assert [note.body for note in result.notes] == ["note 0", "note 1"]
+        assert result.has_more is True
+        assert decode_cursor(result.next_cursor) == (notes[1].created_at, notes[1].id)
+
+    def test_update_appends_note_only_when_changed_success(self, service):
+        """Test updating notes appends an entry instead of rewriting the lead row."""
+        lead = Mock(notes="same", email_key=None, phone_key=None)
+        service.get_lead_by_id = Mock(return_value=lead)
+        organization = Mock(id=uuid.uuid4())
+
+        service.update_lead(organization, uuid.uuid4(), LeadUpdate(notes="same"))
+        lead.add_note.assert_not_called()
+
+        service.update_lead(organization, uuid.uuid4(), LeadUpdate(notes="new"))
+        lead.add_note.assert_called_once_with("new")
+
+
+class TestCRMLeadServiceOutbox:
+    """Test lead change events written through the outbox - FUNCTIONALITY FIRST."""
+
+    @pytest.fixture
+    def timeline(self):
+        """Ordered record of outbox writes and commits."""
+        return []
+
+    @pytest.fixture
+    def service(self, timeline):
+        """Create CRM lead service with mock session and outbox."""
+        service = CRMLeadService(Mock())
+        service.repository.add_outbox_event = Mock(
+            side_effect=lambda org_id, event_type, payload: timeline.append((event_type, payload))
+        )
+        service.db.commit.side_effect = lambda: timeline.append(("commit", None))
+        return service
+
+    @pytest.mark.asyncio
+    async def test_stage_change_event_is_written_before_commit_success(self, service, timeline):
+        """Test the stage event joins the lead's transaction and names the old stage."""
+        # ✅ SUCCESS SCENARIO: event staged, then one commit; no inline broadcast
+        organization = Mock(id=uuid.uuid4())
+        lead = Lead(organization_id=organization.id, name="Ana", stage=PipelineStage.LEAD)
+        service.repository.get_by_id_and_org = Mock(return_value=lead)
+        # A real flush reloads the server-side updated_at
+        service.db.flush.side_effect = lambda: setattr(
+            lead, "updated_at", datetime.now(timezone.utc)
+        )
+
+        await service.update_lead_stage(
+            organization, uuid.uuid4(), LeadStageUpdate(stage="contato"), uuid.uuid4()
+        )
+
+        assert [event_type for event_type, _ in timeline] == ["lead_stage_changed", "commit"]
+        event = timeline[0][1]
+        assert event["lead"]["stage"] == "contato"
+        assert event["lead"]["previous_stage"] == "lead"
+
+    def test_delete_event_is_committed_with_tombstone_success(self, service, timeline):
+        """Test the delete event is staged before the tombstoning delete commits."""
+        organization = Mock(id=uuid.uuid4())
+        lead = Lead(id=uuid.uuid4(), organization_id=organization.id, name="Ana", stage="lead")
+        service.get_lead_by_id = Mock(return_value=lead)
+        service.repository.delete_with_tombstone = Mock(side_effect=lambda _: service.db.commit())
+
+        assert service.delete_lead(organization, lead.id) is True
+
+        assert [event_type for event_type, _ in timeline] == ["lead_deleted", "commit"]
+        assert timeline[0][1]["lead"]["id"] == str(lead.id)